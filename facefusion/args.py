@@ -57,6 +57,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_detector_size', args.get('face_detector_size'))
 	apply_state_item('face_detector_angles', args.get('face_detector_angles'))
 	apply_state_item('face_detector_score', args.get('face_detector_score'))
+	apply_state_item('face_tracker_interval', args.get('face_tracker_interval'))
 	# face landmarker
 	apply_state_item('face_landmarker_model', args.get('face_landmarker_model'))
 	apply_state_item('face_landmarker_score', args.get('face_landmarker_score'))
@@ -84,6 +85,9 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('trim_frame_start', args.get('trim_frame_start'))
 	apply_state_item('trim_frame_end', args.get('trim_frame_end'))
 	apply_state_item('temp_frame_format', args.get('temp_frame_format'))
+	apply_state_item('temp_frame_mode', args.get('temp_frame_mode'))
+	apply_state_item('video_segment_count', args.get('video_segment_count'))
+	apply_state_item('frame_reuse_threshold', args.get('frame_reuse_threshold'))
 	apply_state_item('keep_temp', args.get('keep_temp'))
 	# output creation
 	apply_state_item('output_image_quality', args.get('output_image_quality'))
@@ -111,6 +115,23 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('execution_device_ids', args.get('execution_device_ids'))
 	apply_state_item('execution_providers', args.get('execution_providers'))
 	apply_state_item('execution_thread_count', args.get('execution_thread_count'))
+	apply_state_item('execution_replica_count', args.get('execution_replica_count'))
+	apply_state_item('execution_batch_size', args.get('execution_batch_size'))
+	apply_state_item('execution_batch_timeout', args.get('execution_batch_timeout'))
+	apply_state_item('execution_worker_mode', args.get('execution_worker_mode'))
+	# session
+	apply_state_item('session_intra_op_thread_count', args.get('session_intra_op_thread_count'))
+	apply_state_item('session_inter_op_thread_count', args.get('session_inter_op_thread_count'))
+	apply_state_item('session_execution_mode', args.get('session_execution_mode'))
+	apply_state_item('session_graph_optimization', args.get('session_graph_optimization'))
+	apply_state_item('session_memory_options', args.get('session_memory_options'))
+	apply_state_item('session_model_cache', args.get('session_model_cache'))
+	apply_state_item('session_model_precision', args.get('session_model_precision'))
+	apply_state_item('session_concurrency_mode', args.get('session_concurrency_mode'))
+	apply_state_item('session_concurrency_limit', args.get('session_concurrency_limit'))
+	# coordinator
+	apply_state_item('coordinator_address', args.get('coordinator_address'))
+	apply_state_item('coordinator_secret', args.get('coordinator_secret'))
 	# download
 	apply_state_item('download_providers', args.get('download_providers'))
 	apply_state_item('download_scope', args.get('download_scope'))
@@ -118,12 +139,22 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('benchmark_mode', args.get('benchmark_mode'))
 	apply_state_item('benchmark_resolutions', args.get('benchmark_resolutions'))
 	apply_state_item('benchmark_cycle_count', args.get('benchmark_cycle_count'))
+	apply_state_item('benchmark_worker_modes', args.get('benchmark_worker_modes'))
+	# quantize
+	apply_state_item('quantize_modules', args.get('quantize_modules'))
+	apply_state_item('quantize_mode', args.get('quantize_mode'))
+	apply_state_item('quantize_frame_total', args.get('quantize_frame_total'))
 	# memory
-	apply_state_item('video_memory_strategy', args.get('video_memory_strategy'))
+	apply_state_item('inference_memory_limit', args.get('inference_memory_limit'))
 	apply_state_item('system_memory_limit', args.get('system_memory_limit'))
+	apply_state_item('face_store_entry_limit', args.get('face_store_entry_limit'))
+	apply_state_item('face_store_memory_limit', args.get('face_store_memory_limit'))
+	apply_state_item('image_store_memory_limit', args.get('image_store_memory_limit'))
 	# misc
 	apply_state_item('log_level', args.get('log_level'))
 	apply_state_item('halt_on_error', args.get('halt_on_error'))
+	apply_state_item('inference_profile', args.get('inference_profile'))
+	apply_state_item('inference_profile_path', args.get('inference_profile_path'))
 	# jobs
 	apply_state_item('job_id', args.get('job_id'))
 	apply_state_item('job_status', args.get('job_status'))
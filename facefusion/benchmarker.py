@@ -34,13 +34,14 @@ def pre_check() -> bool:
 def run() -> Generator[List[BenchmarkCycleSet], None, None]:
 	benchmark_resolutions = state_manager.get_item('benchmark_resolutions')
 	benchmark_cycle_count = state_manager.get_item('benchmark_cycle_count')
+	benchmark_worker_modes = state_manager.get_item('benchmark_worker_modes')
 
 	state_manager.init_item('source_paths', [ '.assets/examples/source.jpg', '.assets/examples/source.mp3' ])
 	state_manager.init_item('face_landmarker_score', 0)
 	state_manager.init_item('temp_frame_format', 'bmp')
 	state_manager.init_item('output_audio_volume', 0)
 	state_manager.init_item('output_video_preset', 'ultrafast')
-	state_manager.init_item('video_memory_strategy', 'tolerant')
+	state_manager.init_item('inference_memory_limit', facefusion.choices.inference_memory_limit_range[-1])
 
 	benchmarks = []
 	target_paths = [ facefusion.choices.benchmark_set.get(benchmark_resolution) for benchmark_resolution in benchmark_resolutions if benchmark_resolution in facefusion.choices.benchmark_set ]
@@ -48,8 +49,11 @@ def run() -> Generator[List[BenchmarkCycleSet], None, None]:
 	for target_path in target_paths:
 		state_manager.init_item('target_path', target_path)
 		state_manager.init_item('output_path', suggest_output_path(state_manager.get_item('target_path')))
-		benchmarks.append(cycle(benchmark_cycle_count))
-		yield benchmarks
+
+		for benchmark_worker_mode in benchmark_worker_modes:
+			state_manager.init_item('execution_worker_mode', benchmark_worker_mode)
+			benchmarks.append(cycle(benchmark_cycle_count))
+			yield benchmarks
 
 
 def cycle(cycle_count : int) -> BenchmarkCycleSet:
@@ -79,6 +83,7 @@ def cycle(cycle_count : int) -> BenchmarkCycleSet:
 	return\
 	{
 		'target_path': state_manager.get_item('target_path'),
+		'worker_mode': state_manager.get_item('execution_worker_mode'),
 		'cycle_count': cycle_count,
 		'average_run': average_run,
 		'fastest_run': fastest_run,
@@ -97,6 +102,7 @@ def render() -> None:
 	headers =\
 	[
 		'target_path',
+		'worker_mode',
 		'cycle_count',
 		'average_run',
 		'fastest_run',
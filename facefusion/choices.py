@@ -1,8 +1,10 @@
 import logging
 from typing import List, Sequence
 
+from onnxruntime import ExecutionMode, GraphOptimizationLevel
+
 from facefusion.common_helper import create_float_range, create_int_range
-from facefusion.types import Angle, AudioEncoder, AudioFormat, AudioTypeSet, BenchmarkMode, BenchmarkResolution, BenchmarkSet, DownloadProvider, DownloadProviderSet, DownloadScope, EncoderSet, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskArea, FaceMaskAreaSet, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, ImageFormat, ImageTypeSet, JobStatus, LogLevel, LogLevelSet, Race, Score, TempFrameFormat, UiWorkflow, VideoEncoder, VideoFormat, VideoMemoryStrategy, VideoPreset, VideoTypeSet, VoiceExtractorModel
+from facefusion.types import Angle, AudioEncoder, AudioFormat, AudioTypeSet, BenchmarkMode, BenchmarkResolution, BenchmarkSet, DownloadProvider, DownloadProviderSet, DownloadScope, EncoderSet, ExecutionProvider, ExecutionProviderSet, ExecutionWorkerMode, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskArea, FaceMaskAreaSet, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, ImageFormat, ImageTypeSet, JobStatus, LogLevel, LogLevelSet, QuantizeMode, Race, Score, SessionConcurrencyMode, SessionExecutionMode, SessionExecutionModeSet, SessionGraphOptimization, SessionGraphOptimizationSet, SessionMemoryOption, SessionModelPrecision, TempFrameFormat, TempFrameMode, UiWorkflow, VideoEncoder, VideoFormat, VideoPreset, VideoTypeSet, VoiceExtractorModel
 
 face_detector_set : FaceDetectorSet =\
 {
@@ -76,6 +78,7 @@ audio_formats : List[AudioFormat] = list(audio_type_set.keys())
 image_formats : List[ImageFormat] = list(image_type_set.keys())
 video_formats : List[VideoFormat] = list(video_type_set.keys())
 temp_frame_formats : List[TempFrameFormat] = [ 'bmp', 'jpeg', 'png', 'tiff' ]
+temp_frame_modes : List[TempFrameMode] = [ 'disk', 'pipe' ]
 
 output_encoder_set : EncoderSet =\
 {
@@ -111,6 +114,28 @@ execution_provider_set : ExecutionProviderSet =\
 	'cpu': 'CPUExecutionProvider'
 }
 execution_providers : List[ExecutionProvider] = list(execution_provider_set.keys())
+execution_worker_modes : List[ExecutionWorkerMode] = [ 'thread', 'process' ]
+
+session_execution_mode_set : SessionExecutionModeSet =\
+{
+	'sequential': ExecutionMode.ORT_SEQUENTIAL,
+	'parallel': ExecutionMode.ORT_PARALLEL
+}
+session_execution_modes : List[SessionExecutionMode] = list(session_execution_mode_set.keys())
+session_graph_optimization_set : SessionGraphOptimizationSet =\
+{
+	'disabled': GraphOptimizationLevel.ORT_DISABLE_ALL,
+	'basic': GraphOptimizationLevel.ORT_ENABLE_BASIC,
+	'extended': GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+	'all': GraphOptimizationLevel.ORT_ENABLE_ALL
+}
+session_graph_optimizations : List[SessionGraphOptimization] = list(session_graph_optimization_set.keys())
+session_memory_options : List[SessionMemoryOption] = [ 'memory_pattern', 'cpu_arena', 'io_binding' ]
+session_model_precisions : List[SessionModelPrecision] = [ 'fp32', 'int8' ]
+session_concurrency_modes : List[SessionConcurrencyMode] = [ 'static', 'adaptive' ]
+
+quantize_modules : List[str] = [ 'face_classifier', 'face_detector', 'face_landmarker', 'face_masker', 'face_recognizer', 'voice_extractor' ]
+quantize_modes : List[QuantizeMode] = [ 'dynamic', 'static' ]
 download_provider_set : DownloadProviderSet =\
 {
 	'github':
@@ -134,8 +159,6 @@ download_provider_set : DownloadProviderSet =\
 download_providers : List[DownloadProvider] = list(download_provider_set.keys())
 download_scopes : List[DownloadScope] = [ 'lite', 'full' ]
 
-video_memory_strategies : List[VideoMemoryStrategy] = [ 'strict', 'moderate', 'tolerant' ]
-
 log_level_set : LogLevelSet =\
 {
 	'error': logging.ERROR,
@@ -149,10 +172,21 @@ ui_workflows : List[UiWorkflow] = [ 'instant_runner', 'job_runner', 'job_manager
 job_statuses : List[JobStatus] = [ 'drafted', 'queued', 'completed', 'failed' ]
 
 benchmark_cycle_count_range : Sequence[int] = create_int_range(1, 10, 1)
+quantize_frame_total_range : Sequence[int] = create_int_range(1, 64, 1)
 execution_thread_count_range : Sequence[int] = create_int_range(1, 32, 1)
+execution_replica_count_range : Sequence[int] = create_int_range(1, 8, 1)
+execution_batch_size_range : Sequence[int] = create_int_range(1, 32, 1)
+execution_batch_timeout_range : Sequence[int] = create_int_range(0, 50, 1)
+session_thread_count_range : Sequence[int] = create_int_range(0, 32, 1)
+session_concurrency_limit_range : Sequence[int] = create_int_range(0, 32, 1)
+inference_memory_limit_range : Sequence[int] = create_int_range(0, 32768, 256)
 system_memory_limit_range : Sequence[int] = create_int_range(0, 128, 4)
+face_store_entry_limit_range : Sequence[int] = create_int_range(0, 4096, 64)
+face_store_memory_limit_range : Sequence[int] = create_int_range(0, 1024, 16)
+image_store_memory_limit_range : Sequence[int] = create_int_range(0, 16384, 256)
 face_detector_angles : Sequence[Angle] = create_int_range(0, 270, 90)
 face_detector_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
+face_tracker_interval_range : Sequence[int] = create_int_range(0, 30, 1)
 face_landmarker_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
 face_mask_blur_range : Sequence[float] = create_float_range(0.0, 1.0, 0.05)
 face_mask_padding_range : Sequence[int] = create_int_range(0, 100, 1)
@@ -164,3 +198,5 @@ output_audio_quality_range : Sequence[int] = create_int_range(0, 100, 1)
 output_audio_volume_range : Sequence[int] = create_int_range(0, 100, 1)
 output_video_quality_range : Sequence[int] = create_int_range(0, 100, 1)
 output_video_scale_range : Sequence[float] = create_float_range(0.25, 8.0, 0.25)
+video_segment_count_range : Sequence[int] = create_int_range(1, 16, 1)
+frame_reuse_threshold_range : Sequence[float] = create_float_range(0.0, 2.0, 0.05)
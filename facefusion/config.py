@@ -12,7 +12,9 @@ def get_config_parser() -> ConfigParser:
 
 	if CONFIG_PARSER is None:
 		CONFIG_PARSER = ConfigParser()
-		CONFIG_PARSER.read(state_manager.get_item('config_path'), encoding = 'utf-8')
+
+		if state_manager.get_item('config_path'):
+			CONFIG_PARSER.read(state_manager.get_item('config_path'), encoding = 'utf-8')
 	return CONFIG_PARSER
 
 
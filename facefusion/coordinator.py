@@ -0,0 +1,223 @@
+import os
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from queue import Empty, Queue
+from time import sleep
+from typing import List, Optional
+
+from tqdm import tqdm
+
+from facefusion import core, face_tracker, inference_manager, logger, process_manager, process_pool, state_manager, wording
+from facefusion.jobs import job_store
+from facefusion.processors.core import create_frame_context, get_processors_modules
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_segment_file_path
+from facefusion.types import CoordinatorAddress, ErrorCode, WorkerTask
+from facefusion.vision import predict_video_frame_total
+
+COORDINATOR_TIMEOUT : float = 0.5
+WORKER_RETRY_DELAY : float = 2.0
+WORKER_TASK_ATTEMPT_LIMIT : int = 3
+
+
+def pre_check() -> bool:
+	if state_manager.get_item('coordinator_address') and not state_manager.get_item('coordinator_secret'):
+		logger.error(wording.get('coordinator_secret_missing'), __name__)
+		return False
+	return True
+
+
+def resolve_coordinator_address(coordinator_address : str) -> CoordinatorAddress:
+	coordinator_host, _, coordinator_port = coordinator_address.rpartition(':')
+
+	if coordinator_host and coordinator_port.isdigit():
+		return coordinator_host, int(coordinator_port)
+	return coordinator_address
+
+
+def get_coordinator_authkey() -> bytes:
+	return state_manager.get_item('coordinator_secret').encode()
+
+
+def run_coordinator(worker_tasks : List[WorkerTask], progress : tqdm) -> List[bool]:
+	coordinator_address = resolve_coordinator_address(state_manager.get_item('coordinator_address'))
+	coordinator_event = threading.Event()
+	task_queue : Queue[WorkerTask] = Queue()
+	task_results : List[Optional[bool]] = [ None ] * len(worker_tasks)
+	task_attempts : List[int] = [ 0 ] * len(worker_tasks)
+
+	for worker_task in worker_tasks:
+		task_queue.put(worker_task)
+
+	with Listener(coordinator_address, authkey = get_coordinator_authkey()) as listener:
+		logger.info(wording.get('coordinator_listening').format(coordinator_address = state_manager.get_item('coordinator_address')), __name__)
+		accept_thread = threading.Thread(target = accept_workers, args = (listener, task_queue, task_results, task_attempts, progress, coordinator_event), daemon = True)
+		accept_thread.start()
+
+		while None in task_results and process_manager.is_processing():
+			sleep(COORDINATOR_TIMEOUT)
+
+		coordinator_event.set()
+		wake_listener(coordinator_address)
+		accept_thread.join()
+
+	return [ task_result is True for task_result in task_results ]
+
+
+def accept_workers(listener : Listener, task_queue : Queue[WorkerTask], task_results : List[Optional[bool]], task_attempts : List[int], progress : tqdm, coordinator_event : threading.Event) -> None:
+	worker_threads = []
+
+	while not coordinator_event.is_set():
+		try:
+			connection = listener.accept()
+		except (AuthenticationError, OSError):
+			continue
+
+		if coordinator_event.is_set():
+			connection.close()
+			break
+
+		logger.debug(wording.get('worker_joined'), __name__)
+		worker_thread = threading.Thread(target = serve_worker, args = (connection, task_queue, task_results, task_attempts, progress, coordinator_event), daemon = True)
+		worker_thread.start()
+		worker_threads.append(worker_thread)
+
+	for worker_thread in worker_threads:
+		worker_thread.join()
+
+
+def wake_listener(coordinator_address : CoordinatorAddress) -> None:
+	try:
+		Client(coordinator_address, authkey = get_coordinator_authkey()).close()
+	except (AuthenticationError, OSError):
+		pass
+
+
+def serve_worker(connection : Connection, task_queue : Queue[WorkerTask], task_results : List[Optional[bool]], task_attempts : List[int], progress : tqdm, coordinator_event : threading.Event) -> None:
+	with connection:
+		while not coordinator_event.is_set():
+			try:
+				worker_task = task_queue.get(timeout = COORDINATOR_TIMEOUT)
+			except Empty:
+				continue
+
+			try:
+				connection.send(worker_task)
+				segment_content = receive_segment(connection, coordinator_event)
+			except (EOFError, OSError):
+				requeue_worker_task(worker_task, task_queue, task_results, task_attempts)
+				return
+
+			task_results[worker_task.get('segment_index')] = bool(segment_content) and write_segment(worker_task, segment_content)
+			progress.update(predict_video_frame_total(state_manager.get_item('target_path'), worker_task.get('temp_video_fps'), worker_task.get('video_segment').get('frame_start'), worker_task.get('video_segment').get('frame_end')))
+
+		try:
+			connection.send(None)
+		except OSError:
+			pass
+
+
+def requeue_worker_task(worker_task : WorkerTask, task_queue : Queue[WorkerTask], task_results : List[Optional[bool]], task_attempts : List[int]) -> None:
+	segment_index = worker_task.get('segment_index')
+	task_attempts[segment_index] += 1
+
+	if task_attempts[segment_index] < WORKER_TASK_ATTEMPT_LIMIT:
+		logger.warn(wording.get('worker_lost').format(segment_index = segment_index), __name__)
+		task_queue.put(worker_task)
+	else:
+		logger.error(wording.get('worker_task_abandoned').format(segment_index = segment_index, attempt_total = task_attempts[segment_index]), __name__)
+		task_results[segment_index] = False
+
+
+def receive_segment(connection : Connection, coordinator_event : threading.Event) -> Optional[bytes]:
+	while not connection.poll(COORDINATOR_TIMEOUT):
+		if coordinator_event.is_set():
+			return None
+	return connection.recv()
+
+
+def write_segment(worker_task : WorkerTask, segment_content : bytes) -> bool:
+	temp_segment_path = get_temp_segment_file_path(state_manager.get_item('target_path'), worker_task.get('segment_index'))
+
+	with open(temp_segment_path, 'wb') as temp_segment_file:
+		temp_segment_file.write(segment_content)
+	return os.path.getsize(temp_segment_path) > 0
+
+
+def run_worker() -> ErrorCode:
+	coordinator_address = resolve_coordinator_address(state_manager.get_item('coordinator_address'))
+	state_manager.set_item('temp_path', os.path.join(state_manager.get_item('temp_path'), 'facefusion-worker-' + str(os.getpid())))
+	logger.info(wording.get('worker_waiting').format(coordinator_address = state_manager.get_item('coordinator_address')), __name__)
+
+	while True:
+		try:
+			connection = Client(coordinator_address, authkey = get_coordinator_authkey())
+		except AuthenticationError:
+			logger.error(wording.get('worker_authentication_failed'), __name__)
+			return 1
+		except OSError:
+			sleep(WORKER_RETRY_DELAY)
+			continue
+
+		logger.info(wording.get('worker_connected'), __name__)
+
+		with connection:
+			try:
+				while worker_task := connection.recv():
+					connection.send(process_worker_task(worker_task))
+			except (EOFError, OSError):
+				pass
+
+
+def process_worker_task(worker_task : WorkerTask) -> Optional[bytes]:
+	segment_content = None
+	step_keys = job_store.get_step_keys()
+
+	if not set(worker_task.get('step_args')).issubset(step_keys):
+		logger.error(wording.get('worker_task_rejected'), __name__)
+		return None
+
+	for key, value in worker_task.get('step_args').items():
+		state_manager.set_item(key, value) #type:ignore[arg-type]
+
+	create_temp_directory(state_manager.get_item('target_path'))
+	process_manager.start()
+
+	try:
+		segment_content = process_worker_segment(worker_task)
+	except Exception as exception:
+		logger.error(wording.get('worker_task_failed').format(segment_index = worker_task.get('segment_index'), exception = exception), __name__)
+
+	process_pool.clear_process_pool()
+	core.report_frame_reuse()
+	core.report_store_totals()
+	inference_manager.report_inference_loads()
+	inference_manager.release_inference_pools()
+	face_tracker.clear_face_tracks()
+
+	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+		processor_module.post_process()
+
+	clear_temp_directory(state_manager.get_item('target_path'))
+	process_manager.end()
+	return segment_content
+
+
+def process_worker_segment(worker_task : WorkerTask) -> Optional[bytes]:
+	if not core.processors_pre_check():
+		return None
+
+	frame_context = create_frame_context(worker_task.get('temp_video_fps'))
+	face_tracker.start_face_tracks()
+	segment_frame_total = predict_video_frame_total(state_manager.get_item('target_path'), worker_task.get('temp_video_fps'), worker_task.get('video_segment').get('frame_start'), worker_task.get('video_segment').get('frame_end'))
+
+	if state_manager.get_item('execution_worker_mode') == 'process':
+		process_pool.create_process_pool(frame_context, state_manager.get_item('execution_thread_count'))
+
+	with tqdm(total = segment_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+
+		if core.process_video_segment(frame_context, worker_task.get('segment_index'), worker_task.get('video_segment'), worker_task.get('frame_offset'), state_manager.get_item('execution_thread_count'), worker_task.get('temp_video_resolution'), worker_task.get('output_video_resolution'), progress):
+			with open(get_temp_segment_file_path(state_manager.get_item('target_path'), worker_task.get('segment_index')), 'rb') as temp_segment_file:
+				return temp_segment_file.read()
+	return None
@@ -1,33 +1,38 @@
 import inspect
 import itertools
+import json
 import shutil
 import signal
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from time import time
+from types import ModuleType
+from typing import Deque, Generator, Iterator, List, Optional, Set
 
-import numpy
 from tqdm import tqdm
 
-from facefusion import benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, logger, process_manager, state_manager, video_manager, voice_extractor, wording
-from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
-from facefusion.audio import create_empty_audio_frame, get_audio_frame, get_voice_frame
+from facefusion import benchmarker, cli_helper, content_analyser, coordinator, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, face_store, face_tracker, frame_store, hash_helper, image_pool, image_store, inference_manager, inference_profiler, logger, media_probe, process_manager, process_pool, quantizer, state_manager, video_manager, voice_extractor, warm_up, wording
+from facefusion.args import apply_args, collect_job_args, collect_step_args, reduce_job_args, reduce_step_args
+from facefusion.audio import create_empty_audio_frame
 from facefusion.common_helper import get_first
 from facefusion.content_analyser import analyse_image, analyse_video
 from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import hard_exit, signal_exit
-from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, merge_video, replace_audio, restore_audio
-from facefusion.filesystem import filter_audio_paths, get_file_name, is_image, is_video, resolve_file_paths, resolve_file_pattern
+from facefusion.ffmpeg import close_frame_pipe, concat_video, copy_image, detect_video_keyframes, extract_frames, extract_segment_frames, finalize_image, merge_segment_video, merge_video, open_frame_reader, open_frame_writer, read_video_frames, replace_audio, restore_audio, write_video_frame
+from facefusion.filesystem import create_file_stamp, filter_audio_paths, get_file_name, is_image, is_video, move_file, resolve_file_paths, resolve_file_pattern
 from facefusion.jobs import job_helper, job_manager, job_runner
 from facefusion.jobs.job_list import compose_job_list
 from facefusion.memory import limit_system_memory
-from facefusion.processors.core import get_processors_modules
+from facefusion.pipeline import run_stages
+from facefusion.processors.core import create_frame_context, get_processors_modules, has_face_processors, process_vision_frame, select_source_face, select_target_faces
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
-from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, move_temp_file, resolve_temp_frame_paths
+from facefusion.temp_helper import append_temp_journal, clear_stale_temp_directories, clear_temp_directory, create_temp_directory, create_temp_journal, create_temp_segment_directory, get_temp_file_path, get_temp_frame_staging_path, get_temp_segment_file_path, move_temp_file, read_temp_journal, resolve_temp_frame_paths, resolve_temp_segment_frame_paths
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import Args, ErrorCode
-from facefusion.vision import detect_image_resolution, detect_video_resolution, pack_resolution, read_static_image, read_static_images, read_static_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, write_image
+from facefusion.types import Args, ErrorCode, Fps, FrameContext, Resolution, TempFrame, VideoSegment, VisionFrame, WorkerTask
+from facefusion.vision import detect_frame_resolution, detect_image_resolution, detect_video_resolution, has_image_codec, pack_resolution, predict_video_frame_total, read_image, read_static_image, read_static_images, resize_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, split_video_segments, write_image
 
 
 def cli() -> None:
@@ -65,6 +70,18 @@ def route(args : Args) -> None:
 			hard_exit(2)
 		benchmarker.render()
 
+	if state_manager.get_item('command') == 'quantize':
+		if not common_pre_check() or not processors_pre_check() or not quantizer.pre_check():
+			hard_exit(2)
+		error_code = quantizer.run()
+		hard_exit(error_code)
+
+	if state_manager.get_item('command') == 'worker':
+		if not common_pre_check() or not coordinator.pre_check():
+			hard_exit(2)
+		error_code = coordinator.run_worker()
+		hard_exit(error_code)
+
 	if state_manager.get_item('command') in [ 'job-list', 'job-create', 'job-submit', 'job-submit-all', 'job-delete', 'job-delete-all', 'job-add-step', 'job-remix-step', 'job-insert-step', 'job-remove-step' ]:
 		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
 			hard_exit(1)
@@ -307,7 +324,7 @@ def process_batch(args : Args) -> ErrorCode:
 				step_args['output_path'] = job_args.get('output_pattern').format(index = index)
 				if not job_manager.add_step(job_id, step_args):
 					return 1
-			if job_manager.submit_job(job_id) and job_runner.run_job(job_id, process_step):
+			if job_manager.submit_job(job_id) and run_batch_job(job_id):
 				return 0
 
 		if not source_paths and target_paths:
@@ -316,11 +333,30 @@ def process_batch(args : Args) -> ErrorCode:
 				step_args['output_path'] = job_args.get('output_pattern').format(index = index)
 				if not job_manager.add_step(job_id, step_args):
 					return 1
-			if job_manager.submit_job(job_id) and job_runner.run_job(job_id, process_step):
+			if job_manager.submit_job(job_id) and run_batch_job(job_id):
 				return 0
 	return 1
 
 
+def run_batch_job(job_id : str) -> bool:
+	image_pool.create_image_pool(state_manager.get_item('execution_thread_count'))
+	is_success = job_runner.run_job(job_id, process_batch_step)
+	image_pool.clear_image_pool()
+	return is_success
+
+
+def process_batch_step(job_id : str, step_index : int, step_args : Args) -> bool:
+	steps = job_manager.get_steps(job_id)
+	prefetch_steps = steps[step_index + 1:step_index + 1 + state_manager.get_item('execution_thread_count')]
+	image_pool.prefetch_images([ step.get('args').get('target_path') for step in prefetch_steps if has_image_codec(step.get('args').get('target_path'), step.get('args').get('output_path')) ])
+	target_path = step_args.get('target_path')
+
+	try:
+		return process_step(job_id, step_index, step_args)
+	finally:
+		image_pool.remove_pool_image(target_path)
+
+
 def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
 	step_total = job_manager.count_step_total(job_id)
 	step_args.update(collect_job_args())
@@ -336,22 +372,86 @@ def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
 def conditional_process() -> ErrorCode:
 	start_time = time()
 
+	if not coordinator.pre_check():
+		return 2
+
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		if not processor_module.pre_process('output'):
 			return 2
 
+	if state_manager.get_item('execution_worker_mode') == 'thread' and not state_manager.get_item('coordinator_address'):
+		warm_up.start_warm_up(collect_warm_up_modules())
+
+	error_code : ErrorCode = 0
+
 	if is_image(state_manager.get_item('target_path')):
-		return process_image(start_time)
+		error_code = process_image(start_time)
 	if is_video(state_manager.get_item('target_path')):
-		return process_video(start_time)
+		error_code = process_video(start_time)
 
-	return 0
+	report_store_totals()
+	warm_up.clear_warm_up()
+	inference_manager.release_inference_pools()
+
+	if state_manager.get_item('inference_profile'):
+		inference_profiler.report_inference_profiles()
+	return error_code
+
+
+def collect_warm_up_modules() -> List[ModuleType]:
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	warm_up_modules = []
+
+	if has_face_processors(processor_modules):
+		warm_up_modules.extend([ face_classifier, face_detector, face_landmarker, face_masker, face_recognizer ])
+	if filter_audio_paths(state_manager.get_item('source_paths')):
+		warm_up_modules.append(voice_extractor)
+	warm_up_modules.extend(processor_modules)
+	return warm_up_modules
 
 
 def process_image(start_time : float) -> ErrorCode:
 	if analyse_image(state_manager.get_item('target_path')):
 		return 3
 
+	if has_image_codec(state_manager.get_item('target_path'), state_manager.get_item('output_path')):
+		return process_image_in_memory(start_time)
+	return process_image_with_ffmpeg(start_time)
+
+
+def process_image_in_memory(start_time : float) -> ErrorCode:
+	process_manager.start()
+
+	target_vision_frame = image_pool.read_pool_image(state_manager.get_item('target_path'))
+
+	if target_vision_frame is None:
+		logger.error(wording.get('copying_image_failed'), __name__)
+		process_manager.end()
+		return 1
+
+	output_image_resolution = scale_resolution(detect_frame_resolution(target_vision_frame), state_manager.get_item('output_image_scale'))
+	temp_image_resolution = min(detect_frame_resolution(target_vision_frame), output_image_resolution)
+	logger.info(wording.get('copying_image').format(resolution = pack_resolution(temp_image_resolution)), __name__)
+	target_vision_frame = resize_frame(target_vision_frame, temp_image_resolution)
+	temp_vision_frame = process_image_frame(target_vision_frame, target_vision_frame)
+
+	if is_process_stopping():
+		return 4
+
+	logger.info(wording.get('finalizing_image').format(resolution = pack_resolution(output_image_resolution)), __name__)
+	temp_vision_frame = resize_frame(temp_vision_frame, output_image_resolution)
+
+	if write_image(state_manager.get_item('output_path'), temp_vision_frame, state_manager.get_item('output_image_quality')):
+		logger.info(wording.get('processing_image_succeeded').format(seconds = calculate_end_time(start_time)), __name__)
+	else:
+		logger.error(wording.get('processing_image_failed'), __name__)
+		process_manager.end()
+		return 1
+	process_manager.end()
+	return 0
+
+
+def process_image_with_ffmpeg(start_time : float) -> ErrorCode:
 	logger.debug(wording.get('clearing_temp'), __name__)
 	clear_temp_directory(state_manager.get_item('target_path'))
 	logger.debug(wording.get('creating_temp'), __name__)
@@ -371,26 +471,8 @@ def process_image(start_time : float) -> ErrorCode:
 
 	temp_image_path = get_temp_file_path(state_manager.get_item('target_path'))
 	reference_vision_frame = read_static_image(temp_image_path)
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
-	source_audio_frame = create_empty_audio_frame()
-	source_voice_frame = create_empty_audio_frame()
 	target_vision_frame = read_static_image(temp_image_path)
-	temp_vision_frame = target_vision_frame.copy()
-
-	for processor_module in get_processors_modules(state_manager.get_item('processors')):
-		logger.info(wording.get('processing'), processor_module.__name__)
-
-		temp_vision_frame = processor_module.process_frame(
-		{
-			'reference_vision_frame': reference_vision_frame,
-			'source_vision_frames': source_vision_frames,
-			'source_audio_frame': source_audio_frame,
-			'source_voice_frame': source_voice_frame,
-			'target_vision_frame': target_vision_frame,
-			'temp_vision_frame': temp_vision_frame
-		})
-
-		processor_module.post_process()
+	temp_vision_frame = process_image_frame(reference_vision_frame, target_vision_frame)
 
 	write_image(temp_image_path, temp_vision_frame)
 	if is_process_stopping():
@@ -415,78 +497,81 @@ def process_image(start_time : float) -> ErrorCode:
 	return 0
 
 
+def process_image_frame(reference_vision_frame : VisionFrame, target_vision_frame : VisionFrame) -> VisionFrame:
+	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+	source_audio_frame = create_empty_audio_frame()
+	source_voice_frame = create_empty_audio_frame()
+	temp_vision_frame = target_vision_frame.copy()
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	source_face = select_source_face(processor_modules, source_vision_frames)
+	target_faces = select_target_faces(processor_modules, reference_vision_frame, target_vision_frame)
+
+	for processor_module in processor_modules:
+		logger.info(wording.get('processing'), processor_module.__name__)
+
+		temp_vision_frame = processor_module.process_frame(
+		{
+			'source_vision_frames': source_vision_frames,
+			'source_face': source_face,
+			'source_audio_frame': source_audio_frame,
+			'source_voice_frame': source_voice_frame,
+			'target_faces': target_faces,
+			'target_vision_frame': target_vision_frame,
+			'temp_vision_frame': temp_vision_frame
+		})
+
+		processor_module.post_process()
+
+	return temp_vision_frame
+
+
 def process_video(start_time : float) -> ErrorCode:
 	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
 	if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
 		return 3
 
-	logger.debug(wording.get('clearing_temp'), __name__)
-	clear_temp_directory(state_manager.get_item('target_path'))
-	logger.debug(wording.get('creating_temp'), __name__)
-	create_temp_directory(state_manager.get_item('target_path'))
+	journal_frame_numbers = None
+	clear_stale_temp_directories()
+
+	if state_manager.get_item('temp_frame_mode') == 'disk':
+		journal_frame_numbers = read_temp_journal(state_manager.get_item('target_path'), create_journal_signature())
+	if journal_frame_numbers is None:
+		logger.debug(wording.get('clearing_temp'), __name__)
+		clear_temp_directory(state_manager.get_item('target_path'))
+		logger.debug(wording.get('creating_temp'), __name__)
+		create_temp_directory(state_manager.get_item('target_path'))
 
 	process_manager.start()
 	output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
 	temp_video_resolution = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-	logger.info(wording.get('extracting_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
-
-	if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
-		logger.debug(wording.get('extracting_frames_succeeded'), __name__)
-	else:
-		if is_process_stopping():
-			return 4
-		logger.error(wording.get('extracting_frames_failed'), __name__)
-		process_manager.end()
-		return 1
-
-	temp_frame_paths = resolve_temp_frame_paths(state_manager.get_item('target_path'))
-
-	if temp_frame_paths:
-		with tqdm(total = len(temp_frame_paths), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
-			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
-
-			with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
-				futures = []
-
-				for frame_number, temp_frame_path in enumerate(temp_frame_paths):
-					future = executor.submit(process_temp_frame, temp_frame_path, frame_number)
-					futures.append(future)
-
-				for future in as_completed(futures):
-					if is_process_stopping():
-						for __future__ in futures:
-							__future__.cancel()
-
-					if not future.cancelled():
-						future.result()
-						progress.update()
-
-		for processor_module in get_processors_modules(state_manager.get_item('processors')):
-			processor_module.post_process()
-
-		if is_process_stopping():
-			return 4
-	else:
-		logger.error(wording.get('temp_frames_not_found'), __name__)
-		process_manager.end()
-		return 1
+	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
 
-	logger.info(wording.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
-	if merge_video(state_manager.get_item('target_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
-		logger.debug(wording.get('merging_video_succeeded'), __name__)
+	if state_manager.get_item('coordinator_address'):
+		error_code = coordinate_video(temp_video_fps, temp_video_resolution, output_video_resolution, trim_frame_start, trim_frame_end)
 	else:
-		if is_process_stopping():
-			return 4
-		logger.error(wording.get('merging_video_failed'), __name__)
-		process_manager.end()
-		return 1
+		frame_context = create_frame_context(temp_video_fps)
+		face_tracker.start_face_tracks()
+
+		if state_manager.get_item('execution_worker_mode') == 'process':
+			process_pool.create_process_pool(frame_context, state_manager.get_item('execution_thread_count'))
+		if state_manager.get_item('video_segment_count') > 1:
+			error_code = segment_video(frame_context, temp_video_resolution, output_video_resolution, trim_frame_start, trim_frame_end)
+		elif state_manager.get_item('temp_frame_mode') == 'pipe':
+			error_code = pipe_video(frame_context, temp_video_resolution, output_video_resolution, trim_frame_start, trim_frame_end)
+		else:
+			error_code = extract_merge_video(frame_context, journal_frame_numbers, temp_video_resolution, output_video_resolution, trim_frame_start, trim_frame_end)
+		process_pool.clear_process_pool()
+		report_frame_reuse()
+		inference_manager.report_inference_loads()
+		face_tracker.clear_face_tracks()
+	if error_code:
+		return error_code
 
 	if state_manager.get_item('output_audio_volume') == 0:
 		logger.info(wording.get('skipping_audio'), __name__)
 		move_temp_file(state_manager.get_item('target_path'), state_manager.get_item('output_path'))
 	else:
-		source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
 		if source_audio_path:
 			if replace_audio(state_manager.get_item('target_path'), source_audio_path, state_manager.get_item('output_path')):
 				video_manager.clear_video_pool()
@@ -521,34 +606,279 @@ def process_video(start_time : float) -> ErrorCode:
 	return 0
 
 
-def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
-	reference_vision_frame = read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
-	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
-	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-	target_vision_frame = read_static_image(temp_frame_path)
-	temp_vision_frame = target_vision_frame.copy()
+def extract_merge_video(frame_context : FrameContext, journal_frame_numbers : Optional[Set[int]], temp_video_resolution : Resolution, output_video_resolution : Resolution, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
+	temp_video_fps = frame_context.get('temp_video_fps')
+
+	if journal_frame_numbers is None:
+		logger.info(wording.get('extracting_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
+
+		if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+			logger.debug(wording.get('extracting_frames_succeeded'), __name__)
+			create_temp_journal(state_manager.get_item('target_path'), create_journal_signature())
+			journal_frame_numbers = set()
+		else:
+			if is_process_stopping():
+				return 4
+			logger.error(wording.get('extracting_frames_failed'), __name__)
+			process_manager.end()
+			return 1
+	else:
+		logger.info(wording.get('resuming_frames').format(frame_total = len(journal_frame_numbers)), __name__)
+
+	temp_frame_paths = resolve_temp_frame_paths(state_manager.get_item('target_path'))
+
+	if temp_frame_paths:
+		with tqdm(total = len(temp_frame_paths), initial = len(journal_frame_numbers), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+
+			for _ in multi_process_temp_frames(frame_context, create_temp_frames(temp_frame_paths, 0, journal_frame_numbers), state_manager.get_item('execution_thread_count')):
+				progress.update()
+
+		for processor_module in get_processors_modules(state_manager.get_item('processors')):
+			processor_module.post_process()
+
+		if is_process_stopping():
+			return 4
+	else:
+		logger.error(wording.get('temp_frames_not_found'), __name__)
+		process_manager.end()
+		return 1
+
+	logger.info(wording.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
+	if merge_video(state_manager.get_item('target_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+		logger.debug(wording.get('merging_video_succeeded'), __name__)
+	else:
+		if is_process_stopping():
+			return 4
+		logger.error(wording.get('merging_video_failed'), __name__)
+		process_manager.end()
+		return 1
+	return 0
+
+
+def segment_video(frame_context : FrameContext, temp_video_resolution : Resolution, output_video_resolution : Resolution, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
+	temp_video_fps = frame_context.get('temp_video_fps')
+	video_segments = split_target_video(trim_frame_start, trim_frame_end)
+	segment_frame_total = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, trim_frame_end)
+	segment_thread_count = max(1, state_manager.get_item('execution_thread_count') // len(video_segments))
 
-	source_audio_frame = get_audio_frame(source_audio_path, temp_video_fps, frame_number)
-	source_voice_frame = get_voice_frame(source_audio_path, temp_video_fps, frame_number)
+	with tqdm(total = segment_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
 
-	if not numpy.any(source_audio_frame):
-		source_audio_frame = create_empty_audio_frame()
-	if not numpy.any(source_voice_frame):
-		source_voice_frame = create_empty_audio_frame()
+		with ThreadPoolExecutor(max_workers = len(video_segments)) as executor:
+			futures = []
+
+			for segment_index, video_segment in enumerate(video_segments):
+				frame_offset = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, video_segment.get('frame_start'))
+				futures.append(executor.submit(process_video_segment, frame_context, segment_index, video_segment, frame_offset, segment_thread_count, temp_video_resolution, output_video_resolution, progress))
+			segment_results = [ future.result() for future in futures ]
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
-		temp_vision_frame = processor_module.process_frame(
+		processor_module.post_process()
+
+	return concat_video_segments(segment_results)
+
+
+def coordinate_video(temp_video_fps : Fps, temp_video_resolution : Resolution, output_video_resolution : Resolution, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
+	video_segments = split_target_video(trim_frame_start, trim_frame_end)
+	segment_frame_total = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, trim_frame_end)
+	worker_tasks : List[WorkerTask] =\
+	[
 		{
-			'reference_vision_frame': reference_vision_frame,
-			'source_vision_frames': source_vision_frames,
-			'source_audio_frame': source_audio_frame,
-			'source_voice_frame': source_voice_frame,
-			'target_vision_frame': target_vision_frame,
-			'temp_vision_frame': temp_vision_frame
-		})
+			'step_args': collect_step_args(),
+			'segment_index': segment_index,
+			'video_segment': video_segment,
+			'frame_offset': predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, video_segment.get('frame_start')),
+			'temp_video_fps': temp_video_fps,
+			'temp_video_resolution': temp_video_resolution,
+			'output_video_resolution': output_video_resolution
+		} for segment_index, video_segment in enumerate(video_segments)
+	]
+
+	with tqdm(total = segment_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		segment_results = coordinator.run_coordinator(worker_tasks, progress)
+
+	return concat_video_segments(segment_results)
+
+
+def split_target_video(trim_frame_start : int, trim_frame_end : int) -> List[VideoSegment]:
+	keyframe_numbers = detect_video_keyframes(state_manager.get_item('target_path'))
+	video_segments = split_video_segments(keyframe_numbers, trim_frame_start, trim_frame_end, state_manager.get_item('video_segment_count'))
+	logger.info(wording.get('segmenting_video').format(segment_total = len(video_segments)), __name__)
+	return video_segments
+
+
+def concat_video_segments(segment_results : List[bool]) -> ErrorCode:
+	if is_process_stopping():
+		return 4
+	temp_segment_paths = [ get_temp_segment_file_path(state_manager.get_item('target_path'), segment_index) for segment_index in range(len(segment_results)) ]
+
+	if all(segment_results) and concat_video(get_temp_file_path(state_manager.get_item('target_path')), temp_segment_paths):
+		logger.debug(wording.get('segmenting_video_succeeded'), __name__)
+	else:
+		if is_process_stopping():
+			return 4
+		logger.error(wording.get('segmenting_video_failed'), __name__)
+		process_manager.end()
+		return 1
+	return 0
+
+
+def process_video_segment(frame_context : FrameContext, segment_index : int, video_segment : VideoSegment, frame_offset : int, segment_thread_count : int, temp_video_resolution : Resolution, output_video_resolution : Resolution, progress : tqdm) -> bool:
+	temp_video_fps = frame_context.get('temp_video_fps')
+	create_temp_segment_directory(state_manager.get_item('target_path'), segment_index)
+
+	if extract_segment_frames(state_manager.get_item('target_path'), segment_index, video_segment, temp_video_resolution, temp_video_fps):
+		temp_frame_paths = resolve_temp_segment_frame_paths(state_manager.get_item('target_path'), segment_index)
+
+		for _ in multi_process_temp_frames(frame_context, create_temp_frames(temp_frame_paths, frame_offset, set()), segment_thread_count):
+			progress.update()
+
+		if temp_frame_paths and process_manager.is_processing():
+			return merge_segment_video(state_manager.get_item('target_path'), segment_index, temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'))
+	return False
+
+
+def pipe_video(frame_context : FrameContext, temp_video_resolution : Resolution, output_video_resolution : Resolution, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
+	temp_video_fps = frame_context.get('temp_video_fps')
+	pipe_frame_total = predict_video_frame_total(state_manager.get_item('target_path'), temp_video_fps, trim_frame_start, trim_frame_end)
+	frame_writer = None
+	logger.info(wording.get('piping_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
+	frame_reader = open_frame_reader(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+
+	try:
+		with tqdm(total = pipe_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+
+			for temp_vision_frame in multi_process_frames(frame_context, read_video_frames(frame_reader, temp_video_resolution)):
+				if not frame_writer:
+					temp_frame_resolution = temp_vision_frame.shape[1], temp_vision_frame.shape[0]
+					frame_writer = open_frame_writer(state_manager.get_item('target_path'), temp_video_fps, temp_frame_resolution, output_video_resolution, state_manager.get_item('output_video_fps'))
+				if not write_video_frame(frame_writer, temp_vision_frame):
+					break
+				progress.update()
+	except Exception:
+		if frame_writer:
+			close_frame_pipe(frame_writer)
+		raise
+	finally:
+		close_frame_pipe(frame_reader)
+
+	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+		processor_module.post_process()
+
+	if frame_writer and close_frame_pipe(frame_writer):
+		if is_process_stopping():
+			return 4
+		logger.debug(wording.get('piping_frames_succeeded'), __name__)
+	else:
+		if is_process_stopping():
+			return 4
+		logger.error(wording.get('piping_frames_failed'), __name__)
+		process_manager.end()
+		return 1
+	return 0
+
+
+def multi_process_frames(frame_context : FrameContext, target_vision_frames : Iterator[VisionFrame]) -> Generator[VisionFrame, None, None]:
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+
+	with ThreadPoolExecutor(max_workers = execution_thread_count) as executor:
+		futures : Deque[Future[VisionFrame]] = deque()
+
+		for frame_number, target_vision_frame in enumerate(target_vision_frames):
+			future = executor.submit(conditional_process_vision_frame, frame_context, target_vision_frame, frame_number)
+			futures.append(future)
+
+			while len(futures) > execution_thread_count:
+				yield futures.popleft().result()
+
+		while futures:
+			yield futures.popleft().result()
+
+
+def create_temp_frames(temp_frame_paths : List[str], frame_offset : int, journal_frame_numbers : Set[int]) -> Iterator[TempFrame]:
+	for frame_number, temp_frame_path in enumerate(temp_frame_paths, frame_offset):
+		if frame_number not in journal_frame_numbers:
+			temp_frame : TempFrame =\
+			{
+				'frame_number': frame_number,
+				'frame_path': temp_frame_path,
+				'vision_frame': None
+			}
+			yield temp_frame
+
+
+def multi_process_temp_frames(frame_context : FrameContext, temp_frames : Iterator[TempFrame], execution_thread_count : int) -> Generator[bool, None, None]:
+	stage_thread_count = max(1, execution_thread_count // 4)
+
+	yield from run_stages(temp_frames, [ read_temp_frame, partial(process_temp_frame, frame_context), write_temp_frame ], [ stage_thread_count, execution_thread_count, stage_thread_count ], execution_thread_count * 2)
+
+
+def read_temp_frame(temp_frame : TempFrame) -> TempFrame:
+	temp_frame['vision_frame'] = read_image(temp_frame.get('frame_path'))
+	return temp_frame
+
+
+def process_temp_frame(frame_context : FrameContext, temp_frame : TempFrame) -> TempFrame:
+	temp_frame['vision_frame'] = conditional_process_vision_frame(frame_context, temp_frame.get('vision_frame'), temp_frame.get('frame_number'))
+	return temp_frame
+
+
+def write_temp_frame(temp_frame : TempFrame) -> bool:
+	temp_frame_path = temp_frame.get('frame_path')
+	temp_frame_staging_path = get_temp_frame_staging_path(temp_frame_path)
+	return write_image(temp_frame_staging_path, temp_frame.get('vision_frame')) and move_file(temp_frame_staging_path, temp_frame_path) and append_temp_journal(state_manager.get_item('target_path'), temp_frame.get('frame_number'))
+
+
+def create_journal_signature() -> str:
+	journal_signature =\
+	{
+		'step_args': collect_step_args(),
+		'file_stamps': [ create_file_stamp(file_path) for file_path in [ state_manager.get_item('target_path') ] + (state_manager.get_item('source_paths') or []) ]
+	}
+	return hash_helper.create_hash(json.dumps(journal_signature, sort_keys = True).encode())
+
+
+def conditional_process_vision_frame(frame_context : FrameContext, target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	frame_reuse_threshold = state_manager.get_item('frame_reuse_threshold')
+
+	if frame_reuse_threshold and not frame_context.get('source_audio_path'):
+		frame_fingerprint = frame_store.create_frame_fingerprint(target_vision_frame)
+		reuse_vision_frame = frame_store.find_reuse_frame(frame_fingerprint, target_vision_frame, frame_reuse_threshold)
+
+		if reuse_vision_frame is None:
+			reuse_vision_frame = forward_process_vision_frame(frame_context, target_vision_frame, frame_number)
+			frame_store.set_reuse_frame(frame_fingerprint, target_vision_frame, reuse_vision_frame)
+		return reuse_vision_frame
+	return forward_process_vision_frame(frame_context, target_vision_frame, frame_number)
+
+
+def forward_process_vision_frame(frame_context : FrameContext, target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	if state_manager.get_item('execution_worker_mode') == 'process':
+		return process_pool.process_vision_frame(target_vision_frame, frame_number)
+	return process_vision_frame(frame_context, target_vision_frame, frame_number)
+
+
+def report_frame_reuse() -> None:
+	reuse_total, frame_total = frame_store.get_reuse_totals()
+
+	if frame_total:
+		logger.info(wording.get('reusing_frames').format(reuse_total = reuse_total, frame_total = frame_total, reuse_rate = round(reuse_total / frame_total * 100, 1)), __name__)
+	frame_store.clear_frame_store()
+
+
+def report_store_totals() -> None:
+	store_totals =\
+	{
+		'media_probe': media_probe.get_media_probe_totals(),
+		'face_store': face_store.get_face_store_totals(),
+		'image_store': image_store.get_image_store_totals()
+	}
 
-	return write_image(temp_frame_path, temp_vision_frame)
+	for store_name, (hit_total, miss_total) in store_totals.items():
+		if hit_total + miss_total:
+			logger.debug(wording.get('store_totals').format(store_name = store_name, hit_total = hit_total, miss_total = miss_total), __name__)
 
 
 def is_process_stopping() -> bool:
@@ -5,7 +5,8 @@ from time import sleep
 from types import FrameType
 
 from facefusion import process_manager, state_manager
-from facefusion.temp_helper import clear_temp_directory
+from facefusion.filesystem import is_file
+from facefusion.temp_helper import clear_temp_directory, get_temp_journal_path
 from facefusion.types import ErrorCode
 
 
@@ -28,7 +29,7 @@ def graceful_exit(error_code : ErrorCode) -> None:
 	while process_manager.is_processing():
 		sleep(0.5)
 
-	if state_manager.get_item('target_path'):
+	if state_manager.get_item('target_path') and not is_file(get_temp_journal_path(state_manager.get_item('target_path'))):
 		clear_temp_directory(state_manager.get_item('target_path'))
 
 	hard_exit(error_code)
@@ -1,12 +1,11 @@
 from functools import lru_cache
 from typing import List, Tuple
 
-import numpy
-
 from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
+from facefusion.tensor_helper import prepare_tensor_frame
 from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import Age, DownloadScope, FaceLandmark5, Gender, InferencePool, ModelOptions, ModelSet, Race, VisionFrame
 
@@ -70,11 +69,7 @@ def classify_face(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmar
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
 	crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-	crop_vision_frame = crop_vision_frame.astype(numpy.float32)[:, :, ::-1] / 255.0
-	crop_vision_frame -= model_mean
-	crop_vision_frame /= model_standard_deviation
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
+	crop_vision_frame = prepare_tensor_frame(crop_vision_frame, model_mean, model_standard_deviation)
 	gender_id, age_id, race_id = forward(crop_vision_frame)
 	gender = categorize_gender(gender_id[0])
 	age = categorize_age(age_id[0])
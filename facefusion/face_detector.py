@@ -8,7 +8,8 @@ from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import create_rotation_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_box, transform_bounding_box, transform_points
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import thread_semaphore
+from facefusion.tensor_helper import letterbox_frame, transpose_tensor_frame
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferencePool, ModelSet, Score, VisionFrame
 from facefusion.vision import restrict_frame, unpack_resolution
 
@@ -362,7 +363,7 @@ def detect_with_yunet(vision_frame : VisionFrame, face_detector_size : str) -> T
 def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('retinaface')
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		detection = face_detector.run(None,
 		{
 			'input': detect_vision_frame
@@ -374,7 +375,7 @@ def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
 def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('scrfd')
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		detection = face_detector.run(None,
 		{
 			'input': detect_vision_frame
@@ -386,7 +387,7 @@ def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
 def forward_with_yolo_face(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('yolo_face')
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		detection = face_detector.run(None,
 		{
 			'input': detect_vision_frame
@@ -398,7 +399,7 @@ def forward_with_yolo_face(detect_vision_frame : VisionFrame) -> Detection:
 def forward_with_yunet(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('yunet')
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		detection = face_detector.run(None,
 		{
 			'input': detect_vision_frame
@@ -409,9 +410,8 @@ def forward_with_yunet(detect_vision_frame : VisionFrame) -> Detection:
 
 def prepare_detect_frame(temp_vision_frame : VisionFrame, face_detector_size : str) -> VisionFrame:
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	detect_vision_frame = numpy.zeros((face_detector_height, face_detector_width, 3))
-	detect_vision_frame[:temp_vision_frame.shape[0], :temp_vision_frame.shape[1], :] = temp_vision_frame
-	detect_vision_frame = numpy.expand_dims(detect_vision_frame.transpose(2, 0, 1), axis = 0).astype(numpy.float32)
+	detect_vision_frame = letterbox_frame(temp_vision_frame, (face_detector_width, face_detector_height))
+	detect_vision_frame = transpose_tensor_frame(detect_vision_frame)
 	return detect_vision_frame
 
 
@@ -103,13 +103,19 @@ def paste_back(temp_vision_frame : VisionFrame, crop_vision_frame : VisionFrame,
 	x1, y1, x2, y2 = paste_bounding_box
 	paste_width = x2 - x1
 	paste_height = y2 - y1
-	inverse_mask = cv2.warpAffine(crop_mask, paste_matrix, (paste_width, paste_height)).clip(0, 1)
-	inverse_mask = numpy.expand_dims(inverse_mask, axis = -1)
-	inverse_vision_frame = cv2.warpAffine(crop_vision_frame, paste_matrix, (paste_width, paste_height), borderMode = cv2.BORDER_REPLICATE)
+	inverse_mask = cv2.warpAffine(crop_mask.astype(numpy.float32), paste_matrix, (paste_width, paste_height)).clip(0, 1)
+	mask_x, mask_y, mask_width, mask_height = cv2.boundingRect((inverse_mask > 0).astype(numpy.uint8))
 	temp_vision_frame = temp_vision_frame.copy()
-	paste_vision_frame = temp_vision_frame[y1:y2, x1:x2]
-	paste_vision_frame = paste_vision_frame * (1 - inverse_mask) + inverse_vision_frame * inverse_mask
-	temp_vision_frame[y1:y2, x1:x2] = paste_vision_frame.astype(temp_vision_frame.dtype)
+
+	if mask_width and mask_height:
+		inverse_mask = numpy.expand_dims(inverse_mask[mask_y:mask_y + mask_height, mask_x:mask_x + mask_width], axis = -1)
+		inverse_matrix = paste_matrix.copy()
+		inverse_matrix[:, 2] -= [ mask_x, mask_y ]
+		inverse_vision_frame = cv2.warpAffine(crop_vision_frame, inverse_matrix, (mask_width, mask_height), borderMode = cv2.BORDER_REPLICATE)
+		paste_vision_frame = temp_vision_frame[y1 + mask_y:y1 + mask_y + mask_height, x1 + mask_x:x1 + mask_x + mask_width]
+		blend_vision_frame = paste_vision_frame.astype(numpy.float32)
+		blend_vision_frame += (inverse_vision_frame - blend_vision_frame) * inverse_mask
+		paste_vision_frame[:] = blend_vision_frame.astype(temp_vision_frame.dtype)
 	return temp_vision_frame
 
 
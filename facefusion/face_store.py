@@ -1,28 +1,95 @@
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
+import numpy
+
+from facefusion import state_manager
 from facefusion.hash_helper import create_hash
 from facefusion.types import Face, FaceStore, VisionFrame
 
+FACE_STORE_LOCK : threading.Lock = threading.Lock()
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {}
+	'static_faces': OrderedDict(),
+	'static_faces_size': 0,
+	'hit_total': 0,
+	'miss_total': 0
 }
+FACE_STORE_SAMPLE_STEP : int = 4
 
 
 def get_face_store() -> FaceStore:
 	return FACE_STORE
 
 
+def create_vision_key(vision_frame : VisionFrame) -> str:
+	vision_sample = numpy.ascontiguousarray(vision_frame[::FACE_STORE_SAMPLE_STEP, ::FACE_STORE_SAMPLE_STEP])
+	return create_hash(str(vision_frame.shape).encode() + vision_sample.tobytes())
+
+
+def calculate_faces_size(faces : List[Face]) -> int:
+	faces_size = 0
+
+	for face in faces:
+		faces_size += face.bounding_box.nbytes + face.embedding.nbytes + face.embedding_norm.nbytes
+		faces_size += sum(face_landmark.nbytes for face_landmark in face.landmark_set.values())
+	return faces_size
+
+
 def get_static_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
-	vision_hash = create_hash(vision_frame.tobytes())
-	return FACE_STORE.get('static_faces').get(vision_hash)
+	vision_key = create_vision_key(vision_frame)
+
+	with FACE_STORE_LOCK:
+		static_faces = FACE_STORE.get('static_faces').get(vision_key)
+
+		if not static_faces:
+			FACE_STORE['miss_total'] += 1
+			return None
+
+		FACE_STORE['hit_total'] += 1
+		FACE_STORE.get('static_faces').move_to_end(vision_key)
+		return static_faces
 
 
 def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	vision_hash = create_hash(vision_frame.tobytes())
-	if vision_hash:
-		FACE_STORE['static_faces'][vision_hash] = faces
+	vision_key = create_vision_key(vision_frame)
+
+	with FACE_STORE_LOCK:
+		remove_static_faces(vision_key)
+		FACE_STORE['static_faces'][vision_key] = faces
+		FACE_STORE['static_faces_size'] += calculate_faces_size(faces)
+		evict_static_faces()
+
+
+def remove_static_faces(vision_key : str) -> None:
+	faces = FACE_STORE.get('static_faces').pop(vision_key, None)
+
+	if faces:
+		FACE_STORE['static_faces_size'] -= calculate_faces_size(faces)
+
+
+def evict_static_faces() -> None:
+	face_store_entry_limit = state_manager.get_item('face_store_entry_limit')
+	face_store_memory_limit = state_manager.get_item('face_store_memory_limit')
+
+	while FACE_STORE.get('static_faces'):
+		if face_store_entry_limit and len(FACE_STORE.get('static_faces')) > face_store_entry_limit:
+			remove_static_faces(next(iter(FACE_STORE.get('static_faces'))))
+			continue
+		if face_store_memory_limit and FACE_STORE.get('static_faces_size') > face_store_memory_limit * 1024 ** 2:
+			remove_static_faces(next(iter(FACE_STORE.get('static_faces'))))
+			continue
+		break
+
+
+def get_face_store_totals() -> Tuple[int, int]:
+	return FACE_STORE.get('hit_total'), FACE_STORE.get('miss_total')
 
 
 def clear_static_faces() -> None:
-	FACE_STORE['static_faces'].clear()
+	with FACE_STORE_LOCK:
+		FACE_STORE['static_faces'].clear()
+		FACE_STORE['static_faces_size'] = 0
+		FACE_STORE['hit_total'] = 0
+		FACE_STORE['miss_total'] = 0
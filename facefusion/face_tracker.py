@@ -0,0 +1,122 @@
+import threading
+from collections import deque
+from typing import Deque, List, Optional
+
+import cv2
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_analyser import get_many_faces
+from facefusion.face_store import get_static_faces, set_static_faces
+from facefusion.types import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceTrack, Matrix, VisionFrame
+from facefusion.vision import calculate_histogram_difference
+
+FACE_TRACKER_LOCK : threading.Lock = threading.Lock()
+FACE_TRACKER_ACTIVE : bool = False
+FACE_TRACKS : Deque[FaceTrack] = deque(maxlen = 4)
+FACE_TRACKER_SCENE_SCORE : float = 0.8
+FACE_TRACKER_ERROR : float = 2.0
+
+
+def track_faces(vision_frame : VisionFrame) -> List[Face]:
+	face_tracker_interval = state_manager.get_item('face_tracker_interval')
+
+	if face_tracker_interval and FACE_TRACKER_ACTIVE and numpy.any(vision_frame):
+		static_faces = get_static_faces(vision_frame)
+		if static_faces:
+			return static_faces
+
+		with FACE_TRACKER_LOCK:
+			face_track = find_face_track(vision_frame, face_tracker_interval)
+
+			if face_track:
+				faces = propagate_faces(face_track.get('vision_frame'), vision_frame, face_track.get('faces'))
+
+				if faces:
+					face_track['track_count'] += 1
+					set_static_faces(vision_frame, faces)
+					return faces
+
+		faces = get_many_faces([ vision_frame ])
+
+		if faces:
+			with FACE_TRACKER_LOCK:
+				FACE_TRACKS.append(
+				{
+					'vision_frame': vision_frame,
+					'faces': faces,
+					'track_count': 0
+				})
+		return faces
+	return get_many_faces([ vision_frame ])
+
+
+def find_face_track(vision_frame : VisionFrame, face_tracker_interval : int) -> Optional[FaceTrack]:
+	face_track_scores = []
+
+	for face_track in FACE_TRACKS:
+		if face_track.get('vision_frame').shape == vision_frame.shape and face_track.get('track_count') < face_tracker_interval:
+			face_track_scores.append((calculate_histogram_difference(face_track.get('vision_frame'), vision_frame), face_track))
+
+	if face_track_scores:
+		face_track_score, face_track = max(face_track_scores, key = lambda face_track_score : face_track_score[0])
+
+		if face_track_score > FACE_TRACKER_SCENE_SCORE:
+			return face_track
+	return None
+
+
+def propagate_faces(track_vision_frame : VisionFrame, vision_frame : VisionFrame, faces : List[Face]) -> Optional[List[Face]]:
+	track_gray_frame = cv2.cvtColor(track_vision_frame, cv2.COLOR_BGR2GRAY)
+	gray_frame = cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY)
+	track_points = numpy.concatenate([ face.landmark_set.get('5/68') for face in faces ]).astype(numpy.float32)
+	points, status, _ = cv2.calcOpticalFlowPyrLK(track_gray_frame, gray_frame, track_points, None, winSize = (21, 21), maxLevel = 3)
+	return_points, return_status, _ = cv2.calcOpticalFlowPyrLK(gray_frame, track_gray_frame, points, None, winSize = (21, 21), maxLevel = 3)
+	track_errors = numpy.linalg.norm(track_points - return_points, axis = 1)
+
+	if numpy.all(status) and numpy.all(return_status) and numpy.max(track_errors) < FACE_TRACKER_ERROR:
+		tracked_faces = []
+
+		for index, face in enumerate(faces):
+			face_landmark_5 = points[index * 5:index * 5 + 5]
+			affine_matrix, _ = cv2.estimateAffinePartial2D(face.landmark_set.get('5/68').astype(numpy.float32), face_landmark_5)
+
+			if affine_matrix is None:
+				return None
+			tracked_faces.append(transform_face(face, face_landmark_5, affine_matrix))
+		return tracked_faces
+	return None
+
+
+def transform_face(face : Face, face_landmark_5 : FaceLandmark5, affine_matrix : Matrix) -> Face:
+	x1, y1, x2, y2 = face.bounding_box
+	bounding_box_points = cv2.transform(numpy.array([ [ [ x1, y1 ], [ x2, y1 ], [ x2, y2 ], [ x1, y2 ] ] ], numpy.float32), affine_matrix)[0]
+	bounding_box : BoundingBox = numpy.concatenate([ bounding_box_points.min(axis = 0), bounding_box_points.max(axis = 0) ])
+	face_landmark_set : FaceLandmarkSet =\
+	{
+		'5': cv2.transform(face.landmark_set.get('5')[numpy.newaxis].astype(numpy.float32), affine_matrix)[0],
+		'5/68': face_landmark_5,
+		'68': cv2.transform(face.landmark_set.get('68')[numpy.newaxis].astype(numpy.float32), affine_matrix)[0],
+		'68/5': cv2.transform(face.landmark_set.get('68/5')[numpy.newaxis].astype(numpy.float32), affine_matrix)[0]
+	}
+
+	return face._replace(
+		bounding_box = bounding_box,
+		landmark_set = face_landmark_set
+	)
+
+
+def start_face_tracks() -> None:
+	global FACE_TRACKER_ACTIVE
+
+	with FACE_TRACKER_LOCK:
+		FACE_TRACKS.clear()
+		FACE_TRACKER_ACTIVE = True
+
+
+def clear_face_tracks() -> None:
+	global FACE_TRACKER_ACTIVE
+
+	with FACE_TRACKER_LOCK:
+		FACE_TRACKS.clear()
+		FACE_TRACKER_ACTIVE = False
@@ -2,16 +2,17 @@ import os
 import subprocess
 import tempfile
 from functools import partial
-from typing import List, Optional, cast
+from typing import Generator, List, Optional, cast
 
+import numpy
 from tqdm import tqdm
 
 import facefusion.choices
 from facefusion import ffmpeg_builder, logger, process_manager, state_manager, wording
 from facefusion.filesystem import get_file_format, remove_file
-from facefusion.temp_helper import get_temp_file_path, get_temp_frames_pattern
-from facefusion.types import AudioBuffer, AudioEncoder, Commands, EncoderSet, Fps, Resolution, UpdateProgress, VideoEncoder, VideoFormat
-from facefusion.vision import detect_video_duration, detect_video_fps, pack_resolution, predict_video_frame_total
+from facefusion.temp_helper import get_temp_file_path, get_temp_frames_pattern, get_temp_segment_file_path, get_temp_segment_frames_pattern
+from facefusion.types import AudioBuffer, AudioEncoder, Commands, EncoderSet, Fps, Resolution, UpdateProgress, VideoEncoder, VideoFormat, VideoSegment, VisionFrame
+from facefusion.vision import detect_video_duration, detect_video_fps, pack_resolution, predict_video_frame_total, unpack_resolution
 
 
 def run_ffmpeg_with_progress(commands : Commands, update_progress : UpdateProgress) -> subprocess.Popen[bytes]:
@@ -124,6 +125,141 @@ def extract_frames(target_path : str, temp_video_resolution : Resolution, temp_v
 		return process.returncode == 0
 
 
+def detect_video_keyframes(target_path : str) -> List[int]:
+	target_video_fps = detect_video_fps(target_path)
+	keyframe_numbers = []
+	keyframe_timestamps = []
+	time_base = 0.0
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.skip_non_keyframes(),
+		ffmpeg_builder.set_input(target_path),
+		ffmpeg_builder.select_media_stream('0:v:0'),
+		ffmpeg_builder.prevent_frame_drop(),
+		ffmpeg_builder.checksum_frames(),
+		ffmpeg_builder.cast_stream()
+	)
+	process = open_ffmpeg(commands)
+	stdout, _ = process.communicate()
+
+	if process.returncode == 0 and target_video_fps:
+		for line in stdout.decode().splitlines():
+			if line.startswith('#tb 0:'):
+				time_base_numerator, time_base_denominator = line.split(':')[1].split('/')
+				time_base = int(time_base_numerator) / int(time_base_denominator)
+			if line.startswith('0,'):
+				keyframe_timestamps.append(int(line.split(',')[1]))
+
+	for keyframe_timestamp in keyframe_timestamps:
+		keyframe_numbers.append(round((keyframe_timestamp - keyframe_timestamps[0]) * time_base * target_video_fps))
+	return keyframe_numbers
+
+
+def detect_video_start_time(target_path : str) -> float:
+	time_base = 0.0
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.set_input(target_path),
+		ffmpeg_builder.select_media_stream('0:v:0'),
+		ffmpeg_builder.select_frame_total(1),
+		ffmpeg_builder.checksum_frames(),
+		ffmpeg_builder.cast_stream()
+	)
+	process = open_ffmpeg(commands)
+	stdout, _ = process.communicate()
+
+	if process.returncode == 0:
+		for line in stdout.decode().splitlines():
+			if line.startswith('#tb 0:'):
+				time_base_numerator, time_base_denominator = line.split(':')[1].split('/')
+				time_base = int(time_base_numerator) / int(time_base_denominator)
+			if line.startswith('0,'):
+				return int(line.split(',')[1]) * time_base
+	return 0.0
+
+
+def extract_segment_frames(target_path : str, segment_index : int, video_segment : VideoSegment, temp_video_resolution : Resolution, temp_video_fps : Fps) -> bool:
+	target_video_fps = detect_video_fps(target_path)
+	target_video_start_time = detect_video_start_time(target_path)
+	keyframe_number = video_segment.get('keyframe_number')
+	temp_frames_pattern = get_temp_segment_frames_pattern(target_path, segment_index, '%08d')
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.seek_keyframe(keyframe_number, target_video_fps, target_video_start_time),
+		ffmpeg_builder.set_input(target_path),
+		ffmpeg_builder.set_media_resolution(pack_resolution(temp_video_resolution)),
+		ffmpeg_builder.set_frame_quality(0),
+		ffmpeg_builder.select_segment_range(video_segment.get('frame_start') - keyframe_number, video_segment.get('frame_end') - keyframe_number, temp_video_fps),
+		ffmpeg_builder.prevent_frame_drop(),
+		ffmpeg_builder.set_output(temp_frames_pattern)
+	)
+	process = run_ffmpeg(commands)
+	return process.returncode == 0
+
+
+def open_frame_reader(target_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> subprocess.Popen[bytes]:
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.set_input(target_path),
+		ffmpeg_builder.set_media_resolution(pack_resolution(temp_video_resolution)),
+		ffmpeg_builder.select_frame_range(trim_frame_start, trim_frame_end, temp_video_fps),
+		ffmpeg_builder.prevent_frame_drop(),
+		ffmpeg_builder.pipe_video(),
+		ffmpeg_builder.cast_stream()
+	)
+	return open_ffmpeg(commands)
+
+
+def read_video_frames(process : subprocess.Popen[bytes], temp_video_resolution : Resolution) -> Generator[VisionFrame, None, None]:
+	frame_width, frame_height = unpack_resolution(pack_resolution(temp_video_resolution))
+	frame_size = frame_width * frame_height * 3
+
+	while process_manager.is_processing():
+		frame_buffer = bytearray(frame_size)
+
+		if process.stdout.readinto(frame_buffer) < frame_size: #type:ignore[attr-defined]
+			break
+		yield numpy.frombuffer(frame_buffer, dtype = numpy.uint8).reshape(frame_height, frame_width, 3)
+
+
+def open_frame_writer(target_path : str, temp_video_fps : Fps, temp_frame_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps) -> subprocess.Popen[bytes]:
+	output_video_encoder = state_manager.get_item('output_video_encoder')
+	output_video_quality = state_manager.get_item('output_video_quality')
+	output_video_preset = state_manager.get_item('output_video_preset')
+	temp_video_path = get_temp_file_path(target_path)
+	temp_video_format = cast(VideoFormat, get_file_format(temp_video_path))
+
+	output_video_encoder = fix_video_encoder(temp_video_format, output_video_encoder)
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.pipe_video(),
+		ffmpeg_builder.set_media_resolution(pack_resolution(temp_frame_resolution)),
+		ffmpeg_builder.set_input_fps(temp_video_fps),
+		ffmpeg_builder.set_input('-'),
+		ffmpeg_builder.set_media_resolution(pack_resolution(output_video_resolution)),
+		ffmpeg_builder.set_video_encoder(output_video_encoder),
+		ffmpeg_builder.set_video_quality(output_video_encoder, output_video_quality),
+		ffmpeg_builder.set_video_preset(output_video_encoder, output_video_preset),
+		ffmpeg_builder.set_video_fps(output_video_fps),
+		ffmpeg_builder.set_pixel_format(output_video_encoder),
+		ffmpeg_builder.force_output(temp_video_path)
+	)
+	return open_ffmpeg(commands)
+
+
+def write_video_frame(process : subprocess.Popen[bytes], vision_frame : VisionFrame) -> bool:
+	try:
+		process.stdin.write(numpy.ascontiguousarray(vision_frame, dtype = numpy.uint8).data)
+		return True
+	except (BrokenPipeError, ValueError):
+		return False
+
+
+def close_frame_pipe(process : subprocess.Popen[bytes]) -> bool:
+	for stream in [ process.stdin, process.stdout ]:
+		if stream and not stream.closed:
+			try:
+				stream.close()
+			except BrokenPipeError:
+				continue
+	return process.wait() == 0
+
+
 def copy_image(target_path : str, temp_image_resolution : Resolution) -> bool:
 	temp_image_path = get_temp_file_path(target_path)
 	commands = ffmpeg_builder.chain(
@@ -239,6 +375,30 @@ def merge_video(target_path : str, temp_video_fps : Fps, output_video_resolution
 		return process.returncode == 0
 
 
+def merge_segment_video(target_path : str, segment_index : int, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps) -> bool:
+	output_video_encoder = state_manager.get_item('output_video_encoder')
+	output_video_quality = state_manager.get_item('output_video_quality')
+	output_video_preset = state_manager.get_item('output_video_preset')
+	temp_segment_path = get_temp_segment_file_path(target_path, segment_index)
+	temp_segment_format = cast(VideoFormat, get_file_format(temp_segment_path))
+	temp_frames_pattern = get_temp_segment_frames_pattern(target_path, segment_index, '%08d')
+
+	output_video_encoder = fix_video_encoder(temp_segment_format, output_video_encoder)
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.set_input_fps(temp_video_fps),
+		ffmpeg_builder.set_input(temp_frames_pattern),
+		ffmpeg_builder.set_media_resolution(pack_resolution(output_video_resolution)),
+		ffmpeg_builder.set_video_encoder(output_video_encoder),
+		ffmpeg_builder.set_video_quality(output_video_encoder, output_video_quality),
+		ffmpeg_builder.set_video_preset(output_video_encoder, output_video_preset),
+		ffmpeg_builder.set_video_fps(output_video_fps),
+		ffmpeg_builder.set_pixel_format(output_video_encoder),
+		ffmpeg_builder.force_output(temp_segment_path)
+	)
+	process = run_ffmpeg(commands)
+	return process.returncode == 0
+
+
 def concat_video(output_path : str, temp_output_paths : List[str]) -> bool:
 	concat_video_path = tempfile.mktemp()
 
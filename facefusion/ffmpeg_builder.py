@@ -88,6 +88,26 @@ def prevent_frame_drop() -> Commands:
 	return [ '-vsync', '0' ]
 
 
+def seek_keyframe(keyframe_number : int, video_fps : Fps, video_start_time : float) -> Commands:
+	return [ '-ss', str(max(video_start_time + (keyframe_number - 0.5) / video_fps, 0.0)) ]
+
+
+def select_segment_range(frame_start : int, frame_end : int, video_fps : Fps) -> Commands:
+	return [ '-vf', 'trim=start_frame=' + str(frame_start) + ':end_frame=' + str(frame_end) + ',setpts=PTS-STARTPTS,fps=' + str(video_fps) ]
+
+
+def skip_non_keyframes() -> Commands:
+	return [ '-skip_frame', 'nokey' ]
+
+
+def select_frame_total(frame_total : int) -> Commands:
+	return [ '-frames:v', str(frame_total) ]
+
+
+def checksum_frames() -> Commands:
+	return [ '-f', 'framecrc' ]
+
+
 def select_media_range(frame_start : int, frame_end : int, media_fps : Fps) -> Commands:
 	commands = []
 
@@ -212,6 +232,10 @@ def capture_video() -> Commands:
 	return [ '-f', 'rawvideo', '-pix_fmt', 'rgb24' ]
 
 
+def pipe_video() -> Commands:
+	return [ '-f', 'rawvideo', '-pix_fmt', 'bgr24' ]
+
+
 def ignore_video_stream() -> Commands:
 	return [ '-vn' ]
 
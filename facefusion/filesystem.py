@@ -4,6 +4,7 @@ import shutil
 from typing import List, Optional
 
 import facefusion.choices
+from facefusion.types import FileStamp
 
 
 def get_file_size(file_path : str) -> int:
@@ -12,6 +13,13 @@ def get_file_size(file_path : str) -> int:
 	return 0
 
 
+def create_file_stamp(file_path : str) -> Optional[FileStamp]:
+	if is_file(file_path):
+		file_stat = os.stat(file_path)
+		return file_stat.st_mtime_ns, file_stat.st_size
+	return None
+
+
 def get_file_name(file_path : str) -> Optional[str]:
 	file_name, _ = os.path.splitext(os.path.basename(file_path))
 
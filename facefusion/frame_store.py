@@ -0,0 +1,62 @@
+import threading
+from collections import deque
+from typing import Optional, Tuple
+
+import cv2
+import numpy
+
+from facefusion.types import FrameFingerprint, FrameStore, VisionFrame
+
+FRAME_STORE_LOCK : threading.Lock = threading.Lock()
+FRAME_STORE : FrameStore =\
+{
+	'reuse_frames': deque(maxlen = 8),
+	'frame_total': 0,
+	'reuse_total': 0
+}
+
+
+def get_frame_store() -> FrameStore:
+	return FRAME_STORE
+
+
+def create_frame_fingerprint(vision_frame : VisionFrame) -> FrameFingerprint:
+	frame_fingerprint = cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY)
+	frame_fingerprint = cv2.resize(frame_fingerprint, (32, 32), interpolation = cv2.INTER_AREA)
+	return frame_fingerprint.astype(numpy.float32)
+
+
+def calculate_fingerprint_distance(frame_fingerprint : FrameFingerprint, reuse_fingerprint : FrameFingerprint) -> float:
+	return numpy.mean(numpy.abs(frame_fingerprint - reuse_fingerprint)).item()
+
+
+def find_reuse_frame(frame_fingerprint : FrameFingerprint, target_vision_frame : VisionFrame, frame_reuse_threshold : float) -> Optional[VisionFrame]:
+	with FRAME_STORE_LOCK:
+		FRAME_STORE['frame_total'] += 1
+
+		for reuse_frame in reversed(FRAME_STORE.get('reuse_frames')):
+			if reuse_frame.get('target_shape') == target_vision_frame.shape and calculate_fingerprint_distance(frame_fingerprint, reuse_frame.get('frame_fingerprint')) < frame_reuse_threshold:
+				FRAME_STORE['reuse_total'] += 1
+				return reuse_frame.get('vision_frame')
+	return None
+
+
+def set_reuse_frame(frame_fingerprint : FrameFingerprint, target_vision_frame : VisionFrame, vision_frame : VisionFrame) -> None:
+	with FRAME_STORE_LOCK:
+		FRAME_STORE['reuse_frames'].append(
+		{
+			'frame_fingerprint': frame_fingerprint,
+			'target_shape': target_vision_frame.shape,
+			'vision_frame': vision_frame
+		})
+
+
+def get_reuse_totals() -> Tuple[int, int]:
+	return FRAME_STORE.get('reuse_total'), FRAME_STORE.get('frame_total')
+
+
+def clear_frame_store() -> None:
+	with FRAME_STORE_LOCK:
+		FRAME_STORE['reuse_frames'].clear()
+		FRAME_STORE['frame_total'] = 0
+		FRAME_STORE['reuse_total'] = 0
@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from facefusion.filesystem import is_image
+from facefusion.types import VisionFrame
+from facefusion.vision import read_image
+
+IMAGE_POOL_LOCK : threading.Lock = threading.Lock()
+IMAGE_POOL : Optional[ThreadPoolExecutor] = None
+IMAGE_READS : Dict[str, Future[Optional[VisionFrame]]] = {}
+
+
+def create_image_pool(image_thread_count : int) -> None:
+	global IMAGE_POOL
+
+	clear_image_pool()
+	IMAGE_POOL = ThreadPoolExecutor(max_workers = image_thread_count)
+
+
+def prefetch_images(image_paths : List[str]) -> None:
+	with IMAGE_POOL_LOCK:
+		if IMAGE_POOL:
+			for image_path in image_paths:
+				if image_path not in IMAGE_READS and is_image(image_path):
+					IMAGE_READS[image_path] = IMAGE_POOL.submit(read_image, image_path)
+
+
+def read_pool_image(image_path : str) -> Optional[VisionFrame]:
+	with IMAGE_POOL_LOCK:
+		image_read = IMAGE_READS.pop(image_path, None)
+
+	if image_read:
+		return image_read.result()
+	return read_image(image_path)
+
+
+def remove_pool_image(image_path : str) -> None:
+	with IMAGE_POOL_LOCK:
+		image_read = IMAGE_READS.pop(image_path, None)
+
+	if image_read:
+		image_read.cancel()
+
+
+def clear_image_pool() -> None:
+	global IMAGE_POOL
+
+	with IMAGE_POOL_LOCK:
+		if IMAGE_POOL:
+			IMAGE_POOL.shutdown(wait = True, cancel_futures = True)
+			IMAGE_POOL = None
+		IMAGE_READS.clear()
@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from facefusion import state_manager
+from facefusion.filesystem import create_file_stamp
+from facefusion.types import ImageStore, VisionFrame
+
+IMAGE_STORE_LOCK : threading.Lock = threading.Lock()
+IMAGE_STORE : ImageStore =\
+{
+	'static_images': OrderedDict(),
+	'static_images_size': 0,
+	'hit_total': 0,
+	'miss_total': 0
+}
+
+
+def get_image_store() -> ImageStore:
+	return IMAGE_STORE
+
+
+def get_static_image(image_path : str) -> Optional[VisionFrame]:
+	file_stamp = create_file_stamp(image_path)
+
+	with IMAGE_STORE_LOCK:
+		static_image = IMAGE_STORE.get('static_images').get(image_path)
+
+		if not static_image or static_image.get('file_stamp') != file_stamp:
+			IMAGE_STORE['miss_total'] += 1
+			return None
+
+		IMAGE_STORE['hit_total'] += 1
+		IMAGE_STORE.get('static_images').move_to_end(image_path)
+		return static_image.get('vision_frame')
+
+
+def set_static_image(image_path : str, vision_frame : VisionFrame) -> None:
+	file_stamp = create_file_stamp(image_path)
+
+	if file_stamp:
+		with IMAGE_STORE_LOCK:
+			remove_static_image(image_path)
+			IMAGE_STORE['static_images'][image_path] =\
+			{
+				'file_stamp': file_stamp,
+				'vision_frame': vision_frame
+			}
+			IMAGE_STORE['static_images_size'] += vision_frame.nbytes
+			evict_static_images()
+
+
+def remove_static_image(image_path : str) -> None:
+	static_image = IMAGE_STORE.get('static_images').pop(image_path, None)
+
+	if static_image:
+		IMAGE_STORE['static_images_size'] -= static_image.get('vision_frame').nbytes
+
+
+def evict_static_images() -> None:
+	image_store_memory_limit = state_manager.get_item('image_store_memory_limit')
+
+	while IMAGE_STORE.get('static_images'):
+		if image_store_memory_limit and IMAGE_STORE.get('static_images_size') > image_store_memory_limit * 1024 ** 2:
+			remove_static_image(next(iter(IMAGE_STORE.get('static_images'))))
+			continue
+		break
+
+
+def get_image_store_totals() -> Tuple[int, int]:
+	return IMAGE_STORE.get('hit_total'), IMAGE_STORE.get('miss_total')
+
+
+def clear_static_images() -> None:
+	with IMAGE_STORE_LOCK:
+		IMAGE_STORE['static_images'].clear()
+		IMAGE_STORE['static_images_size'] = 0
+		IMAGE_STORE['hit_total'] = 0
+		IMAGE_STORE['miss_total'] = 0
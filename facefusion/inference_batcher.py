@@ -0,0 +1,160 @@
+import threading
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy
+from numpy.typing import NDArray
+from onnxruntime import InferenceSession
+
+from facefusion import logger, state_manager, wording
+from facefusion.inference_profiler import add_inference_wait
+from facefusion.types import InferenceBatch, InferenceBatchKey, InferenceBatchRequest, InferenceBatchStatistic, InferenceBatchStatisticSet
+
+INFERENCE_BATCH_LOCK : threading.Lock = threading.Lock()
+INFERENCE_BATCH_STATISTIC_SET : InferenceBatchStatisticSet = {}
+
+
+def has_inference_batch(inference_session : InferenceSession) -> bool:
+	session_shapes = [ session_node.shape for session_node in inference_session.get_inputs() + inference_session.get_outputs() ]
+	return all(session_shape and not isinstance(session_shape[0], int) for session_shape in session_shapes)
+
+
+def batch_inference_session(inference_context : str, inference_session : InferenceSession) -> InferenceSession:
+	inference_batch : InferenceBatch =\
+	{
+		'condition': threading.Condition(),
+		'request_set': {}
+	}
+	setattr(inference_session, 'run', partial(run_batch_inference_session, inference_context, inference_batch, inference_session.run))
+	return inference_session
+
+
+def create_batch_key(output_names : Optional[List[str]], input_feed : Dict[str, Any]) -> Optional[InferenceBatchKey]:
+	batch_key = [ tuple(output_names) if output_names else None ]
+	batch_counts = set()
+
+	for input_name, input_value in sorted(input_feed.items()):
+		if not isinstance(input_value, numpy.ndarray) or input_value.ndim == 0:
+			return None
+		batch_counts.add(input_value.shape[0])
+		batch_key.append((input_name, input_value.shape[1:], input_value.dtype.str))
+
+	if len(batch_counts) == 1:
+		return tuple(batch_key)
+	return None
+
+
+def run_batch_inference_session(inference_context : str, inference_batch : InferenceBatch, inference_session_run : Callable[..., Any], output_names : Optional[List[str]], input_feed : Dict[str, Any], run_options : Any = None) -> Any:
+	batch_key = create_batch_key(output_names, input_feed)
+
+	if run_options or not batch_key:
+		return inference_session_run(output_names, input_feed, run_options)
+
+	execution_batch_size = state_manager.get_item('execution_batch_size')
+	execution_batch_timeout = state_manager.get_item('execution_batch_timeout') / 1000
+	condition = inference_batch.get('condition')
+	request_set = inference_batch.get('request_set')
+	batch_request : InferenceBatchRequest =\
+	{
+		'input_feed': input_feed,
+		'outputs': [],
+		'error': None,
+		'event': threading.Event(),
+		'start_time': perf_counter(),
+		'wait_time': 0.0
+	}
+
+	with condition:
+		batch_requests = request_set.setdefault(batch_key, [])
+		batch_requests.append(batch_request)
+		is_batch_leader = len(batch_requests) == 1
+
+		if len(batch_requests) >= execution_batch_size:
+			request_set.pop(batch_key)
+			condition.notify_all()
+
+		if is_batch_leader:
+			condition.wait_for(lambda: request_set.get(batch_key) is not batch_requests, execution_batch_timeout)
+
+			if request_set.get(batch_key) is batch_requests:
+				request_set.pop(batch_key)
+
+	if is_batch_leader:
+		for batch_request_item in batch_requests:
+			batch_request_item['wait_time'] = perf_counter() - batch_request_item.get('start_time')
+		update_batch_statistic(inference_context, len(batch_requests), batch_request.get('wait_time'))
+		run_batch_requests(inference_session_run, output_names, batch_requests)
+	else:
+		batch_request.get('event').wait()
+
+	add_inference_wait(batch_request.get('wait_time'))
+
+	if batch_request.get('error'):
+		raise batch_request.get('error')
+	return batch_request.get('outputs')
+
+
+def run_batch_requests(inference_session_run : Callable[..., Any], output_names : Optional[List[str]], batch_requests : List[InferenceBatchRequest]) -> None:
+	try:
+		if len(batch_requests) == 1:
+			batch_requests[0]['outputs'] = inference_session_run(output_names, batch_requests[0].get('input_feed'))
+			return
+
+		batch_counts = [ get_batch_count(batch_request) for batch_request in batch_requests ]
+		input_feed = { input_name: numpy.concatenate([ batch_request.get('input_feed').get(input_name) for batch_request in batch_requests ]) for input_name in batch_requests[0].get('input_feed') }
+		outputs = inference_session_run(output_names, input_feed)
+
+		if all(isinstance(output, numpy.ndarray) and output.ndim and output.shape[0] == sum(batch_counts) for output in outputs):
+			scatter_batch_outputs(batch_requests, batch_counts, outputs)
+		else:
+			for batch_request in batch_requests:
+				batch_request['outputs'] = inference_session_run(output_names, batch_request.get('input_feed'))
+
+	except Exception as exception:
+		for batch_request in batch_requests:
+			batch_request['error'] = exception
+
+	finally:
+		for batch_request in batch_requests:
+			batch_request.get('event').set()
+
+
+def get_batch_count(batch_request : InferenceBatchRequest) -> int:
+	return next(iter(batch_request.get('input_feed').values())).shape[0]
+
+
+def scatter_batch_outputs(batch_requests : List[InferenceBatchRequest], batch_counts : List[int], outputs : List[NDArray[Any]]) -> None:
+	batch_start = 0
+
+	for batch_request, batch_count in zip(batch_requests, batch_counts):
+		batch_request['outputs'] = [ output[batch_start:batch_start + batch_count] for output in outputs ]
+		batch_start += batch_count
+
+
+def get_batch_statistic(inference_context : str) -> InferenceBatchStatistic:
+	if inference_context not in INFERENCE_BATCH_STATISTIC_SET:
+		INFERENCE_BATCH_STATISTIC_SET[inference_context] =\
+		{
+			'batch_total': 0,
+			'request_total': 0,
+			'wait_time': 0.0
+		}
+	return INFERENCE_BATCH_STATISTIC_SET.get(inference_context)
+
+
+def update_batch_statistic(inference_context : str, request_total : int, wait_time : float) -> None:
+	with INFERENCE_BATCH_LOCK:
+		batch_statistic = get_batch_statistic(inference_context)
+		batch_statistic['batch_total'] += 1
+		batch_statistic['request_total'] += request_total
+		batch_statistic['wait_time'] += wait_time
+
+
+def report_inference_batches() -> None:
+	with INFERENCE_BATCH_LOCK:
+		for inference_context, batch_statistic in INFERENCE_BATCH_STATISTIC_SET.items():
+			if batch_statistic.get('batch_total'):
+				wait_time = round(batch_statistic.get('wait_time') / batch_statistic.get('batch_total') * 1000, 2)
+				logger.debug(wording.get('inference_batch_load').format(inference_context = inference_context, request_total = batch_statistic.get('request_total'), batch_total = batch_statistic.get('batch_total'), wait_time = wait_time), __name__)
+		INFERENCE_BATCH_STATISTIC_SET.clear()
@@ -0,0 +1,79 @@
+import threading
+import weakref
+from typing import Any, Dict, List, Tuple
+
+import numpy
+from numpy.typing import NDArray
+from onnxruntime import IOBinding, InferenceSession
+
+import facefusion.choices
+from facefusion import state_manager
+from facefusion.types import InferenceBinding, SessionMemoryOption
+
+INFERENCE_BINDER : threading.local = threading.local()
+
+
+def resolve_session_memory_options() -> List[SessionMemoryOption]:
+	session_memory_options = state_manager.get_item('session_memory_options')
+
+	if session_memory_options is None:
+		return facefusion.choices.session_memory_options
+	return session_memory_options
+
+
+def has_inference_binding() -> bool:
+	session_memory_options = resolve_session_memory_options()
+	execution_batch_size = state_manager.get_item('execution_batch_size') or 1
+	return 'io_binding' in session_memory_options and execution_batch_size == 1
+
+
+def get_inference_binding(inference_session : InferenceSession) -> InferenceBinding:
+	if not hasattr(INFERENCE_BINDER, 'binding_set'):
+		INFERENCE_BINDER.binding_set = weakref.WeakKeyDictionary()
+
+	if inference_session not in INFERENCE_BINDER.binding_set:
+		INFERENCE_BINDER.binding_set[inference_session] =\
+		{
+			'io_binding': inference_session.io_binding(),
+			'output_buffer_set': {}
+		}
+	return INFERENCE_BINDER.binding_set.get(inference_session)
+
+
+def create_binding_key(input_feed : Dict[str, NDArray[Any]]) -> Tuple[Any, ...]:
+	return tuple((input_name, input_value.shape, input_value.dtype.str) for input_name, input_value in sorted(input_feed.items()))
+
+
+def run_inference_binding(inference_session : InferenceSession, input_feed : Dict[str, NDArray[Any]]) -> List[NDArray[Any]]:
+	# outputs are the per thread buffers of the input shape, the next run with that shape overwrites them
+	if not has_inference_binding():
+		return inference_session.run(None, input_feed)
+
+	input_feed = { input_name: numpy.ascontiguousarray(input_value) for input_name, input_value in input_feed.items() }
+	inference_binding = get_inference_binding(inference_session)
+	binding_key = create_binding_key(input_feed)
+	output_buffers = inference_binding.get('output_buffer_set').get(binding_key)
+
+	if not output_buffers:
+		outputs = inference_session.run(None, input_feed)
+		output_buffers = [ numpy.empty_like(output) for output in outputs ]
+		inference_binding['output_buffer_set'][binding_key] = output_buffers
+
+		for output, output_buffer in zip(outputs, output_buffers):
+			numpy.copyto(output_buffer, output)
+		return output_buffers
+
+	bind_inference_session(inference_session, inference_binding.get('io_binding'), input_feed, output_buffers)
+	inference_session.run_with_iobinding(inference_binding.get('io_binding'))
+	return output_buffers
+
+
+def bind_inference_session(inference_session : InferenceSession, io_binding : IOBinding, input_feed : Dict[str, NDArray[Any]], output_buffers : List[NDArray[Any]]) -> None:
+	io_binding.clear_binding_inputs()
+	io_binding.clear_binding_outputs()
+
+	for input_name, input_value in input_feed.items():
+		io_binding.bind_cpu_input(input_name, input_value)
+
+	for session_output, output_buffer in zip(inference_session.get_outputs(), output_buffers):
+		io_binding.bind_output(session_output.name, 'cpu', 0, output_buffer.dtype, output_buffer.shape, output_buffer.ctypes.data)
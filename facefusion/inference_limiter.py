@@ -0,0 +1,134 @@
+import threading
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, cast
+
+from onnxruntime import InferenceSession
+
+from facefusion import config, logger, state_manager, wording
+from facefusion.inference_profiler import add_inference_wait
+from facefusion.types import InferenceLimit, SessionConcurrencyMode
+
+INFERENCE_LIMIT_WINDOW : int = 16
+INFERENCE_LIMIT_TOLERANCE : float = 0.9
+INFERENCE_LIMIT_RECOVERY : int = 8
+
+
+def limit_inference_session(model_name : str, inference_session : InferenceSession) -> InferenceSession:
+	session_section = 'session.' + model_name
+	session_concurrency_mode = cast(SessionConcurrencyMode, config.get_str_value(session_section, 'session_concurrency_mode', state_manager.get_item('session_concurrency_mode')))
+	session_concurrency_limit = config.get_int_value(session_section, 'session_concurrency_limit', str(state_manager.get_item('session_concurrency_limit') or 0))
+
+	if session_concurrency_mode == 'static' and not session_concurrency_limit:
+		return inference_session
+	inference_limit = create_inference_limit(session_concurrency_mode, session_concurrency_limit or state_manager.get_item('execution_thread_count') or 1)
+
+	setattr(inference_session, 'run', partial(run_limit_inference_session, model_name, inference_limit, inference_session.run))
+	setattr(inference_session, 'run_with_iobinding', partial(run_limit_inference_session, model_name, inference_limit, inference_session.run_with_iobinding))
+	return inference_session
+
+
+def create_inference_limit(session_concurrency_mode : SessionConcurrencyMode, session_concurrency_limit : int) -> InferenceLimit:
+	inference_limit : InferenceLimit =\
+	{
+		'concurrency_mode': session_concurrency_mode,
+		'condition': threading.Condition(),
+		'active_total': 0,
+		'limit_total': session_concurrency_limit,
+		'limit_ceiling': session_concurrency_limit,
+		'limit_max': session_concurrency_limit,
+		'recovery_total': 0,
+		'busy_start': perf_counter(),
+		'window_total': 0,
+		'window_wait_total': 0,
+		'window_run_time': 0.0,
+		'window_busy_time': 0.0,
+		'throughput': 0.0,
+		'latency': 0.0
+	}
+
+	if session_concurrency_mode == 'adaptive':
+		inference_limit['limit_total'] = 1
+	return inference_limit
+
+
+def run_limit_inference_session(model_name : str, inference_limit : InferenceLimit, inference_session_run : Callable[..., Any], *args : Any, **kwargs : Any) -> Any:
+	condition = inference_limit.get('condition')
+	wait_start = perf_counter()
+
+	with condition:
+		if inference_limit.get('active_total') >= inference_limit.get('limit_total'):
+			inference_limit['window_wait_total'] += 1
+		condition.wait_for(lambda: inference_limit.get('active_total') < inference_limit.get('limit_total'))
+
+		if not inference_limit.get('active_total'):
+			inference_limit['busy_start'] = perf_counter()
+		inference_limit['active_total'] += 1
+
+	start_time = perf_counter()
+	add_inference_wait(start_time - wait_start)
+
+	try:
+		return inference_session_run(*args, **kwargs)
+	finally:
+		with condition:
+			inference_limit['active_total'] -= 1
+
+			if not inference_limit.get('active_total'):
+				inference_limit['window_busy_time'] += perf_counter() - inference_limit.get('busy_start')
+			if inference_limit.get('concurrency_mode') == 'adaptive':
+				update_inference_limit(model_name, inference_limit, perf_counter() - start_time)
+			condition.notify_all()
+
+
+def update_inference_limit(model_name : str, inference_limit : InferenceLimit, run_time : float) -> None:
+	inference_limit['window_total'] += 1
+	inference_limit['window_run_time'] += run_time
+
+	if inference_limit.get('window_total') >= INFERENCE_LIMIT_WINDOW:
+		if inference_limit.get('active_total'):
+			inference_limit['window_busy_time'] += perf_counter() - inference_limit.get('busy_start')
+			inference_limit['busy_start'] = perf_counter()
+		throughput = inference_limit.get('window_total') / max(inference_limit.get('window_busy_time'), 1e-6)
+		latency = inference_limit.get('window_run_time') / inference_limit.get('window_total')
+		limit_total = resolve_inference_limit(inference_limit, throughput, latency)
+		recover_inference_limit(inference_limit, limit_total)
+
+		if limit_total != inference_limit.get('limit_total'):
+			logger.debug(wording.get('inference_concurrency_limit').format(model_name = model_name, limit_total = limit_total, throughput = round(throughput, 2), latency = round(latency * 1000, 2)), __name__)
+
+		if inference_limit.get('window_wait_total'):
+			inference_limit['throughput'] = throughput
+		if inference_limit.get('limit_total') == 1:
+			inference_limit['latency'] = min(inference_limit.get('latency') or latency, latency)
+		inference_limit['limit_total'] = limit_total
+		inference_limit['window_total'] = 0
+		inference_limit['window_wait_total'] = 0
+		inference_limit['window_run_time'] = 0.0
+		inference_limit['window_busy_time'] = 0.0
+
+
+def recover_inference_limit(inference_limit : InferenceLimit, limit_total : int) -> None:
+	if limit_total < inference_limit.get('limit_total'):
+		inference_limit['limit_ceiling'] = limit_total
+		inference_limit['recovery_total'] = 0
+	elif inference_limit.get('limit_ceiling') < inference_limit.get('limit_max'):
+		inference_limit['recovery_total'] += 1
+
+		if inference_limit.get('recovery_total') >= INFERENCE_LIMIT_RECOVERY:
+			inference_limit['limit_ceiling'] += 1
+			inference_limit['recovery_total'] = 0
+
+
+def resolve_inference_limit(inference_limit : InferenceLimit, throughput : float, latency : float) -> int:
+	limit_total = inference_limit.get('limit_total')
+
+	if not inference_limit.get('window_wait_total'):
+		return limit_total
+	if limit_total > 1 and throughput < inference_limit.get('throughput') * INFERENCE_LIMIT_TOLERANCE:
+		return limit_total - 1
+	if limit_total > 1 and latency * INFERENCE_LIMIT_TOLERANCE > inference_limit.get('latency') * limit_total:
+		return limit_total - 1
+	if limit_total < inference_limit.get('limit_ceiling'):
+		return limit_total + 1
+	return limit_total
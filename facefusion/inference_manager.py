@@ -1,67 +1,188 @@
 import importlib
-import random
-from time import sleep, time
-from typing import List
+import os
+import threading
+from collections import OrderedDict
+from functools import partial
+from time import perf_counter, sleep, time
+from typing import Any, Callable, Dict, List
 
-from onnxruntime import InferenceSession
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
 
-from facefusion import logger, process_manager, state_manager, wording
+import facefusion.choices
+from facefusion import config, logger, process_manager, state_manager, wording
 from facefusion.app_context import detect_app_context
+from facefusion.common_helper import get_first
 from facefusion.execution import create_inference_session_providers
 from facefusion.exit_helper import fatal_exit
-from facefusion.filesystem import get_file_name, is_file
+from facefusion.filesystem import create_directory, get_file_name, get_file_size, is_file, resolve_relative_path
+from facefusion.inference_batcher import batch_inference_session, has_inference_batch, report_inference_batches
+from facefusion.inference_binder import resolve_session_memory_options
+from facefusion.inference_limiter import limit_inference_session
+from facefusion.inference_profiler import profile_inference_session
+from facefusion.model_helper import resolve_quantize_model_path
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet
+from facefusion.types import DownloadSet, ExecutionProvider, InferenceLoad, InferenceLoadSet, InferencePool, InferencePoolSet, InferenceResidencySet
 
 INFERENCE_POOL_SET : InferencePoolSet =\
 {
 	'cli': {},
 	'ui': {}
 }
+INFERENCE_LOAD_LOCK : threading.Lock = threading.Lock()
+INFERENCE_LOAD_SET : InferenceLoadSet = {}
+INFERENCE_CONTEXT_LOCKS : Dict[str, threading.Lock] = {}
+INFERENCE_RESIDENCY_LOCK : threading.Lock = threading.Lock()
+INFERENCE_RESIDENCY_SET : InferenceResidencySet = OrderedDict()
+INFERENCE_MEMORY_FACTOR : float = 1.5
+MODEL_CACHE_PATH : str = resolve_relative_path('../.caches')
 
 
 def get_inference_pool(module_name : str, model_names : List[str], model_source_set : DownloadSet) -> InferencePool:
 	while process_manager.is_checking():
 		sleep(0.5)
 	execution_device_ids = state_manager.get_item('execution_device_ids')
+	execution_replica_count = state_manager.get_item('execution_replica_count') or 1
 	execution_providers = resolve_execution_providers(module_name)
 	app_context = detect_app_context()
+	inference_pools : Dict[str, InferencePool] = {}
 
 	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+		for replica_index in range(execution_replica_count):
+			inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers, replica_index)
 
-		if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
-			INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
-		if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
-			INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
-		if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, execution_device_id, execution_providers)
+			with get_inference_context_lock(inference_context):
+				if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
+					INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
+				if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
+					INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
+				if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
+					inference_size = calculate_inference_size(model_source_set)
+					evict_inference_pools(inference_size, list(inference_pools.keys()) + [ inference_context ])
+					INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(inference_context, model_source_set, execution_device_id, execution_providers)
+					set_inference_residency(inference_context, inference_size)
+				inference_pools[inference_context] = INFERENCE_POOL_SET.get(app_context).get(inference_context)
 
-	current_inference_context = get_inference_context(module_name, model_names, random.choice(execution_device_ids), execution_providers)
-	return INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
+	current_inference_context = select_inference_context(list(inference_pools.keys()))
+	touch_inference_residency(current_inference_context)
+	return inference_pools.get(current_inference_context)
 
 
-def create_inference_pool(model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferencePool:
+def get_inference_pools(module_name : str) -> List[InferencePool]:
+	app_context = detect_app_context()
+	return [ inference_pool for inference_context, inference_pool in list(INFERENCE_POOL_SET.get(app_context).items()) if inference_context.startswith(module_name + '.') ]
+
+
+def get_inference_context_lock(inference_context : str) -> threading.Lock:
+	with INFERENCE_LOAD_LOCK:
+		if inference_context not in INFERENCE_CONTEXT_LOCKS:
+			INFERENCE_CONTEXT_LOCKS[inference_context] = threading.Lock()
+		return INFERENCE_CONTEXT_LOCKS.get(inference_context)
+
+
+def create_inference_pool(inference_context : str, model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferencePool:
+	execution_batch_size = state_manager.get_item('execution_batch_size') or 1
 	inference_pool : InferencePool = {}
 
 	for model_name in model_source_set.keys():
 		model_path = model_source_set.get(model_name).get('path')
 		if is_file(model_path):
-			inference_pool[model_name] = create_inference_session(model_path, execution_device_id, execution_providers)
+			inference_session = create_inference_session(model_path, execution_device_id, execution_providers)
+			inference_session = limit_inference_session(get_file_name(model_path), inference_session)
+
+			if execution_batch_size > 1 and has_inference_batch(inference_session):
+				inference_session = batch_inference_session(inference_context, inference_session)
+			inference_session = track_inference_session(inference_context, inference_session)
+
+			if state_manager.get_item('inference_profile'):
+				inference_session = profile_inference_session(get_file_name(model_path), inference_session)
+			inference_pool[model_name] = inference_session
 
 	return inference_pool
 
 
 def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 	execution_device_ids = state_manager.get_item('execution_device_ids')
+	execution_replica_count = state_manager.get_item('execution_replica_count') or 1
 	execution_providers = resolve_execution_providers(module_name)
 	app_context = detect_app_context()
 
 	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+		for replica_index in range(execution_replica_count):
+			inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers, replica_index)
+
+			if INFERENCE_POOL_SET.get(app_context).get(inference_context):
+				del INFERENCE_POOL_SET[app_context][inference_context]
+			if not INFERENCE_POOL_SET.get('cli').get(inference_context) and not INFERENCE_POOL_SET.get('ui').get(inference_context):
+				remove_inference_residency(inference_context)
+
+
+def calculate_inference_size(model_source_set : DownloadSet) -> int:
+	model_size = sum(get_file_size(model_source.get('path')) for model_source in model_source_set.values())
+	return int(model_size * INFERENCE_MEMORY_FACTOR)
+
+
+def set_inference_residency(inference_context : str, inference_size : int) -> None:
+	with INFERENCE_RESIDENCY_LOCK:
+		INFERENCE_RESIDENCY_SET[inference_context] = inference_size
+
+
+def touch_inference_residency(inference_context : str) -> None:
+	with INFERENCE_RESIDENCY_LOCK:
+		if inference_context in INFERENCE_RESIDENCY_SET:
+			INFERENCE_RESIDENCY_SET.move_to_end(inference_context)
+
+
+def remove_inference_residency(inference_context : str) -> None:
+	with INFERENCE_RESIDENCY_LOCK:
+		INFERENCE_RESIDENCY_SET.pop(inference_context, None)
 
-		if INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			del INFERENCE_POOL_SET[app_context][inference_context]
+
+def get_inference_residency_size() -> int:
+	with INFERENCE_RESIDENCY_LOCK:
+		return sum(INFERENCE_RESIDENCY_SET.values())
+
+
+def evict_inference_pools(inference_size : int, keep_inference_contexts : List[str]) -> None:
+	inference_memory_limit = state_manager.get_item('inference_memory_limit')
+
+	if inference_memory_limit:
+		for inference_context in release_inference_contexts(inference_size, inference_memory_limit * 1024 ** 2, keep_inference_contexts):
+			logger.debug(wording.get('unloading_model_succeeded').format(inference_context = inference_context), __name__)
+
+
+def release_inference_pools() -> None:
+	inference_memory_limit = state_manager.get_item('inference_memory_limit') or 0
+
+	for inference_context in release_inference_contexts(0, inference_memory_limit * 1024 ** 2, []):
+		logger.debug(wording.get('unloading_model_succeeded').format(inference_context = inference_context), __name__)
+
+
+def release_inference_contexts(inference_size : int, inference_memory_limit : int, keep_inference_contexts : List[str]) -> List[str]:
+	evict_inference_contexts = []
+
+	with INFERENCE_LOAD_LOCK, INFERENCE_RESIDENCY_LOCK:
+		residency_size = sum(INFERENCE_RESIDENCY_SET.values())
+
+		for inference_context, residency_inference_size in list(INFERENCE_RESIDENCY_SET.items()):
+			if residency_size + inference_size <= inference_memory_limit:
+				break
+			inference_context_lock = INFERENCE_CONTEXT_LOCKS.get(inference_context)
+
+			if inference_context in keep_inference_contexts or get_inference_load(inference_context).get('active_total'):
+				continue
+			if not inference_context_lock or not inference_context_lock.acquire(blocking = False):
+				continue
+
+			try:
+				for app_context in INFERENCE_POOL_SET.keys():
+					INFERENCE_POOL_SET.get(app_context).pop(inference_context, None)
+				del INFERENCE_RESIDENCY_SET[inference_context]
+			finally:
+				inference_context_lock.release()
+			residency_size -= residency_inference_size
+			evict_inference_contexts.append(inference_context)
+
+	return evict_inference_contexts
 
 
 def create_inference_session(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferenceSession:
@@ -70,7 +191,22 @@ def create_inference_session(model_path : str, execution_device_id : str, execut
 
 	try:
 		inference_session_providers = create_inference_session_providers(execution_device_id, execution_providers)
-		inference_session = InferenceSession(model_path, providers = inference_session_providers)
+		session_options = create_session_options(model_file_name)
+		model_path = resolve_session_model_path(model_file_name, model_path)
+
+		if state_manager.get_item('session_model_cache') and has_model_cache(execution_providers):
+			cache_model_path = get_cache_model_path(get_file_name(model_path), execution_providers, session_options)
+
+			if is_file(cache_model_path) and os.path.getmtime(cache_model_path) >= os.path.getmtime(model_path):
+				model_path = cache_model_path
+				session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+			elif create_directory(MODEL_CACHE_PATH):
+				session_options.optimized_model_filepath = get_temp_cache_model_path(cache_model_path)
+
+		inference_session = InferenceSession(model_path, sess_options = session_options, providers = inference_session_providers)
+
+		if session_options.optimized_model_filepath and is_file(session_options.optimized_model_filepath):
+			os.replace(session_options.optimized_model_filepath, cache_model_path)
 		logger.debug(wording.get('loading_model_succeeded').format(model_name = model_file_name, seconds = calculate_end_time(start_time)), __name__)
 		return inference_session
 
@@ -79,8 +215,115 @@ def create_inference_session(model_path : str, execution_device_id : str, execut
 		fatal_exit(1)
 
 
-def get_inference_context(module_name : str, model_names : List[str], execution_device_id : str, execution_providers : List[ExecutionProvider]) -> str:
+def create_session_options(model_name : str) -> SessionOptions:
+	session_section = 'session.' + model_name
+	session_intra_op_thread_count = config.get_int_value(session_section, 'session_intra_op_thread_count', str(state_manager.get_item('session_intra_op_thread_count')))
+	session_inter_op_thread_count = config.get_int_value(session_section, 'session_inter_op_thread_count', str(state_manager.get_item('session_inter_op_thread_count')))
+	session_execution_mode = config.get_str_value(session_section, 'session_execution_mode', state_manager.get_item('session_execution_mode'))
+	session_graph_optimization = config.get_str_value(session_section, 'session_graph_optimization', state_manager.get_item('session_graph_optimization'))
+	session_memory_options = config.get_str_list(session_section, 'session_memory_options', ' '.join(resolve_session_memory_options())) or []
+	session_options = SessionOptions()
+
+	if session_intra_op_thread_count:
+		session_options.intra_op_num_threads = session_intra_op_thread_count
+	if session_inter_op_thread_count:
+		session_options.inter_op_num_threads = session_inter_op_thread_count
+	if session_execution_mode in facefusion.choices.session_execution_modes:
+		session_options.execution_mode = facefusion.choices.session_execution_mode_set.get(session_execution_mode)
+	if session_graph_optimization in facefusion.choices.session_graph_optimizations:
+		session_options.graph_optimization_level = facefusion.choices.session_graph_optimization_set.get(session_graph_optimization)
+	session_options.enable_mem_pattern = 'memory_pattern' in session_memory_options
+	session_options.enable_cpu_mem_arena = 'cpu_arena' in session_memory_options
+	return session_options
+
+
+def resolve_session_model_path(model_name : str, model_path : str) -> str:
+	session_model_precision = config.get_str_value('session.' + model_name, 'session_model_precision', state_manager.get_item('session_model_precision'))
+	quantize_model_path = resolve_quantize_model_path(model_path)
+
+	if session_model_precision == 'int8' and is_file(quantize_model_path):
+		return quantize_model_path
+	return model_path
+
+
+def has_model_cache(execution_providers : List[ExecutionProvider]) -> bool:
+	return all(execution_provider in [ 'cpu', 'cuda', 'directml', 'rocm' ] for execution_provider in execution_providers)
+
+
+def get_cache_model_path(model_name : str, execution_providers : List[ExecutionProvider], session_options : SessionOptions) -> str:
+	session_graph_optimization = get_first([ graph_optimization for graph_optimization, graph_optimization_level in facefusion.choices.session_graph_optimization_set.items() if graph_optimization_level == session_options.graph_optimization_level ])
+	cache_model_name = '.'.join([ model_name ] + list(execution_providers) + [ session_graph_optimization ])
+	return os.path.join(MODEL_CACHE_PATH, cache_model_name + '.onnx')
+
+
+def get_temp_cache_model_path(cache_model_path : str) -> str:
+	return cache_model_path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.tmp'
+
+
+def track_inference_session(inference_context : str, inference_session : InferenceSession) -> InferenceSession:
+	setattr(inference_session, 'run', partial(run_inference_session, inference_context, inference_session.run))
+	setattr(inference_session, 'run_with_iobinding', partial(run_inference_session, inference_context, inference_session.run_with_iobinding))
+	return inference_session
+
+
+def run_inference_session(inference_context : str, inference_session_run : Callable[..., Any], *args : Any, **kwargs : Any) -> Any:
+	start_time = perf_counter()
+
+	with INFERENCE_LOAD_LOCK:
+		get_inference_load(inference_context)['active_total'] += 1
+
+	try:
+		return inference_session_run(*args, **kwargs)
+	finally:
+		with INFERENCE_LOAD_LOCK:
+			inference_load = get_inference_load(inference_context)
+			inference_load['active_total'] -= 1
+			inference_load['request_total'] += 1
+			inference_load['busy_time'] += perf_counter() - start_time
+
+
+def get_inference_load(inference_context : str) -> InferenceLoad:
+	if inference_context not in INFERENCE_LOAD_SET:
+		INFERENCE_LOAD_SET[inference_context] =\
+		{
+			'active_total': 0,
+			'request_total': 0,
+			'busy_time': 0.0,
+			'start_time': perf_counter()
+		}
+	return INFERENCE_LOAD_SET.get(inference_context)
+
+
+def select_inference_context(inference_contexts : List[str]) -> str:
+	with INFERENCE_LOAD_LOCK:
+		return min(inference_contexts, key = lambda inference_context: (get_inference_load(inference_context).get('active_total'), get_inference_load(inference_context).get('request_total')))
+
+
+def calculate_inference_utilization(inference_load : InferenceLoad) -> float:
+	inference_time = perf_counter() - inference_load.get('start_time')
+
+	if inference_time > 0:
+		return min(inference_load.get('busy_time') / inference_time, 1.0)
+	return 0.0
+
+
+def report_inference_loads() -> None:
+	report_inference_batches()
+
+	with INFERENCE_LOAD_LOCK:
+		for inference_context, inference_load in INFERENCE_LOAD_SET.items():
+			if inference_load.get('request_total'):
+				logger.debug(wording.get('inference_replica_load').format(inference_context = inference_context, request_total = inference_load.get('request_total'), utilization = round(calculate_inference_utilization(inference_load) * 100, 1)), __name__)
+			inference_load['request_total'] = 0
+			inference_load['busy_time'] = 0.0
+			inference_load['start_time'] = perf_counter()
+
+
+def get_inference_context(module_name : str, model_names : List[str], execution_device_id : str, execution_providers : List[ExecutionProvider], replica_index : int) -> str:
 	inference_context = '.'.join([ module_name ] + model_names + [ execution_device_id ] + list(execution_providers))
+
+	if replica_index > 0:
+		inference_context += '#' + str(replica_index)
 	return inference_context
 
 
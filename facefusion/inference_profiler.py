@@ -0,0 +1,90 @@
+import threading
+from contextlib import contextmanager
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Iterator, List
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.cli_helper import render_table
+from facefusion.json import write_json
+from facefusion.types import InferenceProfile, InferenceProfileSet, TableContents, TableHeaders
+
+INFERENCE_PROFILE_LOCK : threading.Lock = threading.Lock()
+INFERENCE_PROFILE_SET : InferenceProfileSet = {}
+INFERENCE_PROFILE_WAIT : threading.local = threading.local()
+
+
+def profile_inference_session(model_name : str, inference_session : InferenceSession) -> InferenceSession:
+	setattr(inference_session, 'run', partial(run_profile_inference_session, model_name, inference_session.run))
+	setattr(inference_session, 'run_with_iobinding', partial(run_profile_inference_session, model_name, inference_session.run_with_iobinding))
+	return inference_session
+
+
+def run_profile_inference_session(model_name : str, inference_session_run : Callable[..., Any], *args : Any, **kwargs : Any) -> Any:
+	semaphore_wait_time = pop_inference_wait()
+	start_time = perf_counter()
+
+	try:
+		return inference_session_run(*args, **kwargs)
+	finally:
+		queue_wait_time = pop_inference_wait()
+		run_time = perf_counter() - start_time - queue_wait_time
+		record_inference_profile(model_name, run_time, semaphore_wait_time + queue_wait_time)
+
+
+def add_inference_wait(wait_time : float) -> None:
+	INFERENCE_PROFILE_WAIT.wait_time = getattr(INFERENCE_PROFILE_WAIT, 'wait_time', 0.0) + wait_time
+
+
+def pop_inference_wait() -> float:
+	wait_time = getattr(INFERENCE_PROFILE_WAIT, 'wait_time', 0.0)
+	INFERENCE_PROFILE_WAIT.wait_time = 0.0
+	return wait_time
+
+
+@contextmanager
+def profile_semaphore(semaphore : threading.Semaphore) -> Iterator[None]:
+	start_time = perf_counter()
+
+	with semaphore:
+		add_inference_wait(perf_counter() - start_time)
+		yield
+
+
+def record_inference_profile(model_name : str, run_time : float, wait_time : float) -> None:
+	with INFERENCE_PROFILE_LOCK:
+		if model_name not in INFERENCE_PROFILE_SET:
+			INFERENCE_PROFILE_SET[model_name] =\
+			{
+				'run_times': [],
+				'wait_times': []
+			}
+		INFERENCE_PROFILE_SET[model_name]['run_times'].append(run_time)
+		INFERENCE_PROFILE_SET[model_name]['wait_times'].append(wait_time)
+
+
+def summarize_inference_profile(inference_profile : InferenceProfile) -> List[float]:
+	run_times = numpy.array(inference_profile.get('run_times')) * 1000
+	wait_times = numpy.array(inference_profile.get('wait_times')) * 1000
+	run_percentiles = numpy.percentile(run_times, [ 50, 95, 99 ])
+	return [ len(run_times), round(float(numpy.sum(run_times)), 2), round(float(run_percentiles[0]), 2), round(float(run_percentiles[1]), 2), round(float(run_percentiles[2]), 2), round(float(numpy.sum(wait_times)), 2) ]
+
+
+def report_inference_profiles() -> None:
+	inference_profile_path = state_manager.get_item('inference_profile_path')
+	headers : TableHeaders = [ 'model_name', 'call_total', 'run_time', 'run_p50', 'run_p95', 'run_p99', 'wait_time' ]
+	contents : TableContents = []
+
+	with INFERENCE_PROFILE_LOCK:
+		for model_name, inference_profile in sorted(INFERENCE_PROFILE_SET.items(), key = lambda item : sum(item[1].get('run_times')), reverse = True):
+			contents.append([ model_name ] + summarize_inference_profile(inference_profile))
+		INFERENCE_PROFILE_SET.clear()
+
+	if contents:
+		render_table(headers, contents)
+
+		if inference_profile_path:
+			write_json(inference_profile_path, { content[0]: dict(zip(headers[1:], content[1:])) for content in contents })
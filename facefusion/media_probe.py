@@ -0,0 +1,54 @@
+import threading
+from typing import Optional, Tuple
+
+from facefusion.filesystem import create_file_stamp
+from facefusion.types import MediaProbe, MediaProbeStore
+
+MEDIA_PROBE_LOCK : threading.Lock = threading.Lock()
+MEDIA_PROBE_STORE : MediaProbeStore =\
+{
+	'media_probes': {},
+	'hit_total': 0,
+	'miss_total': 0
+}
+
+
+def get_media_probe_store() -> MediaProbeStore:
+	return MEDIA_PROBE_STORE
+
+
+def get_media_probe(media_path : str) -> Optional[MediaProbe]:
+	file_stamp = create_file_stamp(media_path)
+
+	with MEDIA_PROBE_LOCK:
+		probed_media = MEDIA_PROBE_STORE.get('media_probes').get(media_path)
+
+		if not probed_media or probed_media.get('file_stamp') != file_stamp:
+			MEDIA_PROBE_STORE['miss_total'] += 1
+			return None
+
+		MEDIA_PROBE_STORE['hit_total'] += 1
+		return probed_media.get('media_probe')
+
+
+def set_media_probe(media_path : str, media_probe : MediaProbe) -> None:
+	file_stamp = create_file_stamp(media_path)
+
+	if file_stamp:
+		with MEDIA_PROBE_LOCK:
+			MEDIA_PROBE_STORE['media_probes'][media_path] =\
+			{
+				'file_stamp': file_stamp,
+				'media_probe': media_probe
+			}
+
+
+def get_media_probe_totals() -> Tuple[int, int]:
+	return MEDIA_PROBE_STORE.get('hit_total'), MEDIA_PROBE_STORE.get('miss_total')
+
+
+def clear_media_probes() -> None:
+	with MEDIA_PROBE_LOCK:
+		MEDIA_PROBE_STORE['media_probes'].clear()
+		MEDIA_PROBE_STORE['hit_total'] = 0
+		MEDIA_PROBE_STORE['miss_total'] = 0
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 
 import onnx
@@ -9,3 +10,8 @@ from facefusion.types import ModelInitializer
 def get_static_model_initializer(model_path : str) -> ModelInitializer:
 	model = onnx.load(model_path)
 	return onnx.numpy_helper.to_array(model.graph.initializer[-1])
+
+
+def resolve_quantize_model_path(model_path : str) -> str:
+	model_file_path, model_file_extension = os.path.splitext(model_path)
+	return model_file_path + '_int8' + model_file_extension
@@ -0,0 +1,92 @@
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Generator, Iterable, List
+
+from facefusion import process_manager
+from facefusion.types import ProcessStage
+
+STAGE_END : object = object()
+STAGE_TIMEOUT : float = 0.1
+
+
+def run_stages(stage_items : Iterable[Any], process_stages : List[ProcessStage], stage_thread_counts : List[int], stage_queue_size : int) -> Generator[Any, None, None]:
+	stage_event = threading.Event()
+	stage_errors : List[Exception] = []
+	stage_queues : List[Queue[Any]] = [ Queue(maxsize = stage_queue_size) for _ in range(len(process_stages) + 1) ]
+	next_thread_counts = stage_thread_counts[:len(process_stages)] + [ 1 ]
+	stage_threads = [ threading.Thread(target = feed_stage, args = (stage_items, stage_queues[0], next_thread_counts[0], stage_event, stage_errors), daemon = True) ]
+
+	for stage_index, process_stage in enumerate(process_stages):
+		worker_threads = [ threading.Thread(target = run_stage, args = (process_stage, stage_queues[stage_index], stage_queues[stage_index + 1], stage_event, stage_errors), daemon = True) for _ in range(next_thread_counts[stage_index]) ]
+		stage_threads.extend(worker_threads)
+		stage_threads.append(threading.Thread(target = close_stage, args = (worker_threads, stage_queues[stage_index + 1], next_thread_counts[stage_index + 1], stage_event), daemon = True))
+
+	for stage_thread in stage_threads:
+		stage_thread.start()
+
+	try:
+		while (stage_item := get_stage_item(stage_queues[-1], stage_event)) is not STAGE_END:
+			yield stage_item
+	finally:
+		stage_event.set()
+
+		for stage_thread in stage_threads:
+			stage_thread.join()
+
+	if stage_errors:
+		raise stage_errors[0]
+
+
+def feed_stage(stage_items : Iterable[Any], output_queue : Queue[Any], next_thread_count : int, stage_event : threading.Event, stage_errors : List[Exception]) -> None:
+	try:
+		for stage_item in stage_items:
+			if not put_stage_item(output_queue, stage_item, stage_event):
+				return
+	except Exception as exception:
+		stage_errors.append(exception)
+		stage_event.set()
+		return
+
+	for _ in range(next_thread_count):
+		put_stage_item(output_queue, STAGE_END, stage_event)
+
+
+def run_stage(process_stage : ProcessStage, input_queue : Queue[Any], output_queue : Queue[Any], stage_event : threading.Event, stage_errors : List[Exception]) -> None:
+	try:
+		while (stage_item := get_stage_item(input_queue, stage_event)) is not STAGE_END:
+			if not put_stage_item(output_queue, process_stage(stage_item), stage_event):
+				return
+	except Exception as exception:
+		stage_errors.append(exception)
+		stage_event.set()
+
+
+def close_stage(worker_threads : List[threading.Thread], output_queue : Queue[Any], next_thread_count : int, stage_event : threading.Event) -> None:
+	for worker_thread in worker_threads:
+		worker_thread.join()
+
+	for _ in range(next_thread_count):
+		put_stage_item(output_queue, STAGE_END, stage_event)
+
+
+def get_stage_item(input_queue : Queue[Any], stage_event : threading.Event) -> Any:
+	while is_stage_running(stage_event):
+		try:
+			return input_queue.get(timeout = STAGE_TIMEOUT)
+		except Empty:
+			continue
+	return STAGE_END
+
+
+def put_stage_item(output_queue : Queue[Any], stage_item : Any, stage_event : threading.Event) -> bool:
+	while is_stage_running(stage_event):
+		try:
+			output_queue.put(stage_item, timeout = STAGE_TIMEOUT)
+			return True
+		except Full:
+			continue
+	return False
+
+
+def is_stage_running(stage_event : threading.Event) -> bool:
+	return not stage_event.is_set() and process_manager.is_processing()
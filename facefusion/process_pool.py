@@ -0,0 +1,137 @@
+import multiprocessing
+import signal
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from queue import Queue
+from typing import Any, List, Optional
+
+import numpy
+
+from facefusion import face_tracker, logger, state_manager
+from facefusion.processors import core as processors_core
+from facefusion.types import FrameContext, ProcessWorker, State, VisionFrame
+
+PROCESS_POOL : List[ProcessWorker] = []
+PROCESS_POOL_QUEUE : Queue[ProcessWorker] = Queue()
+
+
+def create_process_pool(frame_context : FrameContext, worker_count : int) -> None:
+	process_context = multiprocessing.get_context('spawn')
+	state = state_manager.get_state()
+
+	for _ in range(worker_count):
+		parent_connection, worker_connection = process_context.Pipe()
+		process = process_context.Process(target = run_process_worker, args = (state, frame_context, worker_connection), daemon = True)
+		process.start()
+		worker_connection.close()
+		process_worker : ProcessWorker =\
+		{
+			'process': process,
+			'connection': parent_connection,
+			'shared_memory': None
+		}
+		PROCESS_POOL.append(process_worker)
+		PROCESS_POOL_QUEUE.put(process_worker)
+
+
+def clear_process_pool() -> None:
+	for process_worker in PROCESS_POOL:
+		process = process_worker.get('process')
+		connection = process_worker.get('connection')
+		shared_memory = process_worker.get('shared_memory')
+
+		try:
+			connection.send(None)
+		except (BrokenPipeError, OSError):
+			pass
+		process.join(timeout = 5)
+
+		if process.is_alive():
+			process.terminate()
+		connection.close()
+
+		if shared_memory:
+			shared_memory.close()
+			shared_memory.unlink()
+
+	PROCESS_POOL.clear()
+
+	while not PROCESS_POOL_QUEUE.empty():
+		PROCESS_POOL_QUEUE.get_nowait()
+
+
+def process_vision_frame(target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	process_worker = PROCESS_POOL_QUEUE.get()
+
+	try:
+		connection = process_worker.get('connection')
+		shared_memory = prepare_shared_memory(process_worker, target_vision_frame.nbytes)
+		write_shared_frame(shared_memory, target_vision_frame)
+		connection.send((shared_memory.name, target_vision_frame.shape, frame_number))
+		worker_result = connection.recv()
+
+		if isinstance(worker_result, Exception):
+			raise worker_result
+		if isinstance(worker_result, numpy.ndarray):
+			prepare_shared_memory(process_worker, worker_result.size)
+			return worker_result
+		return read_shared_frame(shared_memory, worker_result).copy()
+	finally:
+		PROCESS_POOL_QUEUE.put(process_worker)
+
+
+def prepare_shared_memory(process_worker : ProcessWorker, frame_size : int) -> SharedMemory:
+	shared_memory = process_worker.get('shared_memory')
+
+	if shared_memory and shared_memory.size < frame_size:
+		shared_memory.close()
+		shared_memory.unlink()
+		shared_memory = None
+	if not shared_memory:
+		shared_memory = SharedMemory(create = True, size = frame_size)
+		process_worker['shared_memory'] = shared_memory
+	return shared_memory
+
+
+def read_shared_frame(shared_memory : SharedMemory, frame_shape : Any) -> VisionFrame:
+	return numpy.ndarray(frame_shape, dtype = numpy.uint8, buffer = shared_memory.buf)
+
+
+def write_shared_frame(shared_memory : SharedMemory, vision_frame : VisionFrame) -> None:
+	read_shared_frame(shared_memory, vision_frame.shape)[:] = vision_frame
+
+
+def run_process_worker(state : State, frame_context : FrameContext, connection : Connection) -> None:
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+	shared_memory : Optional[SharedMemory] = None
+
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	logger.init(state_manager.get_item('log_level'))
+	face_tracker.start_face_tracks()
+
+	while worker_message := connection.recv():
+		shared_memory_name, frame_shape, frame_number = worker_message
+
+		if shared_memory and shared_memory.name != shared_memory_name:
+			shared_memory.close()
+			shared_memory = None
+		if not shared_memory:
+			shared_memory = SharedMemory(shared_memory_name)
+		connection.send(process_worker_frame(shared_memory, frame_context, frame_shape, frame_number))
+
+	if shared_memory:
+		shared_memory.close()
+	connection.close()
+
+
+def process_worker_frame(shared_memory : SharedMemory, frame_context : FrameContext, frame_shape : Any, frame_number : int) -> Any:
+	try:
+		temp_vision_frame = processors_core.process_vision_frame(frame_context, read_shared_frame(shared_memory, frame_shape), frame_number)
+	except Exception as exception:
+		return exception
+
+	if temp_vision_frame.size > shared_memory.size:
+		return temp_vision_frame
+	write_shared_frame(shared_memory, temp_vision_frame)
+	return temp_vision_frame.shape
@@ -1,9 +1,17 @@
 import importlib
 from types import ModuleType
-from typing import Any, List
+from typing import Any, List, Optional
 
-from facefusion import logger, wording
+import numpy
+
+from facefusion import logger, state_manager, wording
+from facefusion.audio import create_empty_audio_frame, get_audio_frame, get_voice_frame
+from facefusion.common_helper import get_first
 from facefusion.exit_helper import hard_exit
+from facefusion.face_selector import extract_source_face, select_faces
+from facefusion.filesystem import filter_audio_paths
+from facefusion.types import Face, Fps, FrameContext, VisionFrame
+from facefusion.vision import read_static_images, read_static_video_frame
 
 PROCESSORS_METHODS =\
 [
@@ -14,6 +22,7 @@ PROCESSORS_METHODS =\
 	'pre_check',
 	'pre_process',
 	'post_process',
+	'get_frame_inputs',
 	'process_frame'
 ]
 
@@ -41,3 +50,73 @@ def get_processors_modules(processors : List[str]) -> List[ModuleType]:
 		processor_module = load_processor_module(processor)
 		processor_modules.append(processor_module)
 	return processor_modules
+
+
+def has_face_processors(processor_modules : List[ModuleType]) -> bool:
+	for processor_module in processor_modules:
+		if 'target_faces' in processor_module.get_frame_inputs():
+			return True
+	return False
+
+
+def select_target_faces(processor_modules : List[ModuleType], reference_vision_frame : Optional[VisionFrame], target_vision_frame : VisionFrame) -> List[Face]:
+	if has_face_processors(processor_modules):
+		return select_faces(reference_vision_frame, target_vision_frame)
+	return []
+
+
+def has_source_face_processors(processor_modules : List[ModuleType]) -> bool:
+	for processor_module in processor_modules:
+		if 'source_face' in processor_module.get_frame_inputs():
+			return True
+	return False
+
+
+def select_source_face(processor_modules : List[ModuleType], source_vision_frames : List[VisionFrame]) -> Optional[Face]:
+	if has_source_face_processors(processor_modules):
+		return extract_source_face(source_vision_frames)
+	return None
+
+
+def create_frame_context(temp_video_fps : Fps) -> FrameContext:
+	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+
+	return\
+	{
+		'reference_vision_frame': read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number')),
+		'source_vision_frames': source_vision_frames,
+		'source_face': select_source_face(get_processors_modules(state_manager.get_item('processors')), source_vision_frames),
+		'source_audio_path': get_first(filter_audio_paths(state_manager.get_item('source_paths'))),
+		'temp_video_fps': temp_video_fps
+	}
+
+
+def process_vision_frame(frame_context : FrameContext, target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	source_audio_path = frame_context.get('source_audio_path')
+	temp_video_fps = frame_context.get('temp_video_fps')
+	temp_vision_frame = target_vision_frame.copy()
+
+	source_audio_frame = get_audio_frame(source_audio_path, temp_video_fps, frame_number)
+	source_voice_frame = get_voice_frame(source_audio_path, temp_video_fps, frame_number)
+
+	if not numpy.any(source_audio_frame):
+		source_audio_frame = create_empty_audio_frame()
+	if not numpy.any(source_voice_frame):
+		source_voice_frame = create_empty_audio_frame()
+
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	target_faces = select_target_faces(processor_modules, frame_context.get('reference_vision_frame'), target_vision_frame)
+
+	for processor_module in processor_modules:
+		temp_vision_frame = processor_module.process_frame(
+		{
+			'source_vision_frames': frame_context.get('source_vision_frames'),
+			'source_face': frame_context.get('source_face'),
+			'source_audio_frame': source_audio_frame,
+			'source_voice_frame': source_voice_frame,
+			'target_faces': target_faces,
+			'target_vision_frame': target_vision_frame,
+			'temp_vision_frame': temp_vision_frame
+		})
+
+	return temp_vision_frame
@@ -1,5 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
+from typing import List
 
 import cv2
 import numpy
@@ -7,21 +8,21 @@ import numpy
 import facefusion.choices
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import merge_matrix, paste_back, scale_face_landmark_5, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_box_mask, create_occlusion_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import AgeModifierDirection, AgeModifierInputs
+from facefusion.processors.types import AgeModifierDirection, AgeModifierInputs, ProcessorInput
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.tensor_helper import normalize_tensor_frame, prepare_tensor_frame
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import match_frame_color, read_static_image, read_static_video_frame
+from facefusion.vision import match_frame_color, read_static_video_frame
 
 
 @lru_cache()
@@ -111,18 +112,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
 
 
 def modify_age(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -173,35 +164,32 @@ def forward(crop_vision_frame : VisionFrame, extend_vision_frame : VisionFrame,
 		if age_modifier_input.name == 'direction':
 			age_modifier_inputs[age_modifier_input.name] = age_modifier_direction
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		crop_vision_frame = age_modifier.run(None, age_modifier_inputs)[0][0]
 
 	return crop_vision_frame
 
 
 def prepare_vision_frame(vision_frame : VisionFrame) -> VisionFrame:
-	vision_frame = vision_frame[:, :, ::-1] / 255.0
-	vision_frame = (vision_frame - 0.5) / 0.5
-	vision_frame = numpy.expand_dims(vision_frame.transpose(2, 0, 1), axis = 0).astype(numpy.float32)
+	vision_frame = prepare_tensor_frame(vision_frame, [ 0.5, 0.5, 0.5 ], [ 0.5, 0.5, 0.5 ])
 	return vision_frame
 
 
 def normalize_extend_frame(extend_vision_frame : VisionFrame) -> VisionFrame:
 	model_sizes = get_model_options().get('sizes')
-	extend_vision_frame = numpy.clip(extend_vision_frame, -1, 1)
-	extend_vision_frame = (extend_vision_frame + 1) / 2
-	extend_vision_frame = extend_vision_frame.transpose(1, 2, 0).clip(0, 255)
-	extend_vision_frame = (extend_vision_frame * 255.0)
-	extend_vision_frame = extend_vision_frame.astype(numpy.uint8)[:, :, ::-1]
+	extend_vision_frame = normalize_tensor_frame(extend_vision_frame, [ 0.5, 0.5, 0.5 ], [ 0.5, 0.5, 0.5 ])
 	extend_vision_frame = cv2.resize(extend_vision_frame, (model_sizes.get('target')[0] * 4, model_sizes.get('target')[1] * 4), interpolation = cv2.INTER_AREA)
 	return extend_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'target_faces' ]
+
+
 def process_frame(inputs : AgeModifierInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if target_faces:
 		for target_face in target_faces:
@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import cv2
 import numpy
@@ -8,20 +8,19 @@ from cv2.typing import Size
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url_by_provider
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import get_file_name, in_directory, is_image, is_video, resolve_file_paths, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import DeepSwapperInputs, DeepSwapperMorph
+from facefusion.processors.types import DeepSwapperInputs, DeepSwapperMorph, ProcessorInput
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import conditional_match_frame_color, read_static_image, read_static_video_frame
+from facefusion.vision import conditional_match_frame_color, read_static_video_frame
 
 
 @lru_cache()
@@ -308,18 +307,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
 
 
 def swap_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -368,7 +357,7 @@ def forward(crop_vision_frame : VisionFrame, deep_swapper_morph : DeepSwapperMor
 		if deep_swapper_input.name == 'morph_value:0':
 			deep_swapper_inputs[deep_swapper_input.name] = deep_swapper_morph
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		crop_target_mask, crop_vision_frame, crop_source_mask = deep_swapper.run(None, deep_swapper_inputs)
 
 	return crop_vision_frame[0], crop_source_mask[0], crop_target_mask[0]
@@ -408,11 +397,14 @@ def prepare_crop_mask(crop_source_mask : Mask, crop_target_mask : Mask) -> Mask:
 	return crop_mask
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'target_faces' ]
+
+
 def process_frame(inputs : DeepSwapperInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if target_faces:
 		for target_face in target_faces:
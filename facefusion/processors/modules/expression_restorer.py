@@ -1,27 +1,27 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import cv2
 import numpy
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_box_mask, create_occlusion_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.live_portrait import create_rotation, limit_expression
-from facefusion.processors.types import ExpressionRestorerInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
+from facefusion.processors.types import ExpressionRestorerInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw, ProcessorInput
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
+from facefusion.tensor_helper import normalize_tensor_frame, prepare_tensor_frame
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import read_static_image, read_static_video_frame
+from facefusion.vision import read_static_video_frame
 
 
 @lru_cache()
@@ -128,18 +128,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
 
 
 def restore_expression(target_face : Face, target_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -221,7 +211,7 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, target_motion_points : LivePortraitMotionPoints, temp_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		crop_vision_frame = generator.run(None,
 		{
 			'feature_volume': feature_volume,
@@ -236,23 +226,23 @@ def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	model_size = get_model_options().get('size')
 	prepare_size = (model_size[0] // 2, model_size[1] // 2)
 	crop_vision_frame = cv2.resize(crop_vision_frame, prepare_size, interpolation = cv2.INTER_AREA)
-	crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame.transpose(2, 0, 1), axis = 0).astype(numpy.float32)
+	crop_vision_frame = prepare_tensor_frame(crop_vision_frame, [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ])
 	return crop_vision_frame
 
 
 def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
-	crop_vision_frame = crop_vision_frame.transpose(1, 2, 0).clip(0, 1)
-	crop_vision_frame = crop_vision_frame * 255.0
-	crop_vision_frame = crop_vision_frame.astype(numpy.uint8)[:, :, ::-1]
+	crop_vision_frame = normalize_tensor_frame(crop_vision_frame, [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ])
 	return crop_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'source_vision_frames', 'target_faces' ]
+
+
 def process_frame(inputs : ExpressionRestorerInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if target_faces:
 		for target_face in target_faces:
@@ -1,21 +1,21 @@
 from argparse import ArgumentParser
+from typing import List
 
 import cv2
 import numpy
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, logger, state_manager, video_manager, wording
+from facefusion import config, logger, state_manager, video_manager, wording
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, same_file_extension
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import FaceDebuggerInputs
+from facefusion.processors.types import FaceDebuggerInputs, ProcessorInput
 from facefusion.program_helper import find_argument_group
 from facefusion.types import ApplyStateItem, Args, Face, InferencePool, ProcessMode, VisionFrame
-from facefusion.vision import read_static_image, read_static_video_frame
+from facefusion.vision import read_static_video_frame
 
 
 def get_inference_pool() -> InferencePool:
@@ -55,16 +55,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
 
 
 def debug_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -211,11 +203,14 @@ def draw_face_landmark_68_5(target_face : Face, temp_vision_frame : VisionFrame)
 	return temp_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'target_faces' ]
+
+
 def process_frame(inputs : FaceDebuggerInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if target_faces:
 		for target_face in target_faces:
@@ -1,24 +1,26 @@
 from argparse import ArgumentParser
 from functools import lru_cache
+from typing import List
 
 import numpy
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import create_float_metavar, create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_box_mask, create_occlusion_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.inference_binder import run_inference_binding
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import FaceEnhancerInputs, FaceEnhancerWeight
+from facefusion.processors.types import FaceEnhancerInputs, FaceEnhancerWeight, ProcessorInput
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.tensor_helper import prepare_tensor_frame
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import blend_frame, read_static_image, read_static_video_frame
+from facefusion.vision import blend_frame, read_static_video_frame
 
 
 @lru_cache()
@@ -270,18 +272,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
 
 
 def enhance_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -318,8 +310,8 @@ def forward(crop_vision_frame : VisionFrame, face_enhancer_weight : FaceEnhancer
 		if face_enhancer_input.name == 'weight':
 			face_enhancer_inputs[face_enhancer_input.name] = face_enhancer_weight
 
-	with thread_semaphore():
-		crop_vision_frame = face_enhancer.run(None, face_enhancer_inputs)[0][0]
+	with conditional_thread_semaphore():
+		crop_vision_frame = run_inference_binding(face_enhancer, face_enhancer_inputs)[0][0]
 
 	return crop_vision_frame
 
@@ -335,9 +327,7 @@ def has_weight_input() -> bool:
 
 
 def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
-	crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-	crop_vision_frame = (crop_vision_frame - 0.5) / 0.5
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame.transpose(2, 0, 1), axis = 0).astype(numpy.float32)
+	crop_vision_frame = prepare_tensor_frame(crop_vision_frame, [ 0.5, 0.5, 0.5 ], [ 0.5, 0.5, 0.5 ])
 	return crop_vision_frame
 
 
@@ -356,11 +346,14 @@ def blend_paste_frame(temp_vision_frame : VisionFrame, paste_vision_frame : Visi
 	return temp_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'target_faces' ]
+
+
 def process_frame(inputs : FaceEnhancerInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if target_faces:
 		for target_face in target_faces:
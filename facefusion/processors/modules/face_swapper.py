@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Optional, Tuple
+from typing import List, Tuple
 
 import cv2
 import numpy
@@ -8,20 +8,21 @@ import numpy
 import facefusion.choices
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import get_first, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
-from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face, scale_face
+from facefusion.face_analyser import get_many_faces, get_one_face, scale_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
-from facefusion.face_selector import select_faces, sort_faces_by_order
 from facefusion.filesystem import filter_image_paths, has_image, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.inference_binder import run_inference_binding
 from facefusion.model_helper import get_static_model_initializer
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel_boost
-from facefusion.processors.types import FaceSwapperInputs
+from facefusion.processors.types import FaceSwapperInputs, ProcessorInput
 from facefusion.program_helper import find_argument_group
+from facefusion.tensor_helper import prepare_tensor_frame
 from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_images, read_static_video_frame, unpack_resolution
@@ -484,19 +485,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		get_static_model_initializer.cache_clear()
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
 
 
 def swap_face(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -558,7 +548,7 @@ def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame
 			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
 	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
+		crop_vision_frame = run_inference_binding(face_swapper, face_swapper_inputs)[0][0]
 
 	return crop_vision_frame
 
@@ -642,10 +632,7 @@ def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
 
-	crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-	crop_vision_frame = (crop_vision_frame - model_mean) / model_standard_deviation
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0).astype(numpy.float32)
+	crop_vision_frame = prepare_tensor_frame(crop_vision_frame, model_mean, model_standard_deviation)
 	return crop_vision_frame
 
 
@@ -664,27 +651,15 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
-def extract_source_face(source_vision_frames : List[VisionFrame]) -> Optional[Face]:
-	source_faces = []
-
-	if source_vision_frames:
-		for source_vision_frame in source_vision_frames:
-			temp_faces = get_many_faces([source_vision_frame])
-			temp_faces = sort_faces_by_order(temp_faces, 'large-small')
-
-			if temp_faces:
-				source_faces.append(get_first(temp_faces))
-
-	return get_average_face(source_faces)
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'source_face', 'target_faces' ]
 
 
 def process_frame(inputs : FaceSwapperInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
-	source_vision_frames = inputs.get('source_vision_frames')
+	source_face = inputs.get('source_face')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	source_face = extract_source_face(source_vision_frames)
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if source_face and target_faces:
 		for target_face in target_faces:
@@ -7,17 +7,17 @@ import numpy
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import FrameColorizerInputs
+from facefusion.processors.types import FrameColorizerInputs, ProcessorInput
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, ExecutionProvider, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import blend_frame, read_static_image, read_static_video_frame, unpack_resolution
+from facefusion.vision import blend_frame, read_static_video_frame, unpack_resolution
 
 
 @lru_cache()
@@ -186,13 +186,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
 
 
 def colorize_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -206,7 +201,7 @@ def colorize_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 def forward(color_vision_frame : VisionFrame) -> VisionFrame:
 	frame_colorizer = get_inference_pool().get('frame_colorizer')
 
-	with thread_semaphore():
+	with conditional_thread_semaphore():
 		color_vision_frame = frame_colorizer.run(None,
 		{
 			'input': color_vision_frame
@@ -261,6 +256,10 @@ def blend_color_frame(temp_vision_frame : VisionFrame, color_vision_frame : Visi
 	return temp_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return []
+
+
 def process_frame(inputs : FrameColorizerInputs) -> VisionFrame:
 	temp_vision_frame = inputs.get('temp_vision_frame')
 	return colorize_frame(temp_vision_frame)
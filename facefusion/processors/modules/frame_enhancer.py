@@ -1,22 +1,24 @@
 from argparse import ArgumentParser
 from functools import lru_cache
+from typing import List
 
 import cv2
-import numpy
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, inference_manager, logger, state_manager, video_manager, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.inference_binder import run_inference_binding
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import FrameEnhancerInputs
+from facefusion.processors.types import FrameEnhancerInputs, ProcessorInput
 from facefusion.program_helper import find_argument_group
+from facefusion.tensor_helper import normalize_tensor_frame, prepare_tensor_frame
 from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import blend_frame, create_tile_frames, merge_tile_frames, read_static_image, read_static_video_frame
+from facefusion.vision import blend_frame, create_tile_frames, merge_tile_frames, read_static_video_frame
 
 
 @lru_cache()
@@ -468,13 +470,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
 
 
 def enhance_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -497,7 +494,7 @@ def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 	frame_enhancer = get_inference_pool().get('frame_enhancer')
 
 	with conditional_thread_semaphore():
-		tile_vision_frame = frame_enhancer.run(None,
+		tile_vision_frame = run_inference_binding(frame_enhancer,
 		{
 			'input': tile_vision_frame
 		})[0]
@@ -506,15 +503,12 @@ def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 
 
 def prepare_tile_frame(tile_vision_frame : VisionFrame) -> VisionFrame:
-	tile_vision_frame = numpy.expand_dims(tile_vision_frame[:, :, ::-1], axis = 0)
-	tile_vision_frame = tile_vision_frame.transpose(0, 3, 1, 2)
-	tile_vision_frame = tile_vision_frame.astype(numpy.float32) / 255.0
+	tile_vision_frame = prepare_tensor_frame(tile_vision_frame, [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ])
 	return tile_vision_frame
 
 
 def normalize_tile_frame(tile_vision_frame : VisionFrame) -> VisionFrame:
-	tile_vision_frame = tile_vision_frame.transpose(0, 2, 3, 1).squeeze(0) * 255
-	tile_vision_frame = tile_vision_frame.clip(0, 255).astype(numpy.uint8)[:, :, ::-1]
+	tile_vision_frame = normalize_tensor_frame(tile_vision_frame[0], [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ])
 	return tile_vision_frame
 
 
@@ -525,6 +519,10 @@ def blend_merge_frame(temp_vision_frame : VisionFrame, merge_vision_frame : Visi
 	return temp_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return []
+
+
 def process_frame(inputs : FrameEnhancerInputs) -> VisionFrame:
 	temp_vision_frame = inputs.get('temp_vision_frame')
 	return enhance_frame(temp_vision_frame)
@@ -1,26 +1,27 @@
 from argparse import ArgumentParser
 from functools import lru_cache
+from typing import List
 
 import cv2
 import numpy
 
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
-from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, voice_extractor, wording
+from facefusion import config, inference_manager, logger, state_manager, video_manager, wording
 from facefusion.audio import read_static_voice
 from facefusion.common_helper import create_float_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_analyser import scale_face
 from facefusion.face_helper import create_bounding_box, paste_back, warp_face_by_bounding_box, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask
-from facefusion.face_selector import select_faces
 from facefusion.filesystem import has_audio, resolve_relative_path
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.types import LipSyncerInputs, LipSyncerWeight
+from facefusion.processors.types import LipSyncerInputs, LipSyncerWeight, ProcessorInput
 from facefusion.program_helper import find_argument_group
+from facefusion.tensor_helper import prepare_tensor_frame
 from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import ApplyStateItem, Args, AudioFrame, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
-from facefusion.vision import read_static_image, read_static_video_frame
+from facefusion.vision import read_static_video_frame
 
 
 @lru_cache()
@@ -138,20 +139,9 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
-	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
 	read_static_voice.cache_clear()
 	video_manager.clear_video_pool()
-	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
-		clear_inference_pool()
-	if state_manager.get_item('video_memory_strategy') == 'strict':
-		content_analyser.clear_inference_pool()
-		face_classifier.clear_inference_pool()
-		face_detector.clear_inference_pool()
-		face_landmarker.clear_inference_pool()
-		face_masker.clear_inference_pool()
-		face_recognizer.clear_inference_pool()
-		voice_extractor.clear_inference_pool()
 
 
 def sync_lip(target_face : Face, source_voice_frame : AudioFrame, temp_vision_frame : VisionFrame) -> VisionFrame:
@@ -235,8 +225,7 @@ def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 
 	if model_type == 'edtalk':
 		crop_vision_frame = cv2.resize(crop_vision_frame, model_size, interpolation = cv2.INTER_AREA)
-		crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-		crop_vision_frame = numpy.expand_dims(crop_vision_frame.transpose(2, 0, 1), axis = 0).astype(numpy.float32)
+		crop_vision_frame = prepare_tensor_frame(crop_vision_frame, [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ])
 
 	if model_type == 'wav2lip':
 		crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
@@ -261,12 +250,15 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
+def get_frame_inputs() -> List[ProcessorInput]:
+	return [ 'source_voice_frame', 'target_faces' ]
+
+
 def process_frame(inputs : LipSyncerInputs) -> VisionFrame:
-	reference_vision_frame = inputs.get('reference_vision_frame')
 	source_voice_frame = inputs.get('source_voice_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
 	temp_vision_frame = inputs.get('temp_vision_frame')
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+	target_faces = inputs.get('target_faces')
 
 	if target_faces:
 		for target_face in target_faces:
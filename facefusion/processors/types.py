@@ -1,8 +1,8 @@
-from typing import Any, Dict, List, Literal, TypeAlias, TypedDict
+from typing import Any, Dict, List, Literal, Optional, TypeAlias, TypedDict
 
 from numpy.typing import NDArray
 
-from facefusion.types import AppContext, AudioFrame, VisionFrame
+from facefusion.types import AppContext, AudioFrame, Face, VisionFrame
 
 AgeModifierModel = Literal['styleganex_age']
 DeepSwapperModel : TypeAlias = str
@@ -15,50 +15,51 @@ FaceSwapperModel = Literal['blendswap_256', 'ghost_1_256', 'ghost_2_256', 'ghost
 FrameColorizerModel = Literal['ddcolor', 'ddcolor_artistic', 'deoldify', 'deoldify_artistic', 'deoldify_stable']
 FrameEnhancerModel = Literal['clear_reality_x4', 'lsdir_x4', 'nomos8k_sc_x4', 'real_esrgan_x2', 'real_esrgan_x2_fp16', 'real_esrgan_x4', 'real_esrgan_x4_fp16', 'real_esrgan_x8', 'real_esrgan_x8_fp16', 'real_hatgan_x4', 'real_web_photo_x4', 'realistic_rescaler_x4', 'remacri_x4', 'siax_x4', 'span_kendata_x4', 'swin2_sr_x4', 'ultra_sharp_x4', 'ultra_sharp_2_x4']
 LipSyncerModel = Literal['edtalk_256', 'wav2lip_96', 'wav2lip_gan_96']
+ProcessorInput = Literal['source_vision_frames', 'source_face', 'source_audio_frame', 'source_voice_frame', 'target_faces']
 
 FaceSwapperSet : TypeAlias = Dict[FaceSwapperModel, List[str]]
 
 AgeModifierInputs = TypedDict('AgeModifierInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
 DeepSwapperInputs = TypedDict('DeepSwapperInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
 ExpressionRestorerInputs = TypedDict('ExpressionRestorerInputs',
 {
-	'reference_vision_frame' : VisionFrame,
 	'source_vision_frames' : List[VisionFrame],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
 FaceDebuggerInputs = TypedDict('FaceDebuggerInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
 FaceEditorInputs = TypedDict('FaceEditorInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
 FaceEnhancerInputs = TypedDict('FaceEnhancerInputs',
 {
-	'reference_vision_frame' : VisionFrame,
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
 FaceSwapperInputs = TypedDict('FaceSwapperInputs',
 {
-	'reference_vision_frame' : VisionFrame,
-	'source_vision_frames' : List[VisionFrame],
+	'source_face' : Optional[Face],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
@@ -74,8 +75,8 @@ FrameEnhancerInputs = TypedDict('FrameEnhancerInputs',
 })
 LipSyncerInputs = TypedDict('LipSyncerInputs',
 {
-	'reference_vision_frame' : VisionFrame,
 	'source_voice_frame' : AudioFrame,
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame,
 	'temp_vision_frame' : VisionFrame
 })
@@ -101,7 +101,8 @@ def create_face_detector_program() -> ArgumentParser:
 	group_face_detector.add_argument('--face-detector-size', help = wording.get('help.face_detector_size'), default = config.get_str_value('face_detector', 'face_detector_size', get_last(face_detector_size_choices)), choices = face_detector_size_choices)
 	group_face_detector.add_argument('--face-detector-angles', help = wording.get('help.face_detector_angles'), type = int, default = config.get_int_list('face_detector', 'face_detector_angles', '0'), choices = facefusion.choices.face_detector_angles, nargs = '+', metavar = 'FACE_DETECTOR_ANGLES')
 	group_face_detector.add_argument('--face-detector-score', help = wording.get('help.face_detector_score'), type = float, default = config.get_float_value('face_detector', 'face_detector_score', '0.5'), choices = facefusion.choices.face_detector_score_range, metavar = create_float_metavar(facefusion.choices.face_detector_score_range))
-	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score' ])
+	group_face_detector.add_argument('--face-tracker-interval', help = wording.get('help.face_tracker_interval'), type = int, default = config.get_int_value('face_detector', 'face_tracker_interval', '0'), choices = facefusion.choices.face_tracker_interval_range, metavar = create_int_metavar(facefusion.choices.face_tracker_interval_range))
+	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score', 'face_tracker_interval' ])
 	return program
 
 
@@ -158,8 +159,11 @@ def create_frame_extraction_program() -> ArgumentParser:
 	group_frame_extraction.add_argument('--trim-frame-start', help = wording.get('help.trim_frame_start'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_start'))
 	group_frame_extraction.add_argument('--trim-frame-end', help = wording.get('help.trim_frame_end'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_end'))
 	group_frame_extraction.add_argument('--temp-frame-format', help = wording.get('help.temp_frame_format'), default = config.get_str_value('frame_extraction', 'temp_frame_format', 'png'), choices = facefusion.choices.temp_frame_formats)
+	group_frame_extraction.add_argument('--temp-frame-mode', help = wording.get('help.temp_frame_mode'), default = config.get_str_value('frame_extraction', 'temp_frame_mode', 'disk'), choices = facefusion.choices.temp_frame_modes)
+	group_frame_extraction.add_argument('--video-segment-count', help = wording.get('help.video_segment_count'), type = int, default = config.get_int_value('frame_extraction', 'video_segment_count', '1'), choices = facefusion.choices.video_segment_count_range, metavar = create_int_metavar(facefusion.choices.video_segment_count_range))
+	group_frame_extraction.add_argument('--frame-reuse-threshold', help = wording.get('help.frame_reuse_threshold'), type = float, default = config.get_float_value('frame_extraction', 'frame_reuse_threshold', '0.0'), choices = facefusion.choices.frame_reuse_threshold_range, metavar = create_float_metavar(facefusion.choices.frame_reuse_threshold_range))
 	group_frame_extraction.add_argument('--keep-temp', help = wording.get('help.keep_temp'), action = 'store_true', default = config.get_bool_value('frame_extraction', 'keep_temp'))
-	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'keep_temp' ])
+	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'temp_frame_mode', 'video_segment_count', 'frame_reuse_threshold', 'keep_temp' ])
 	return program
 
 
@@ -224,6 +228,17 @@ def create_benchmark_program() -> ArgumentParser:
 	group_benchmark.add_argument('--benchmark-mode', help = wording.get('help.benchmark_mode'), default = config.get_str_value('benchmark', 'benchmark_mode', 'warm'), choices = facefusion.choices.benchmark_modes)
 	group_benchmark.add_argument('--benchmark-resolutions', help = wording.get('help.benchmark_resolutions'), default = config.get_str_list('benchmark', 'benchmark_resolutions', get_first(facefusion.choices.benchmark_resolutions)), choices = facefusion.choices.benchmark_resolutions, nargs = '+')
 	group_benchmark.add_argument('--benchmark-cycle-count', help = wording.get('help.benchmark_cycle_count'), type = int, default = config.get_int_value('benchmark', 'benchmark_cycle_count', '5'), choices = facefusion.choices.benchmark_cycle_count_range)
+	group_benchmark.add_argument('--benchmark-worker-modes', help = wording.get('help.benchmark_worker_modes'), default = config.get_str_list('benchmark', 'benchmark_worker_modes', get_first(facefusion.choices.execution_worker_modes)), choices = facefusion.choices.execution_worker_modes, nargs = '+')
+	return program
+
+
+def create_quantize_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	available_quantize_modules = facefusion.choices.quantize_modules + [ get_file_name(file_path) for file_path in resolve_file_paths('facefusion/processors/modules') ]
+	group_quantize = program.add_argument_group('quantize')
+	group_quantize.add_argument('--quantize-modules', help = wording.get('help.quantize_modules').format(choices = ', '.join(available_quantize_modules)), default = config.get_str_list('quantize', 'quantize_modules', 'face_recognizer'), choices = available_quantize_modules, nargs = '+', metavar = 'QUANTIZE_MODULES')
+	group_quantize.add_argument('--quantize-mode', help = wording.get('help.quantize_mode'), default = config.get_str_value('quantize', 'quantize_mode', 'dynamic'), choices = facefusion.choices.quantize_modes)
+	group_quantize.add_argument('--quantize-frame-total', help = wording.get('help.quantize_frame_total'), type = int, default = config.get_int_value('quantize', 'quantize_frame_total', '16'), choices = facefusion.choices.quantize_frame_total_range, metavar = create_int_metavar(facefusion.choices.quantize_frame_total_range))
 	return program
 
 
@@ -234,16 +249,48 @@ def create_execution_program() -> ArgumentParser:
 	group_execution.add_argument('--execution-device-ids', help = wording.get('help.execution_device_ids'), default = config.get_str_list('execution', 'execution_device_ids', '0'), nargs = '+', metavar = 'EXECUTION_DEVICE_IDS')
 	group_execution.add_argument('--execution-providers', help = wording.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution', 'execution_providers', get_first(available_execution_providers)), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = wording.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution', 'execution_thread_count', '4'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
-	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count' ])
+	group_execution.add_argument('--execution-replica-count', help = wording.get('help.execution_replica_count'), type = int, default = config.get_int_value('execution', 'execution_replica_count', '1'), choices = facefusion.choices.execution_replica_count_range, metavar = create_int_metavar(facefusion.choices.execution_replica_count_range))
+	group_execution.add_argument('--execution-batch-size', help = wording.get('help.execution_batch_size'), type = int, default = config.get_int_value('execution', 'execution_batch_size', '1'), choices = facefusion.choices.execution_batch_size_range, metavar = create_int_metavar(facefusion.choices.execution_batch_size_range))
+	group_execution.add_argument('--execution-batch-timeout', help = wording.get('help.execution_batch_timeout'), type = int, default = config.get_int_value('execution', 'execution_batch_timeout', '5'), choices = facefusion.choices.execution_batch_timeout_range, metavar = create_int_metavar(facefusion.choices.execution_batch_timeout_range))
+	group_execution.add_argument('--execution-worker-mode', help = wording.get('help.execution_worker_mode'), default = config.get_str_value('execution', 'execution_worker_mode', 'thread'), choices = facefusion.choices.execution_worker_modes)
+	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count', 'execution_replica_count', 'execution_batch_size', 'execution_batch_timeout', 'execution_worker_mode' ])
+	return program
+
+
+def create_coordinator_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_coordinator = program.add_argument_group('coordinator')
+	group_coordinator.add_argument('--coordinator-address', help = wording.get('help.coordinator_address'), default = config.get_str_value('coordinator', 'coordinator_address'))
+	group_coordinator.add_argument('--coordinator-secret', help = wording.get('help.coordinator_secret'), default = config.get_str_value('coordinator', 'coordinator_secret'))
+	job_store.register_job_keys([ 'coordinator_address', 'coordinator_secret' ])
+	return program
+
+
+def create_session_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_session = program.add_argument_group('session')
+	group_session.add_argument('--session-intra-op-thread-count', help = wording.get('help.session_intra_op_thread_count'), type = int, default = config.get_int_value('session', 'session_intra_op_thread_count', '0'), choices = facefusion.choices.session_thread_count_range, metavar = create_int_metavar(facefusion.choices.session_thread_count_range))
+	group_session.add_argument('--session-inter-op-thread-count', help = wording.get('help.session_inter_op_thread_count'), type = int, default = config.get_int_value('session', 'session_inter_op_thread_count', '0'), choices = facefusion.choices.session_thread_count_range, metavar = create_int_metavar(facefusion.choices.session_thread_count_range))
+	group_session.add_argument('--session-execution-mode', help = wording.get('help.session_execution_mode'), default = config.get_str_value('session', 'session_execution_mode', 'sequential'), choices = facefusion.choices.session_execution_modes)
+	group_session.add_argument('--session-graph-optimization', help = wording.get('help.session_graph_optimization'), default = config.get_str_value('session', 'session_graph_optimization', 'all'), choices = facefusion.choices.session_graph_optimizations)
+	group_session.add_argument('--session-memory-options', help = wording.get('help.session_memory_options').format(choices = ', '.join(facefusion.choices.session_memory_options)), default = config.get_str_list('session', 'session_memory_options', ' '.join(facefusion.choices.session_memory_options)), choices = facefusion.choices.session_memory_options, nargs = '*', metavar = 'SESSION_MEMORY_OPTIONS')
+	group_session.add_argument('--session-model-cache', help = wording.get('help.session_model_cache'), action = 'store_true', default = config.get_bool_value('session', 'session_model_cache'))
+	group_session.add_argument('--session-model-precision', help = wording.get('help.session_model_precision'), default = config.get_str_value('session', 'session_model_precision', 'fp32'), choices = facefusion.choices.session_model_precisions)
+	group_session.add_argument('--session-concurrency-mode', help = wording.get('help.session_concurrency_mode'), default = config.get_str_value('session', 'session_concurrency_mode', 'static'), choices = facefusion.choices.session_concurrency_modes)
+	group_session.add_argument('--session-concurrency-limit', help = wording.get('help.session_concurrency_limit'), type = int, default = config.get_int_value('session', 'session_concurrency_limit', '0'), choices = facefusion.choices.session_concurrency_limit_range, metavar = create_int_metavar(facefusion.choices.session_concurrency_limit_range))
+	job_store.register_job_keys([ 'session_intra_op_thread_count', 'session_inter_op_thread_count', 'session_execution_mode', 'session_graph_optimization', 'session_memory_options', 'session_model_cache', 'session_model_precision', 'session_concurrency_mode', 'session_concurrency_limit' ])
 	return program
 
 
 def create_memory_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_memory = program.add_argument_group('memory')
-	group_memory.add_argument('--video-memory-strategy', help = wording.get('help.video_memory_strategy'), default = config.get_str_value('memory', 'video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
+	group_memory.add_argument('--inference-memory-limit', help = wording.get('help.inference_memory_limit'), type = int, default = config.get_int_value('memory', 'inference_memory_limit', '0'), choices = facefusion.choices.inference_memory_limit_range, metavar = create_int_metavar(facefusion.choices.inference_memory_limit_range))
 	group_memory.add_argument('--system-memory-limit', help = wording.get('help.system_memory_limit'), type = int, default = config.get_int_value('memory', 'system_memory_limit', '0'), choices = facefusion.choices.system_memory_limit_range, metavar = create_int_metavar(facefusion.choices.system_memory_limit_range))
-	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit' ])
+	group_memory.add_argument('--face-store-entry-limit', help = wording.get('help.face_store_entry_limit'), type = int, default = config.get_int_value('memory', 'face_store_entry_limit', '1024'), choices = facefusion.choices.face_store_entry_limit_range, metavar = create_int_metavar(facefusion.choices.face_store_entry_limit_range))
+	group_memory.add_argument('--face-store-memory-limit', help = wording.get('help.face_store_memory_limit'), type = int, default = config.get_int_value('memory', 'face_store_memory_limit', '256'), choices = facefusion.choices.face_store_memory_limit_range, metavar = create_int_metavar(facefusion.choices.face_store_memory_limit_range))
+	group_memory.add_argument('--image-store-memory-limit', help = wording.get('help.image_store_memory_limit'), type = int, default = config.get_int_value('memory', 'image_store_memory_limit', '1024'), choices = facefusion.choices.image_store_memory_limit_range, metavar = create_int_metavar(facefusion.choices.image_store_memory_limit_range))
+	job_store.register_job_keys([ 'inference_memory_limit', 'system_memory_limit', 'face_store_entry_limit', 'face_store_memory_limit', 'image_store_memory_limit' ])
 	return program
 
 
@@ -255,6 +302,15 @@ def create_log_level_program() -> ArgumentParser:
 	return program
 
 
+def create_inference_profile_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_misc = program.add_argument_group('misc')
+	group_misc.add_argument('--inference-profile', help = wording.get('help.inference_profile'), action = 'store_true', default = config.get_bool_value('misc', 'inference_profile'))
+	group_misc.add_argument('--inference-profile-path', help = wording.get('help.inference_profile_path'), default = config.get_str_value('misc', 'inference_profile_path'))
+	job_store.register_job_keys([ 'inference_profile', 'inference_profile_path' ])
+	return program
+
+
 def create_halt_on_error_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_misc = program.add_argument_group('misc')
@@ -287,7 +343,7 @@ def collect_step_program() -> ArgumentParser:
 
 
 def collect_job_program() -> ArgumentParser:
-	return ArgumentParser(parents = [ create_execution_program(), create_download_providers_program(), create_memory_program(), create_log_level_program() ], add_help = False)
+	return ArgumentParser(parents = [ create_execution_program(), create_session_program(), create_coordinator_program(), create_download_providers_program(), create_memory_program(), create_log_level_program(), create_inference_profile_program() ], add_help = False)
 
 
 def create_program() -> ArgumentParser:
@@ -301,6 +357,8 @@ def create_program() -> ArgumentParser:
 	sub_program.add_parser('batch-run', help = wording.get('help.batch_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('force-download', help = wording.get('help.force_download'), parents = [ create_download_providers_program(), create_download_scope_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('benchmark', help = wording.get('help.benchmark'), parents = [ create_temp_path_program(), collect_step_program(), create_benchmark_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('quantize', help = wording.get('help.quantize'), parents = [ create_config_path_program(), create_temp_path_program(), create_source_paths_program(), create_target_path_program(), collect_step_program(), create_quantize_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('worker', help = wording.get('help.worker'), parents = [ create_config_path_program(), create_temp_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	# job manager
 	sub_program.add_parser('job-list', help = wording.get('help.job_list'), parents = [ create_job_status_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-create', help = wording.get('help.job_create'), parents = [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
@@ -0,0 +1,179 @@
+import importlib
+from functools import partial
+from types import ModuleType
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import numpy
+from numpy.typing import NDArray
+from onnxruntime import InferenceSession
+from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+import facefusion.choices
+from facefusion import logger, state_manager, wording
+from facefusion.common_helper import get_first
+from facefusion.filesystem import get_file_name, is_video
+from facefusion.inference_binder import resolve_session_memory_options
+from facefusion.inference_manager import create_inference_session
+from facefusion.model_helper import resolve_quantize_model_path
+from facefusion.processors.core import create_frame_context, load_processor_module, process_vision_frame
+from facefusion.types import DownloadSet, ErrorCode, InferenceFeed, InferenceFeedSet
+from facefusion.vision import count_video_frame_total, detect_video_fps, read_video_frame
+
+
+class CalibrationFeedReader(CalibrationDataReader):
+	def __init__(self, inference_feeds : List[InferenceFeed]) -> None:
+		self.inference_feeds : Iterator[InferenceFeed] = iter(inference_feeds)
+
+	def get_next(self) -> Optional[InferenceFeed]:
+		return next(self.inference_feeds, None)
+
+
+def pre_check() -> bool:
+	if not is_video(state_manager.get_item('target_path')):
+		logger.error(wording.get('choose_video_target') + wording.get('exclamation_mark'), __name__)
+		return False
+	return True
+
+
+def run() -> ErrorCode:
+	quantize_modules = get_quantize_modules(state_manager.get_item('quantize_modules'))
+	session_memory_options = resolve_session_memory_options()
+	error_code : ErrorCode = 0
+
+	state_manager.set_item('processors', collect_quantize_processors(state_manager.get_item('quantize_modules')))
+	state_manager.set_item('session_memory_options', [ session_memory_option for session_memory_option in session_memory_options if session_memory_option != 'io_binding' ])
+	state_manager.set_item('session_model_precision', 'fp32')
+	inference_feed_set = record_inference_feeds(quantize_modules)
+
+	for model_path, inference_feeds in inference_feed_set.items():
+		model_name = get_file_name(model_path)
+
+		if not inference_feeds:
+			logger.warn(wording.get('quantizing_model_skipped').format(model_name = model_name), __name__)
+			continue
+
+		try:
+			quantize_model_path = quantize_model(model_path, inference_feeds)
+			drift_metric, drift_value = calculate_model_drift(model_path, quantize_model_path, inference_feeds)
+			logger.info(wording.get('quantizing_model_succeeded').format(model_name = model_name, drift_metric = drift_metric, drift_value = drift_value), __name__)
+		except Exception:
+			logger.error(wording.get('quantizing_model_failed').format(model_name = model_name), __name__)
+			error_code = 1
+
+	return error_code
+
+
+def get_quantize_modules(quantize_module_names : List[str]) -> List[ModuleType]:
+	quantize_modules = []
+
+	for quantize_module_name in quantize_module_names:
+		if quantize_module_name in facefusion.choices.quantize_modules:
+			quantize_modules.append(importlib.import_module('facefusion.' + quantize_module_name))
+		else:
+			quantize_modules.append(load_processor_module(quantize_module_name))
+	return quantize_modules
+
+
+def collect_quantize_processors(quantize_module_names : List[str]) -> List[str]:
+	processors = list(state_manager.get_item('processors') or [])
+
+	for quantize_module_name in quantize_module_names:
+		if quantize_module_name not in facefusion.choices.quantize_modules and quantize_module_name not in processors:
+			processors.append(quantize_module_name)
+	return processors
+
+
+def collect_model_sources(module : ModuleType) -> DownloadSet:
+	if hasattr(module, 'collect_model_downloads'):
+		_, model_source_set = module.collect_model_downloads()
+		return model_source_set
+	return module.get_model_options().get('sources')
+
+
+def record_inference_feeds(modules : List[ModuleType]) -> InferenceFeedSet:
+	inference_feed_set : InferenceFeedSet = {}
+	inference_session_runs : List[Tuple[InferenceSession, Callable[..., Any]]] = []
+
+	for module in modules:
+		model_source_set = collect_model_sources(module)
+
+		for model_name, inference_session in module.get_inference_pool().items():
+			model_path = model_source_set.get(model_name).get('path')
+			inference_feed_set[model_path] = []
+			inference_session_runs.append((inference_session, inference_session.run))
+			setattr(inference_session, 'run', partial(record_inference_session, inference_feed_set.get(model_path), inference_session.run))
+
+	try:
+		process_calibration_frames()
+	finally:
+		for inference_session, inference_session_run in inference_session_runs:
+			setattr(inference_session, 'run', inference_session_run)
+
+	return inference_feed_set
+
+
+def record_inference_session(inference_feeds : List[InferenceFeed], inference_session_run : Callable[..., Any], output_names : Optional[List[str]], input_feed : InferenceFeed, run_options : Any = None) -> Any:
+	inference_feeds.append({ input_name: numpy.array(input_value) for input_name, input_value in input_feed.items() })
+	return inference_session_run(output_names, input_feed, run_options)
+
+
+def process_calibration_frames() -> None:
+	target_path = state_manager.get_item('target_path')
+	video_frame_total = count_video_frame_total(target_path)
+	frame_context = create_frame_context(detect_video_fps(target_path))
+	frame_numbers = numpy.unique(numpy.linspace(0, max(video_frame_total - 1, 0), state_manager.get_item('quantize_frame_total')).astype(int))
+
+	for frame_number in frame_numbers:
+		target_vision_frame = read_video_frame(target_path, frame_number)
+
+		if numpy.any(target_vision_frame):
+			process_vision_frame(frame_context, target_vision_frame, frame_number)
+
+
+def quantize_model(model_path : str, inference_feeds : List[InferenceFeed]) -> str:
+	quantize_model_path = resolve_quantize_model_path(model_path)
+
+	if state_manager.get_item('quantize_mode') == 'static':
+		quantize_static(model_path, quantize_model_path, CalibrationFeedReader(inference_feeds), quant_format = QuantFormat.QDQ, activation_type = QuantType.QInt8, weight_type = QuantType.QInt8)
+	else:
+		quantize_dynamic(model_path, quantize_model_path, weight_type = QuantType.QInt8)
+	return quantize_model_path
+
+
+def calculate_model_drift(model_path : str, quantize_model_path : str, inference_feeds : List[InferenceFeed]) -> Tuple[str, float]:
+	execution_device_id = get_first(state_manager.get_item('execution_device_ids'))
+	inference_session = create_inference_session(model_path, execution_device_id, [ 'cpu' ])
+	quantize_inference_session = create_inference_session(quantize_model_path, execution_device_id, [ 'cpu' ])
+	drift_metric = 'cosine distance'
+	drift_values = []
+
+	for inference_feed in inference_feeds:
+		output = inference_session.run(None, inference_feed)[0]
+		quantize_output = quantize_inference_session.run(None, inference_feed)[0]
+
+		if output.ndim == 4:
+			drift_metric = 'psnr'
+			drift_values.append(calculate_psnr(output, quantize_output))
+		else:
+			drift_values.append(calculate_cosine_distance(output, quantize_output))
+
+	return drift_metric, round(float(numpy.mean(drift_values)), 4)
+
+
+def calculate_psnr(output : NDArray[Any], quantize_output : NDArray[Any]) -> float:
+	output_range = float(numpy.max(output) - numpy.min(output)) or 1.0
+	output_error = float(numpy.mean(numpy.square(output.astype(numpy.float64) - quantize_output.astype(numpy.float64))))
+
+	if output_error == 0:
+		return 100.0
+	return min(10 * numpy.log10(output_range ** 2 / output_error), 100.0)
+
+
+def calculate_cosine_distance(output : NDArray[Any], quantize_output : NDArray[Any]) -> float:
+	output = output.ravel().astype(numpy.float64)
+	quantize_output = quantize_output.ravel().astype(numpy.float64)
+	output_norm = numpy.linalg.norm(output) * numpy.linalg.norm(quantize_output)
+
+	if output_norm == 0:
+		return 0.0
+	return float(1 - numpy.dot(output, quantize_output) / output_norm)
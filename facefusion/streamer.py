@@ -2,7 +2,7 @@ import os
 import subprocess
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Deque, Generator
+from typing import Deque, Generator, List, Optional
 
 import cv2
 import numpy
@@ -13,13 +13,15 @@ from facefusion.audio import create_empty_audio_frame
 from facefusion.content_analyser import analyse_stream
 from facefusion.ffmpeg import open_ffmpeg
 from facefusion.filesystem import is_directory
-from facefusion.processors.core import get_processors_modules
-from facefusion.types import Fps, StreamMode, VisionFrame
+from facefusion.processors.core import get_processors_modules, select_source_face, select_target_faces
+from facefusion.types import Face, Fps, StreamMode, VisionFrame
 from facefusion.vision import read_static_images
 
 
 def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -> Generator[VisionFrame, None, None]:
 	capture_deque : Deque[VisionFrame] = deque()
+	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+	source_face = select_source_face(get_processors_modules(state_manager.get_item('processors')), source_vision_frames)
 
 	with tqdm(desc = wording.get('streaming'), unit = 'frame', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
@@ -31,7 +33,7 @@ def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -
 					camera_capture.release()
 
 				if numpy.any(capture_frame):
-					future = executor.submit(process_stream_frame, capture_frame)
+					future = executor.submit(process_stream_frame, source_vision_frames, source_face, capture_frame)
 					futures.append(future)
 
 				for future_done in [ future for future in futures if future.done() ]:
@@ -44,21 +46,24 @@ def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -
 					yield capture_deque.popleft()
 
 
-def process_stream_frame(target_vision_frame : VisionFrame) -> VisionFrame:
-	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
+def process_stream_frame(source_vision_frames : List[VisionFrame], source_face : Optional[Face], target_vision_frame : VisionFrame) -> VisionFrame:
 	source_audio_frame = create_empty_audio_frame()
 	source_voice_frame = create_empty_audio_frame()
 	temp_vision_frame = target_vision_frame.copy()
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	target_faces = select_target_faces(processor_modules, None, target_vision_frame)
 
-	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+	for processor_module in processor_modules:
 		logger.disable()
 		if processor_module.pre_process('stream'):
 			logger.enable()
 			temp_vision_frame = processor_module.process_frame(
 			{
 				'source_vision_frames': source_vision_frames,
+				'source_face': source_face,
 				'source_audio_frame': source_audio_frame,
 				'source_voice_frame': source_voice_frame,
+				'target_faces': target_faces,
 				'target_vision_frame': target_vision_frame,
 				'temp_vision_frame': temp_vision_frame
 			})
@@ -1,8 +1,13 @@
 import os
-from typing import List
+import threading
+from time import time
+from typing import List, Optional, Set
 
 from facefusion import state_manager
-from facefusion.filesystem import create_directory, get_file_extension, get_file_name, move_file, remove_directory, resolve_file_pattern
+from facefusion.filesystem import create_directory, get_file_extension, get_file_name, is_directory, is_file, move_file, remove_directory, resolve_file_pattern
+
+TEMP_JOURNAL_LOCK : threading.Lock = threading.Lock()
+TEMP_JOURNAL_LIFETIME : int = 7 * 24 * 60 * 60
 
 
 def get_temp_file_path(file_path : str) -> str:
@@ -26,6 +31,72 @@ def get_temp_frames_pattern(target_path : str, temp_frame_prefix : str) -> str:
 	return os.path.join(temp_directory_path, temp_frame_prefix + '.' + state_manager.get_item('temp_frame_format'))
 
 
+def get_temp_frame_staging_path(temp_frame_path : str) -> str:
+	temp_directory_path, temp_frame_name = os.path.split(temp_frame_path)
+	return os.path.join(temp_directory_path, '.' + temp_frame_name)
+
+
+def get_temp_segment_directory_path(target_path : str, segment_index : int) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'segment-' + str(segment_index).zfill(4))
+
+
+def get_temp_segment_file_path(target_path : str, segment_index : int) -> str:
+	temp_file_extension = get_file_extension(target_path)
+	return get_temp_segment_directory_path(target_path, segment_index) + temp_file_extension
+
+
+def get_temp_segment_frames_pattern(target_path : str, segment_index : int, temp_frame_prefix : str) -> str:
+	temp_segment_directory_path = get_temp_segment_directory_path(target_path, segment_index)
+	return os.path.join(temp_segment_directory_path, temp_frame_prefix + '.' + state_manager.get_item('temp_frame_format'))
+
+
+def resolve_temp_segment_frame_paths(target_path : str, segment_index : int) -> List[str]:
+	temp_segment_frames_pattern = get_temp_segment_frames_pattern(target_path, segment_index, '*')
+	return resolve_file_pattern(temp_segment_frames_pattern)
+
+
+def create_temp_segment_directory(target_path : str, segment_index : int) -> bool:
+	temp_segment_directory_path = get_temp_segment_directory_path(target_path, segment_index)
+	return create_directory(temp_segment_directory_path)
+
+
+def get_temp_journal_path(target_path : str) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'journal.txt')
+
+
+def create_temp_journal(target_path : str, journal_signature : str) -> bool:
+	temp_journal_path = get_temp_journal_path(target_path)
+
+	with open(temp_journal_path, 'w') as temp_journal_file:
+		temp_journal_file.write(journal_signature + '\n')
+	return is_file(temp_journal_path)
+
+
+def read_temp_journal(target_path : str, journal_signature : str) -> Optional[Set[int]]:
+	temp_journal_path = get_temp_journal_path(target_path)
+
+	if is_file(temp_journal_path):
+		with open(temp_journal_path) as temp_journal_file:
+			journal_lines = temp_journal_file.read().split('\n')[:-1]
+
+		if journal_lines and journal_lines[0] == journal_signature:
+			return { int(journal_line) for journal_line in journal_lines[1:] if journal_line.isdigit() }
+	return None
+
+
+def append_temp_journal(target_path : str, frame_number : int) -> bool:
+	temp_journal_path = get_temp_journal_path(target_path)
+
+	if is_file(temp_journal_path):
+		with TEMP_JOURNAL_LOCK:
+			with open(temp_journal_path, 'a') as temp_journal_file:
+				temp_journal_file.write(str(frame_number) + '\n')
+		return True
+	return False
+
+
 def get_temp_directory_path(file_path : str) -> str:
 	temp_file_name = get_file_name(file_path)
 	return os.path.join(state_manager.get_item('temp_path'), 'facefusion', temp_file_name)
@@ -41,3 +112,14 @@ def clear_temp_directory(file_path : str) -> bool:
 		temp_directory_path = get_temp_directory_path(file_path)
 		return remove_directory(temp_directory_path)
 	return True
+
+
+def clear_stale_temp_directories() -> None:
+	temp_directory_path = os.path.join(state_manager.get_item('temp_path'), 'facefusion')
+
+	if is_directory(temp_directory_path) and not state_manager.get_item('keep_temp'):
+		for temp_file_name in os.listdir(temp_directory_path):
+			temp_journal_path = os.path.join(temp_directory_path, temp_file_name, 'journal.txt')
+
+			if is_file(temp_journal_path) and os.path.getmtime(temp_journal_path) < time() - TEMP_JOURNAL_LIFETIME:
+				remove_directory(os.path.dirname(temp_journal_path))
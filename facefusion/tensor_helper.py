@@ -0,0 +1,33 @@
+from typing import List
+
+import cv2
+import numpy
+
+from facefusion.types import Resolution, VisionFrame
+
+
+def letterbox_frame(vision_frame : VisionFrame, resolution : Resolution) -> VisionFrame:
+	width, height = resolution
+	vision_height, vision_width = vision_frame.shape[:2]
+	return cv2.copyMakeBorder(vision_frame, 0, max(height - vision_height, 0), 0, max(width - vision_width, 0), cv2.BORDER_CONSTANT, value = 0)
+
+
+def transpose_tensor_frame(vision_frame : VisionFrame) -> VisionFrame:
+	return numpy.expand_dims(numpy.ascontiguousarray(vision_frame.transpose(2, 0, 1), dtype = numpy.float32), axis = 0)
+
+
+def prepare_tensor_frame(vision_frame : VisionFrame, tensor_mean : List[float], tensor_standard_deviation : List[float]) -> VisionFrame:
+	frame_mean = numpy.multiply(tensor_mean, 255, dtype = numpy.float32)
+	frame_scale = numpy.divide(1, numpy.multiply(tensor_standard_deviation, 255), dtype = numpy.float32)
+	tensor_frame = numpy.subtract(vision_frame[:, :, ::-1], frame_mean, dtype = numpy.float32)
+	tensor_frame *= frame_scale
+	return transpose_tensor_frame(tensor_frame)
+
+
+def normalize_tensor_frame(tensor_frame : VisionFrame, tensor_mean : List[float], tensor_standard_deviation : List[float]) -> VisionFrame:
+	frame_mean = numpy.multiply(tensor_mean, 255, dtype = numpy.float32)
+	frame_scale = numpy.multiply(tensor_standard_deviation, 255, dtype = numpy.float32)
+	vision_frame = numpy.multiply(tensor_frame.transpose(1, 2, 0), frame_scale, dtype = numpy.float32)
+	vision_frame += frame_mean
+	vision_frame = numpy.clip(vision_frame[:, :, ::-1], 0, 255)
+	return numpy.ascontiguousarray(vision_frame, dtype = numpy.uint8)
@@ -2,8 +2,10 @@ import threading
 from contextlib import nullcontext
 from typing import ContextManager, Union
 
+from facefusion import state_manager
 from facefusion.common_helper import is_linux, is_windows
 from facefusion.execution import has_execution_provider
+from facefusion.inference_profiler import profile_semaphore
 
 THREAD_LOCK : threading.Lock = threading.Lock()
 THREAD_SEMAPHORE : threading.Semaphore = threading.Semaphore()
@@ -14,11 +16,13 @@ def thread_lock() -> threading.Lock:
 	return THREAD_LOCK
 
 
-def thread_semaphore() -> threading.Semaphore:
+def thread_semaphore() -> Union[threading.Semaphore, ContextManager[None]]:
+	if state_manager.get_item('inference_profile'):
+		return profile_semaphore(THREAD_SEMAPHORE)
 	return THREAD_SEMAPHORE
 
 
 def conditional_thread_semaphore() -> Union[threading.Semaphore, ContextManager[None]]:
 	if is_windows() and has_execution_provider('directml') or is_linux() and has_execution_provider('migraphx') or is_linux() and has_execution_provider('rocm'):
-		return THREAD_SEMAPHORE
+		return thread_semaphore()
 	return NULL_CONTEXT
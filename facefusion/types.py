@@ -1,10 +1,14 @@
+import threading
 from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeAlias, TypedDict
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, OrderedDict, Tuple, TypeAlias, TypedDict, Union
 
 import cv2
 import numpy
 from numpy.typing import NDArray
-from onnxruntime import InferenceSession
+from onnxruntime import ExecutionMode, GraphOptimizationLevel, IOBinding, InferenceSession
 
 Scale : TypeAlias = float
 Score : TypeAlias = float
@@ -44,26 +48,74 @@ Face = namedtuple('Face',
 	'age',
 	'race'
 ])
-FaceSet : TypeAlias = Dict[str, List[Face]]
+FaceSet : TypeAlias = OrderedDict[str, List[Face]]
 FaceStore = TypedDict('FaceStore',
 {
-	'static_faces' : FaceSet
+	'static_faces' : FaceSet,
+	'static_faces_size' : int,
+	'hit_total' : int,
+	'miss_total' : int
+})
+FaceTrack = TypedDict('FaceTrack',
+{
+	'vision_frame' : NDArray[Any],
+	'faces' : List[Face],
+	'track_count' : int
 })
 
 VideoCaptureSet : TypeAlias = Dict[str, cv2.VideoCapture]
 VideoWriterSet : TypeAlias = Dict[str, cv2.VideoWriter]
+VideoReader = TypedDict('VideoReader',
+{
+	'video_capture' : cv2.VideoCapture,
+	'frame_index' : int
+})
+VideoReaderSet : TypeAlias = Dict[Tuple[int, str], VideoReader]
+VideoFrameSet : TypeAlias = OrderedDict[Tuple[str, int], NDArray[Any]]
 CameraCaptureSet : TypeAlias = Dict[str, cv2.VideoCapture]
 VideoPoolSet = TypedDict('VideoPoolSet',
 {
 	'capture': VideoCaptureSet,
-	'writer': VideoWriterSet
+	'writer': VideoWriterSet,
+	'reader': VideoReaderSet
 })
 CameraPoolSet = TypedDict('CameraPoolSet',
 {
 	'capture': CameraCaptureSet
 })
+ProcessWorker = TypedDict('ProcessWorker',
+{
+	'process' : BaseProcess,
+	'connection' : Connection,
+	'shared_memory' : Optional[SharedMemory]
+})
 
 VisionFrame : TypeAlias = NDArray[Any]
+TempFrame = TypedDict('TempFrame',
+{
+	'frame_number' : int,
+	'frame_path' : str,
+	'vision_frame' : Optional[VisionFrame]
+})
+VideoSegment = TypedDict('VideoSegment',
+{
+	'keyframe_number' : int,
+	'frame_start' : int,
+	'frame_end' : int
+})
+FrameFingerprint : TypeAlias = NDArray[Any]
+ReuseFrame = TypedDict('ReuseFrame',
+{
+	'frame_fingerprint' : FrameFingerprint,
+	'target_shape' : Tuple[int, ...],
+	'vision_frame' : VisionFrame
+})
+FrameStore = TypedDict('FrameStore',
+{
+	'reuse_frames' : Deque[ReuseFrame],
+	'frame_total' : int,
+	'reuse_total' : int
+})
 Mask : TypeAlias = NDArray[Any]
 Points : TypeAlias = NDArray[Any]
 Distance : TypeAlias = NDArray[Any]
@@ -87,10 +139,53 @@ Padding : TypeAlias = Tuple[int, int, int, int]
 Orientation = Literal['landscape', 'portrait']
 Resolution : TypeAlias = Tuple[int, int]
 
+FileStamp : TypeAlias = Tuple[int, int]
+StaticImage = TypedDict('StaticImage',
+{
+	'file_stamp' : FileStamp,
+	'vision_frame' : VisionFrame
+})
+ImageSet : TypeAlias = OrderedDict[str, StaticImage]
+ImageStore = TypedDict('ImageStore',
+{
+	'static_images' : ImageSet,
+	'static_images_size' : int,
+	'hit_total' : int,
+	'miss_total' : int
+})
+MediaProbe = TypedDict('MediaProbe',
+{
+	'resolution' : Resolution,
+	'fps' : Optional[Fps],
+	'frame_total' : int
+})
+ProbedMedia = TypedDict('ProbedMedia',
+{
+	'file_stamp' : FileStamp,
+	'media_probe' : MediaProbe
+})
+MediaProbeSet : TypeAlias = Dict[str, ProbedMedia]
+MediaProbeStore = TypedDict('MediaProbeStore',
+{
+	'media_probes' : MediaProbeSet,
+	'hit_total' : int,
+	'miss_total' : int
+})
+
 ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 Args : TypeAlias = Dict[str, Any]
 UpdateProgress : TypeAlias = Callable[[int], None]
 ProcessStep : TypeAlias = Callable[[str, int, Args], bool]
+ProcessStage : TypeAlias = Callable[[Any], Any]
+
+FrameContext = TypedDict('FrameContext',
+{
+	'reference_vision_frame' : VisionFrame,
+	'source_vision_frames' : List[VisionFrame],
+	'source_face' : Optional[Face],
+	'source_audio_path' : Optional[str],
+	'temp_video_fps' : Fps
+})
 
 Content : TypeAlias = Dict[str, Any]
 
@@ -101,6 +196,19 @@ WarpTemplateSet : TypeAlias = Dict[WarpTemplate, NDArray[Any]]
 ProcessMode = Literal['output', 'preview', 'stream']
 
 ErrorCode = Literal[0, 1, 2, 3, 4]
+
+CoordinatorAddress : TypeAlias = Union[Tuple[str, int], str]
+WorkerTask = TypedDict('WorkerTask',
+{
+	'step_args' : Args,
+	'segment_index' : int,
+	'video_segment' : VideoSegment,
+	'frame_offset' : int,
+	'temp_video_fps' : Fps,
+	'temp_video_resolution' : Resolution,
+	'output_video_resolution' : Resolution
+})
+
 LogLevel = Literal['error', 'warn', 'info', 'debug']
 LogLevelSet : TypeAlias = Dict[LogLevel, int]
 
@@ -126,6 +234,7 @@ AudioFormat = Literal['flac', 'm4a', 'mp3', 'ogg', 'opus', 'wav']
 ImageFormat = Literal['bmp', 'jpeg', 'png', 'tiff', 'webp']
 VideoFormat = Literal['avi', 'm4v', 'mkv', 'mov', 'mp4', 'webm', 'wmv']
 TempFrameFormat = Literal['bmp', 'jpeg', 'png', 'tiff']
+TempFrameMode = Literal['disk', 'pipe']
 AudioTypeSet : TypeAlias = Dict[AudioFormat, str]
 ImageTypeSet : TypeAlias = Dict[ImageFormat, str]
 VideoTypeSet : TypeAlias = Dict[VideoFormat, str]
@@ -139,12 +248,16 @@ EncoderSet = TypedDict('EncoderSet',
 })
 VideoPreset = Literal['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow']
 
+ExecutionWorkerMode = Literal['thread', 'process']
+
 BenchmarkMode = Literal['warm', 'cold']
+QuantizeMode = Literal['dynamic', 'static']
 BenchmarkResolution = Literal['240p', '360p', '540p', '720p', '1080p', '1440p', '2160p']
 BenchmarkSet : TypeAlias = Dict[BenchmarkResolution, str]
 BenchmarkCycleSet = TypedDict('BenchmarkCycleSet',
 {
 	'target_path' : str,
+	'worker_mode' : ExecutionWorkerMode,
 	'cycle_count' : int,
 	'average_run' : float,
 	'fastest_run' : float,
@@ -163,6 +276,13 @@ ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'mi
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'MIGraphXExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet : TypeAlias = Dict[ExecutionProvider, ExecutionProviderValue]
 InferenceSessionProvider : TypeAlias = Any
+SessionExecutionMode = Literal['sequential', 'parallel']
+SessionExecutionModeSet : TypeAlias = Dict[SessionExecutionMode, ExecutionMode]
+SessionGraphOptimization = Literal['disabled', 'basic', 'extended', 'all']
+SessionGraphOptimizationSet : TypeAlias = Dict[SessionGraphOptimization, GraphOptimizationLevel]
+SessionMemoryOption = Literal['memory_pattern', 'cpu_arena', 'io_binding']
+SessionModelPrecision = Literal['fp32', 'int8']
+SessionConcurrencyMode = Literal['static', 'adaptive']
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
 	'value' : int,
@@ -218,11 +338,71 @@ Download = TypedDict('Download',
 })
 DownloadSet : TypeAlias = Dict[str, Download]
 
-VideoMemoryStrategy = Literal['strict', 'moderate', 'tolerant']
 AppContext = Literal['cli', 'ui']
 
 InferencePool : TypeAlias = Dict[str, InferenceSession]
 InferencePoolSet : TypeAlias = Dict[AppContext, Dict[str, InferencePool]]
+InferenceLoad = TypedDict('InferenceLoad',
+{
+	'active_total' : int,
+	'request_total' : int,
+	'busy_time' : float,
+	'start_time' : float
+})
+InferenceLoadSet : TypeAlias = Dict[str, InferenceLoad]
+InferenceResidencySet : TypeAlias = OrderedDict[str, int]
+InferenceProfile = TypedDict('InferenceProfile',
+{
+	'run_times' : List[float],
+	'wait_times' : List[float]
+})
+InferenceProfileSet : TypeAlias = Dict[str, InferenceProfile]
+InferenceLimit = TypedDict('InferenceLimit',
+{
+	'concurrency_mode' : SessionConcurrencyMode,
+	'condition' : threading.Condition,
+	'active_total' : int,
+	'limit_total' : int,
+	'limit_ceiling' : int,
+	'limit_max' : int,
+	'recovery_total' : int,
+	'busy_start' : float,
+	'window_total' : int,
+	'window_wait_total' : int,
+	'window_run_time' : float,
+	'window_busy_time' : float,
+	'throughput' : float,
+	'latency' : float
+})
+InferenceFeed : TypeAlias = Dict[str, NDArray[Any]]
+InferenceFeedSet : TypeAlias = Dict[str, List[InferenceFeed]]
+InferenceBinding = TypedDict('InferenceBinding',
+{
+	'io_binding' : IOBinding,
+	'output_buffer_set' : Dict[Tuple[Any, ...], List[NDArray[Any]]]
+})
+InferenceBatchKey : TypeAlias = Tuple[Any, ...]
+InferenceBatchRequest = TypedDict('InferenceBatchRequest',
+{
+	'input_feed' : Dict[str, NDArray[Any]],
+	'outputs' : List[Any],
+	'error' : Optional[Exception],
+	'event' : threading.Event,
+	'start_time' : float,
+	'wait_time' : float
+})
+InferenceBatch = TypedDict('InferenceBatch',
+{
+	'condition' : threading.Condition,
+	'request_set' : Dict[InferenceBatchKey, List[InferenceBatchRequest]]
+})
+InferenceBatchStatistic = TypedDict('InferenceBatchStatistic',
+{
+	'batch_total' : int,
+	'request_total' : int,
+	'wait_time' : float
+})
+InferenceBatchStatisticSet : TypeAlias = Dict[str, InferenceBatchStatistic]
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -265,10 +445,15 @@ StateKey = Literal\
 	'benchmark_mode',
 	'benchmark_resolutions',
 	'benchmark_cycle_count',
+	'benchmark_worker_modes',
+	'quantize_modules',
+	'quantize_mode',
+	'quantize_frame_total',
 	'face_detector_model',
 	'face_detector_size',
 	'face_detector_angles',
 	'face_detector_score',
+	'face_tracker_interval',
 	'face_landmarker_model',
 	'face_landmarker_score',
 	'face_selector_mode',
@@ -291,6 +476,9 @@ StateKey = Literal\
 	'trim_frame_start',
 	'trim_frame_end',
 	'temp_frame_format',
+	'temp_frame_mode',
+	'video_segment_count',
+	'frame_reuse_threshold',
 	'keep_temp',
 	'output_image_quality',
 	'output_image_scale',
@@ -309,10 +497,30 @@ StateKey = Literal\
 	'execution_device_ids',
 	'execution_providers',
 	'execution_thread_count',
-	'video_memory_strategy',
+	'execution_replica_count',
+	'execution_batch_size',
+	'execution_batch_timeout',
+	'execution_worker_mode',
+	'coordinator_address',
+	'coordinator_secret',
+	'session_intra_op_thread_count',
+	'session_inter_op_thread_count',
+	'session_execution_mode',
+	'session_graph_optimization',
+	'session_memory_options',
+	'session_model_cache',
+	'session_model_precision',
+	'session_concurrency_mode',
+	'session_concurrency_limit',
+	'inference_memory_limit',
 	'system_memory_limit',
+	'face_store_entry_limit',
+	'face_store_memory_limit',
+	'image_store_memory_limit',
 	'log_level',
 	'halt_on_error',
+	'inference_profile',
+	'inference_profile_path',
 	'job_id',
 	'job_status',
 	'step_index'
@@ -334,10 +542,15 @@ State = TypedDict('State',
 	'benchmark_mode' : BenchmarkMode,
 	'benchmark_resolutions' : List[BenchmarkResolution],
 	'benchmark_cycle_count' : int,
+	'benchmark_worker_modes' : List[ExecutionWorkerMode],
+	'quantize_modules' : List[str],
+	'quantize_mode' : QuantizeMode,
+	'quantize_frame_total' : int,
 	'face_detector_model' : FaceDetectorModel,
 	'face_detector_size' : str,
 	'face_detector_angles' : List[Angle],
 	'face_detector_score' : Score,
+	'face_tracker_interval' : int,
 	'face_landmarker_model' : FaceLandmarkerModel,
 	'face_landmarker_score' : Score,
 	'face_selector_mode' : FaceSelectorMode,
@@ -360,6 +573,9 @@ State = TypedDict('State',
 	'trim_frame_start' : int,
 	'trim_frame_end' : int,
 	'temp_frame_format' : TempFrameFormat,
+	'temp_frame_mode' : TempFrameMode,
+	'video_segment_count' : int,
+	'frame_reuse_threshold' : float,
 	'keep_temp' : bool,
 	'output_image_quality' : int,
 	'output_image_scale' : Scale,
@@ -378,10 +594,30 @@ State = TypedDict('State',
 	'execution_device_ids' : List[str],
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
-	'video_memory_strategy' : VideoMemoryStrategy,
+	'execution_replica_count' : int,
+	'execution_batch_size' : int,
+	'execution_batch_timeout' : int,
+	'execution_worker_mode' : ExecutionWorkerMode,
+	'coordinator_address' : Optional[str],
+	'coordinator_secret' : Optional[str],
+	'session_intra_op_thread_count' : int,
+	'session_inter_op_thread_count' : int,
+	'session_execution_mode' : SessionExecutionMode,
+	'session_graph_optimization' : SessionGraphOptimization,
+	'session_memory_options' : List[SessionMemoryOption],
+	'session_model_cache' : bool,
+	'session_model_precision' : SessionModelPrecision,
+	'session_concurrency_mode' : SessionConcurrencyMode,
+	'session_concurrency_limit' : int,
+	'inference_memory_limit' : int,
 	'system_memory_limit' : int,
+	'face_store_entry_limit' : int,
+	'face_store_memory_limit' : int,
+	'image_store_memory_limit' : int,
 	'log_level' : LogLevel,
 	'halt_on_error' : bool,
+	'inference_profile' : bool,
+	'inference_profile_path' : Optional[str],
 	'job_id' : str,
 	'job_status' : JobStatus,
 	'step_index' : int
@@ -16,6 +16,7 @@ def render() -> None:
 		headers =
 		[
 			'target_path',
+			'worker_mode',
 			'cycle_count',
 			'average_run',
 			'fastest_run',
@@ -24,6 +25,7 @@ def render() -> None:
 		],
 		datatype =
 		[
+			'str',
 			'str',
 			'number',
 			'number',
@@ -5,17 +5,19 @@ import gradio
 import facefusion.choices
 from facefusion import state_manager, wording
 from facefusion.common_helper import calculate_int_step
-from facefusion.types import BenchmarkMode, BenchmarkResolution
+from facefusion.types import BenchmarkMode, BenchmarkResolution, ExecutionWorkerMode
 
 BENCHMARK_MODE_DROPDOWN : Optional[gradio.Dropdown] = None
 BENCHMARK_RESOLUTIONS_CHECKBOX_GROUP : Optional[gradio.CheckboxGroup] = None
 BENCHMARK_CYCLE_COUNT_SLIDER : Optional[gradio.Button] = None
+BENCHMARK_WORKER_MODES_CHECKBOX_GROUP : Optional[gradio.CheckboxGroup] = None
 
 
 def render() -> None:
 	global BENCHMARK_MODE_DROPDOWN
 	global BENCHMARK_RESOLUTIONS_CHECKBOX_GROUP
 	global BENCHMARK_CYCLE_COUNT_SLIDER
+	global BENCHMARK_WORKER_MODES_CHECKBOX_GROUP
 
 	BENCHMARK_MODE_DROPDOWN = gradio.Dropdown(
 		label = wording.get('uis.benchmark_mode_dropdown'),
@@ -34,12 +36,18 @@ def render() -> None:
 		minimum = facefusion.choices.benchmark_cycle_count_range[0],
 		maximum = facefusion.choices.benchmark_cycle_count_range[-1]
 	)
+	BENCHMARK_WORKER_MODES_CHECKBOX_GROUP = gradio.CheckboxGroup(
+		label = wording.get('uis.benchmark_worker_modes_checkbox_group'),
+		choices = facefusion.choices.execution_worker_modes,
+		value = state_manager.get_item('benchmark_worker_modes')
+	)
 
 
 def listen() -> None:
 	BENCHMARK_MODE_DROPDOWN.change(update_benchmark_mode, inputs = BENCHMARK_MODE_DROPDOWN)
 	BENCHMARK_RESOLUTIONS_CHECKBOX_GROUP.change(update_benchmark_resolutions, inputs = BENCHMARK_RESOLUTIONS_CHECKBOX_GROUP)
 	BENCHMARK_CYCLE_COUNT_SLIDER.release(update_benchmark_cycle_count, inputs = BENCHMARK_CYCLE_COUNT_SLIDER)
+	BENCHMARK_WORKER_MODES_CHECKBOX_GROUP.change(update_benchmark_worker_modes, inputs = BENCHMARK_WORKER_MODES_CHECKBOX_GROUP)
 
 
 def update_benchmark_mode(benchmark_mode : BenchmarkMode) -> None:
@@ -52,3 +60,7 @@ def update_benchmark_resolutions(benchmark_resolutions : List[BenchmarkResolutio
 
 def update_benchmark_cycle_count(benchmark_cycle_count : int) -> None:
 	state_manager.set_item('benchmark_cycle_count', benchmark_cycle_count)
+
+
+def update_benchmark_worker_modes(benchmark_worker_modes : List[ExecutionWorkerMode]) -> None:
+	state_manager.set_item('benchmark_worker_modes', benchmark_worker_modes)
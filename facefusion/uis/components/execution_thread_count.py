@@ -5,12 +5,15 @@ import gradio
 import facefusion.choices
 from facefusion import state_manager, wording
 from facefusion.common_helper import calculate_int_step
+from facefusion.types import ExecutionWorkerMode
 
 EXECUTION_THREAD_COUNT_SLIDER : Optional[gradio.Slider] = None
+EXECUTION_WORKER_MODE_DROPDOWN : Optional[gradio.Dropdown] = None
 
 
 def render() -> None:
 	global EXECUTION_THREAD_COUNT_SLIDER
+	global EXECUTION_WORKER_MODE_DROPDOWN
 
 	EXECUTION_THREAD_COUNT_SLIDER = gradio.Slider(
 		label = wording.get('uis.execution_thread_count_slider'),
@@ -19,11 +22,21 @@ def render() -> None:
 		minimum = facefusion.choices.execution_thread_count_range[0],
 		maximum = facefusion.choices.execution_thread_count_range[-1]
 	)
+	EXECUTION_WORKER_MODE_DROPDOWN = gradio.Dropdown(
+		label = wording.get('uis.execution_worker_mode_dropdown'),
+		choices = facefusion.choices.execution_worker_modes,
+		value = state_manager.get_item('execution_worker_mode')
+	)
 
 
 def listen() -> None:
 	EXECUTION_THREAD_COUNT_SLIDER.release(update_execution_thread_count, inputs = EXECUTION_THREAD_COUNT_SLIDER)
+	EXECUTION_WORKER_MODE_DROPDOWN.change(update_execution_worker_mode, inputs = EXECUTION_WORKER_MODE_DROPDOWN)
 
 
 def update_execution_thread_count(execution_thread_count : float) -> None:
 	state_manager.set_item('execution_thread_count', int(execution_thread_count))
+
+
+def update_execution_worker_mode(execution_worker_mode : ExecutionWorkerMode) -> None:
+	state_manager.set_item('execution_worker_mode', execution_worker_mode)
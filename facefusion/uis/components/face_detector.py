@@ -4,7 +4,7 @@ import gradio
 
 import facefusion.choices
 from facefusion import face_detector, state_manager, wording
-from facefusion.common_helper import calculate_float_step, get_last
+from facefusion.common_helper import calculate_float_step, calculate_int_step, get_last
 from facefusion.types import Angle, FaceDetectorModel, Score
 from facefusion.uis.core import register_ui_component
 from facefusion.uis.types import ComponentOptions
@@ -13,6 +13,7 @@ FACE_DETECTOR_MODEL_DROPDOWN : Optional[gradio.Dropdown] = None
 FACE_DETECTOR_SIZE_DROPDOWN : Optional[gradio.Dropdown] = None
 FACE_DETECTOR_ANGLES_CHECKBOX_GROUP : Optional[gradio.CheckboxGroup] = None
 FACE_DETECTOR_SCORE_SLIDER : Optional[gradio.Slider] = None
+FACE_TRACKER_INTERVAL_SLIDER : Optional[gradio.Slider] = None
 
 
 def render() -> None:
@@ -20,6 +21,7 @@ def render() -> None:
 	global FACE_DETECTOR_SIZE_DROPDOWN
 	global FACE_DETECTOR_ANGLES_CHECKBOX_GROUP
 	global FACE_DETECTOR_SCORE_SLIDER
+	global FACE_TRACKER_INTERVAL_SLIDER
 
 	face_detector_size_dropdown_options : ComponentOptions =\
 	{
@@ -47,10 +49,18 @@ def render() -> None:
 		minimum = facefusion.choices.face_detector_score_range[0],
 		maximum = facefusion.choices.face_detector_score_range[-1]
 	)
+	FACE_TRACKER_INTERVAL_SLIDER = gradio.Slider(
+		label = wording.get('uis.face_tracker_interval_slider'),
+		value = state_manager.get_item('face_tracker_interval'),
+		step = calculate_int_step(facefusion.choices.face_tracker_interval_range),
+		minimum = facefusion.choices.face_tracker_interval_range[0],
+		maximum = facefusion.choices.face_tracker_interval_range[-1]
+	)
 	register_ui_component('face_detector_model_dropdown', FACE_DETECTOR_MODEL_DROPDOWN)
 	register_ui_component('face_detector_size_dropdown', FACE_DETECTOR_SIZE_DROPDOWN)
 	register_ui_component('face_detector_angles_checkbox_group', FACE_DETECTOR_ANGLES_CHECKBOX_GROUP)
 	register_ui_component('face_detector_score_slider', FACE_DETECTOR_SCORE_SLIDER)
+	register_ui_component('face_tracker_interval_slider', FACE_TRACKER_INTERVAL_SLIDER)
 
 
 def listen() -> None:
@@ -58,6 +68,7 @@ def listen() -> None:
 	FACE_DETECTOR_SIZE_DROPDOWN.change(update_face_detector_size, inputs = FACE_DETECTOR_SIZE_DROPDOWN)
 	FACE_DETECTOR_ANGLES_CHECKBOX_GROUP.change(update_face_detector_angles, inputs = FACE_DETECTOR_ANGLES_CHECKBOX_GROUP, outputs = FACE_DETECTOR_ANGLES_CHECKBOX_GROUP)
 	FACE_DETECTOR_SCORE_SLIDER.release(update_face_detector_score, inputs = FACE_DETECTOR_SCORE_SLIDER)
+	FACE_TRACKER_INTERVAL_SLIDER.release(update_face_tracker_interval, inputs = FACE_TRACKER_INTERVAL_SLIDER)
 
 
 def update_face_detector_model(face_detector_model : FaceDetectorModel) -> Tuple[gradio.Dropdown, gradio.Dropdown]:
@@ -83,3 +94,7 @@ def update_face_detector_angles(face_detector_angles : Sequence[Angle]) -> gradi
 
 def update_face_detector_score(face_detector_score : Score) -> None:
 	state_manager.set_item('face_detector_score', face_detector_score)
+
+
+def update_face_tracker_interval(face_tracker_interval : float) -> None:
+	state_manager.set_item('face_tracker_interval', int(face_tracker_interval))
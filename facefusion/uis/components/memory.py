@@ -5,20 +5,21 @@ import gradio
 import facefusion.choices
 from facefusion import state_manager, wording
 from facefusion.common_helper import calculate_int_step
-from facefusion.types import VideoMemoryStrategy
 
-VIDEO_MEMORY_STRATEGY_DROPDOWN : Optional[gradio.Dropdown] = None
+INFERENCE_MEMORY_LIMIT_SLIDER : Optional[gradio.Slider] = None
 SYSTEM_MEMORY_LIMIT_SLIDER : Optional[gradio.Slider] = None
 
 
 def render() -> None:
-	global VIDEO_MEMORY_STRATEGY_DROPDOWN
+	global INFERENCE_MEMORY_LIMIT_SLIDER
 	global SYSTEM_MEMORY_LIMIT_SLIDER
 
-	VIDEO_MEMORY_STRATEGY_DROPDOWN = gradio.Dropdown(
-		label = wording.get('uis.video_memory_strategy_dropdown'),
-		choices = facefusion.choices.video_memory_strategies,
-		value = state_manager.get_item('video_memory_strategy')
+	INFERENCE_MEMORY_LIMIT_SLIDER = gradio.Slider(
+		label = wording.get('uis.inference_memory_limit_slider'),
+		step = calculate_int_step(facefusion.choices.inference_memory_limit_range),
+		minimum = facefusion.choices.inference_memory_limit_range[0],
+		maximum = facefusion.choices.inference_memory_limit_range[-1],
+		value = state_manager.get_item('inference_memory_limit')
 	)
 	SYSTEM_MEMORY_LIMIT_SLIDER = gradio.Slider(
 		label = wording.get('uis.system_memory_limit_slider'),
@@ -30,12 +31,12 @@ def render() -> None:
 
 
 def listen() -> None:
-	VIDEO_MEMORY_STRATEGY_DROPDOWN.change(update_video_memory_strategy, inputs = VIDEO_MEMORY_STRATEGY_DROPDOWN)
+	INFERENCE_MEMORY_LIMIT_SLIDER.release(update_inference_memory_limit, inputs = INFERENCE_MEMORY_LIMIT_SLIDER)
 	SYSTEM_MEMORY_LIMIT_SLIDER.release(update_system_memory_limit, inputs = SYSTEM_MEMORY_LIMIT_SLIDER)
 
 
-def update_video_memory_strategy(video_memory_strategy : VideoMemoryStrategy) -> None:
-	state_manager.set_item('video_memory_strategy', video_memory_strategy)
+def update_inference_memory_limit(inference_memory_limit : float) -> None:
+	state_manager.set_item('inference_memory_limit', int(inference_memory_limit))
 
 
 def update_system_memory_limit(system_memory_limit : float) -> None:
@@ -13,7 +13,7 @@ from facefusion.face_analyser import get_one_face
 from facefusion.face_selector import select_faces
 from facefusion.face_store import clear_static_faces
 from facefusion.filesystem import filter_audio_paths, is_image, is_video
-from facefusion.processors.core import get_processors_modules
+from facefusion.processors.core import get_processors_modules, select_source_face
 from facefusion.types import AudioFrame, Face, VisionFrame
 from facefusion.uis import choices as uis_choices
 from facefusion.uis.core import get_ui_component, get_ui_components, register_ui_component
@@ -218,7 +218,8 @@ def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_fr
 			return numpy.hstack((temp_vision_frame, temp_vision_frame))
 
 		if preview_mode == 'face-by-face':
-			target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(reference_vision_frame, target_vision_frame, temp_vision_frame)
+			target_faces = select_faces(reference_vision_frame, target_vision_frame)
+			target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(target_faces, target_vision_frame, temp_vision_frame)
 			target_crop_vision_frame = obscure_frame(target_crop_vision_frame)
 			output_crop_vision_frame = obscure_frame(output_crop_vision_frame)
 			return numpy.hstack((target_crop_vision_frame, output_crop_vision_frame))
@@ -226,16 +227,21 @@ def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_fr
 		temp_vision_frame = obscure_frame(temp_vision_frame)
 		return temp_vision_frame
 
-	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	source_face = select_source_face(processor_modules, source_vision_frames)
+	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+
+	for processor_module in processor_modules:
 		logger.disable()
 		if processor_module.pre_process('preview'):
 			logger.enable()
 			temp_vision_frame = processor_module.process_frame(
 			{
-				'reference_vision_frame': reference_vision_frame,
 				'source_audio_frame': source_audio_frame,
 				'source_voice_frame': source_voice_frame,
 				'source_vision_frames': source_vision_frames,
+				'source_face': source_face,
+				'target_faces': target_faces,
 				'target_vision_frame': target_vision_frame,
 				'temp_vision_frame': temp_vision_frame
 			})
@@ -247,14 +253,13 @@ def process_preview_frame(reference_vision_frame : VisionFrame, source_vision_fr
 		return numpy.hstack((target_vision_frame, temp_vision_frame))
 
 	if preview_mode == 'face-by-face':
-		target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(reference_vision_frame, target_vision_frame, temp_vision_frame)
+		target_crop_vision_frame, output_crop_vision_frame = create_face_by_face(target_faces, target_vision_frame, temp_vision_frame)
 		return numpy.hstack((target_crop_vision_frame, output_crop_vision_frame))
 
 	return temp_vision_frame
 
 
-def create_face_by_face(reference_vision_frame : VisionFrame, target_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> Tuple[VisionFrame, VisionFrame]:
-	target_faces = select_faces(reference_vision_frame, target_vision_frame)
+def create_face_by_face(target_faces : List[Face], target_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> Tuple[VisionFrame, VisionFrame]:
 	target_face = get_one_face(target_faces)
 
 	if target_face:
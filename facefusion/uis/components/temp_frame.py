@@ -1,18 +1,23 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import gradio
 
 import facefusion.choices
 from facefusion import state_manager, wording
+from facefusion.common_helper import calculate_int_step
 from facefusion.filesystem import is_video
-from facefusion.types import TempFrameFormat
+from facefusion.types import TempFrameFormat, TempFrameMode
 from facefusion.uis.core import get_ui_component
 
 TEMP_FRAME_FORMAT_DROPDOWN : Optional[gradio.Dropdown] = None
+TEMP_FRAME_MODE_DROPDOWN : Optional[gradio.Dropdown] = None
+VIDEO_SEGMENT_COUNT_SLIDER : Optional[gradio.Slider] = None
 
 
 def render() -> None:
 	global TEMP_FRAME_FORMAT_DROPDOWN
+	global TEMP_FRAME_MODE_DROPDOWN
+	global VIDEO_SEGMENT_COUNT_SLIDER
 
 	TEMP_FRAME_FORMAT_DROPDOWN = gradio.Dropdown(
 		label = wording.get('uis.temp_frame_format_dropdown'),
@@ -20,23 +25,46 @@ def render() -> None:
 		value = state_manager.get_item('temp_frame_format'),
 		visible = is_video(state_manager.get_item('target_path'))
 	)
+	TEMP_FRAME_MODE_DROPDOWN = gradio.Dropdown(
+		label = wording.get('uis.temp_frame_mode_dropdown'),
+		choices = facefusion.choices.temp_frame_modes,
+		value = state_manager.get_item('temp_frame_mode'),
+		visible = is_video(state_manager.get_item('target_path'))
+	)
+	VIDEO_SEGMENT_COUNT_SLIDER = gradio.Slider(
+		label = wording.get('uis.video_segment_count_slider'),
+		value = state_manager.get_item('video_segment_count'),
+		step = calculate_int_step(facefusion.choices.video_segment_count_range),
+		minimum = facefusion.choices.video_segment_count_range[0],
+		maximum = facefusion.choices.video_segment_count_range[-1],
+		visible = is_video(state_manager.get_item('target_path'))
+	)
 
 
 def listen() -> None:
 	TEMP_FRAME_FORMAT_DROPDOWN.change(update_temp_frame_format, inputs = TEMP_FRAME_FORMAT_DROPDOWN)
+	TEMP_FRAME_MODE_DROPDOWN.change(update_temp_frame_mode, inputs = TEMP_FRAME_MODE_DROPDOWN)
+	VIDEO_SEGMENT_COUNT_SLIDER.release(update_video_segment_count, inputs = VIDEO_SEGMENT_COUNT_SLIDER)
 
 	target_video = get_ui_component('target_video')
 	if target_video:
 		for method in [ 'change', 'clear' ]:
-			getattr(target_video, method)(remote_update, outputs = TEMP_FRAME_FORMAT_DROPDOWN)
+			getattr(target_video, method)(remote_update, outputs = [ TEMP_FRAME_FORMAT_DROPDOWN, TEMP_FRAME_MODE_DROPDOWN, VIDEO_SEGMENT_COUNT_SLIDER ])
 
 
-def remote_update() -> gradio.Dropdown:
+def remote_update() -> Tuple[gradio.Dropdown, gradio.Dropdown, gradio.Slider]:
 	if is_video(state_manager.get_item('target_path')):
-		return gradio.Dropdown(visible = True)
-	return gradio.Dropdown(visible = False)
+		return gradio.Dropdown(visible = True), gradio.Dropdown(visible = True), gradio.Slider(visible = True)
+	return gradio.Dropdown(visible = False), gradio.Dropdown(visible = False), gradio.Slider(visible = False)
 
 
 def update_temp_frame_format(temp_frame_format : TempFrameFormat) -> None:
 	state_manager.set_item('temp_frame_format', temp_frame_format)
 
+
+def update_temp_frame_mode(temp_frame_mode : TempFrameMode) -> None:
+	state_manager.set_item('temp_frame_mode', temp_frame_mode)
+
+
+def update_video_segment_count(video_segment_count : float) -> None:
+	state_manager.set_item('video_segment_count', int(video_segment_count))
@@ -1,5 +1,6 @@
 import gradio
 
+import facefusion.choices
 from facefusion import benchmarker, state_manager
 from facefusion.uis.components import about, age_modifier_options, benchmark, benchmark_options, deep_swapper_options, download, execution, execution_thread_count, expression_restorer_options, face_debugger_options, face_editor_options, face_enhancer_options, face_swapper_options, frame_colorizer_options, frame_enhancer_options, lip_syncer_options, memory, processors
 
@@ -44,7 +45,7 @@ def render() -> gradio.Blocks:
 				with gradio.Blocks():
 					download.render()
 				with gradio.Blocks():
-					state_manager.set_item('video_memory_strategy', 'tolerant')
+					state_manager.set_item('inference_memory_limit', facefusion.choices.inference_memory_limit_range[-1])
 					memory.render()
 			with gradio.Column(scale = 11):
 				with gradio.Blocks():
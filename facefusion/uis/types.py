@@ -51,6 +51,7 @@ ComponentName = Literal\
 	'face_swapper_model_dropdown',
 	'face_swapper_pixel_boost_dropdown',
 	'face_swapper_weight_slider',
+	'face_tracker_interval_slider',
 	'face_occluder_model_dropdown',
 	'face_parser_model_dropdown',
 	'voice_extractor_model_dropdown',
@@ -1,12 +1,22 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
 import cv2
 
-from facefusion.types import VideoPoolSet
+from facefusion.types import VideoFrameSet, VideoPoolSet, VideoReader, VisionFrame
 
+VIDEO_POOL_LOCK : threading.Lock = threading.Lock()
 VIDEO_POOL_SET : VideoPoolSet =\
 {
 	'capture': {},
-	'writer': {}
+	'writer': {},
+	'reader': {}
 }
+VIDEO_FRAME_LOCK : threading.Lock = threading.Lock()
+VIDEO_FRAME_SET : VideoFrameSet = OrderedDict()
+VIDEO_FRAME_LIMIT : int = 16
+VIDEO_READER_SKIP_LIMIT : int = 64
 
 
 def get_video_capture(video_path : str) -> cv2.VideoCapture:
@@ -29,6 +39,76 @@ def get_video_writer(video_path : str) -> cv2.VideoWriter:
 	return VIDEO_POOL_SET.get('writer').get(video_path)
 
 
+def get_video_reader(video_path : str) -> Optional[VideoReader]:
+	video_reader_key = (threading.get_ident(), video_path)
+
+	with VIDEO_POOL_LOCK:
+		if video_reader_key not in VIDEO_POOL_SET.get('reader'):
+			video_capture = cv2.VideoCapture(video_path)
+
+			if video_capture.isOpened():
+				VIDEO_POOL_SET['reader'][video_reader_key] =\
+				{
+					'video_capture': video_capture,
+					'frame_index': 0
+				}
+
+		return VIDEO_POOL_SET.get('reader').get(video_reader_key)
+
+
+def read_video_reader_frame(video_path : str, frame_index : int) -> Optional[VisionFrame]:
+	vision_frame = get_video_frame(video_path, frame_index)
+
+	if vision_frame is None:
+		video_reader = get_video_reader(video_path)
+
+		if video_reader:
+			vision_frame = decode_video_frame(video_reader, frame_index)
+
+			if vision_frame is not None:
+				set_video_frame(video_path, frame_index, vision_frame)
+
+	return vision_frame
+
+
+def decode_video_frame(video_reader : VideoReader, frame_index : int) -> Optional[VisionFrame]:
+	video_capture = video_reader.get('video_capture')
+	frame_skip = frame_index - video_reader.get('frame_index')
+
+	if video_reader.get('frame_index') < 0 or frame_skip < 0 or frame_skip > VIDEO_READER_SKIP_LIMIT:
+		video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+	else:
+		for _ in range(frame_skip):
+			video_capture.grab()
+
+	has_vision_frame, vision_frame = video_capture.read()
+
+	if has_vision_frame:
+		video_reader['frame_index'] = frame_index + 1
+		return vision_frame
+
+	video_reader['frame_index'] = -1
+	return None
+
+
+def get_video_frame(video_path : str, frame_index : int) -> Optional[VisionFrame]:
+	with VIDEO_FRAME_LOCK:
+		vision_frame = VIDEO_FRAME_SET.get((video_path, frame_index))
+
+		if vision_frame is not None:
+			VIDEO_FRAME_SET.move_to_end((video_path, frame_index))
+			return vision_frame.copy()
+		return None
+
+
+def set_video_frame(video_path : str, frame_index : int, vision_frame : VisionFrame) -> None:
+	with VIDEO_FRAME_LOCK:
+		VIDEO_FRAME_SET[(video_path, frame_index)] = vision_frame.copy()
+
+		while len(VIDEO_FRAME_SET) > VIDEO_FRAME_LIMIT:
+			VIDEO_FRAME_SET.popitem(last = False)
+
+
 def clear_video_pool() -> None:
 	for video_capture in VIDEO_POOL_SET.get('capture').values():
 		video_capture.release()
@@ -36,5 +116,13 @@ def clear_video_pool() -> None:
 	for video_writer in VIDEO_POOL_SET.get('writer').values():
 		video_writer.release()
 
+	with VIDEO_POOL_LOCK:
+		for video_reader in VIDEO_POOL_SET.get('reader').values():
+			video_reader.get('video_capture').release()
+		VIDEO_POOL_SET['reader'].clear()
+
+	with VIDEO_FRAME_LOCK:
+		VIDEO_FRAME_SET.clear()
+
 	VIDEO_POOL_SET['capture'].clear()
 	VIDEO_POOL_SET['writer'].clear()
@@ -7,10 +7,12 @@ import numpy
 from cv2.typing import Size
 
 from facefusion.common_helper import is_windows
-from facefusion.filesystem import get_file_extension, is_image, is_video
+from facefusion.filesystem import get_file_extension, get_file_format, is_image, is_video
+from facefusion.image_store import get_static_image, set_static_image
+from facefusion.media_probe import get_media_probe, set_media_probe
 from facefusion.thread_helper import thread_semaphore
-from facefusion.types import Duration, Fps, Orientation, Resolution, Scale, VisionFrame
-from facefusion.video_manager import get_video_capture
+from facefusion.types import Duration, Fps, MediaProbe, Orientation, Resolution, Scale, VideoSegment, VisionFrame
+from facefusion.video_manager import get_video_capture, read_video_reader_frame
 
 
 def read_static_images(image_paths : List[str]) -> List[VisionFrame]:
@@ -22,9 +24,15 @@ def read_static_images(image_paths : List[str]) -> List[VisionFrame]:
 	return vision_frames
 
 
-@lru_cache(maxsize = 1024)
 def read_static_image(image_path : str) -> Optional[VisionFrame]:
-	return read_image(image_path)
+	vision_frame = get_static_image(image_path)
+
+	if vision_frame is None:
+		vision_frame = read_image(image_path)
+
+		if vision_frame is not None:
+			set_static_image(image_path, vision_frame)
+	return vision_frame
 
 
 def read_image(image_path : str) -> Optional[VisionFrame]:
@@ -36,24 +44,60 @@ def read_image(image_path : str) -> Optional[VisionFrame]:
 	return None
 
 
-def write_image(image_path : str, vision_frame : VisionFrame) -> bool:
+def write_image(image_path : str, vision_frame : VisionFrame, image_quality : Optional[int] = None) -> bool:
 	if image_path:
+		image_params = create_image_params(image_path, image_quality)
+
 		if is_windows():
 			image_file_extension = get_file_extension(image_path)
-			_, vision_frame = cv2.imencode(image_file_extension, vision_frame)
+			_, vision_frame = cv2.imencode(image_file_extension, vision_frame, image_params)
 			vision_frame.tofile(image_path)
 			return is_image(image_path)
-		return cv2.imwrite(image_path, vision_frame)
+		return cv2.imwrite(image_path, vision_frame, image_params)
 	return False
 
 
+def create_image_params(image_path : str, image_quality : Optional[int]) -> List[int]:
+	if image_quality is not None:
+		if get_file_format(image_path) == 'jpeg':
+			return [ cv2.IMWRITE_JPEG_QUALITY, image_quality ]
+		if get_file_format(image_path) == 'webp':
+			return [ cv2.IMWRITE_WEBP_QUALITY, max(1, image_quality) ]
+	return []
+
+
+def has_image_codec(image_path : str, output_path : str) -> bool:
+	return is_image(image_path) and cv2.haveImageReader(image_path) and cv2.haveImageWriter(output_path)
+
+
+def probe_image(image_path : str) -> Optional[MediaProbe]:
+	media_probe = get_media_probe(image_path)
+
+	if not media_probe:
+		image = read_static_image(image_path)
+
+		if image is not None:
+			height, width = image.shape[:2]
+			media_probe =\
+			{
+				'resolution': (width, height),
+				'fps': None,
+				'frame_total': 1
+			}
+			set_media_probe(image_path, media_probe)
+
+	return media_probe
+
+
 def detect_image_resolution(image_path : str) -> Optional[Resolution]:
 	if is_image(image_path):
-		image = read_image(image_path)
-		height, width = image.shape[:2]
+		media_probe = probe_image(image_path)
 
-		if width > 0 and height > 0:
-			return width, height
+		if media_probe:
+			width, height = media_probe.get('resolution')
+
+			if width > 0 and height > 0:
+				return width, height
 	return None
 
 
@@ -72,29 +116,38 @@ def read_static_video_frame(video_path : str, frame_number : int = 0) -> Optiona
 
 def read_video_frame(video_path : str, frame_number : int = 0) -> Optional[VisionFrame]:
 	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
+		frame_total = count_video_frame_total(video_path)
+		frame_index = max(min(frame_total, frame_number - 1), 0)
+		return read_video_reader_frame(video_path, frame_index)
 
-		if video_capture.isOpened():
-			frame_total = video_capture.get(cv2.CAP_PROP_FRAME_COUNT)
+	return None
 
-			with thread_semaphore():
-				video_capture.set(cv2.CAP_PROP_POS_FRAMES, min(frame_total, frame_number - 1))
-				has_vision_frame, vision_frame = video_capture.read()
 
-			if has_vision_frame:
-				return vision_frame
+def probe_video(video_path : str) -> Optional[MediaProbe]:
+	media_probe = get_media_probe(video_path)
 
-	return None
+	if not media_probe:
+		video_capture = get_video_capture(video_path)
+
+		if video_capture and video_capture.isOpened():
+			with thread_semaphore():
+				media_probe =\
+				{
+					'resolution': (int(video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))),
+					'fps': video_capture.get(cv2.CAP_PROP_FPS),
+					'frame_total': int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+				}
+			set_media_probe(video_path, media_probe)
+
+	return media_probe
 
 
 def count_video_frame_total(video_path : str) -> int:
 	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
+		media_probe = probe_video(video_path)
 
-		if video_capture.isOpened():
-			with thread_semaphore():
-				video_frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
-				return video_frame_total
+		if media_probe:
+			return media_probe.get('frame_total')
 
 	return 0
 
@@ -109,12 +162,10 @@ def predict_video_frame_total(video_path : str, fps : Fps, trim_frame_start : in
 
 def detect_video_fps(video_path : str) -> Optional[float]:
 	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
+		media_probe = probe_video(video_path)
 
-		if video_capture.isOpened():
-			with thread_semaphore():
-				video_fps = video_capture.get(cv2.CAP_PROP_FPS)
-				return video_fps
+		if media_probe:
+			return media_probe.get('fps')
 
 	return None
 
@@ -160,15 +211,33 @@ def restrict_trim_frame(video_path : str, trim_frame_start : Optional[int], trim
 	return 0, video_frame_total
 
 
+def split_video_segments(keyframe_numbers : List[int], trim_frame_start : int, trim_frame_end : int, segment_count : int) -> List[VideoSegment]:
+	segment_frame_starts = [ trim_frame_start ]
+	video_segments : List[VideoSegment] = []
+
+	for segment_index in range(1, segment_count):
+		segment_frame_target = trim_frame_start + (trim_frame_end - trim_frame_start) * segment_index // segment_count
+		segment_keyframe_numbers = [ keyframe_number for keyframe_number in keyframe_numbers if segment_frame_starts[-1] < keyframe_number < trim_frame_end ]
+
+		if segment_keyframe_numbers:
+			segment_frame_starts.append(min(segment_keyframe_numbers, key = lambda keyframe_number : abs(keyframe_number - segment_frame_target)))
+
+	for segment_frame_start, segment_frame_end in zip(segment_frame_starts, segment_frame_starts[1:] + [ trim_frame_end ]):
+		video_segments.append(
+		{
+			'keyframe_number': max([ keyframe_number for keyframe_number in keyframe_numbers if keyframe_number <= segment_frame_start ], default = 0),
+			'frame_start': segment_frame_start,
+			'frame_end': segment_frame_end
+		})
+	return video_segments
+
+
 def detect_video_resolution(video_path : str) -> Optional[Resolution]:
 	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
+		media_probe = probe_video(video_path)
 
-		if video_capture.isOpened():
-			with thread_semaphore():
-				width = video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)
-				height = video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)
-				return int(width), int(height)
+		if media_probe:
+			return media_probe.get('resolution')
 
 	return None
 
@@ -215,6 +284,22 @@ def detect_frame_orientation(vision_frame : VisionFrame) -> Orientation:
 	return 'portrait'
 
 
+def detect_frame_resolution(vision_frame : VisionFrame) -> Resolution:
+	height, width = vision_frame.shape[:2]
+	return width, height
+
+
+def resize_frame(vision_frame : VisionFrame, resolution : Resolution) -> VisionFrame:
+	height, width = vision_frame.shape[:2]
+	resize_width, resize_height = resolution
+
+	if width == resize_width and height == resize_height:
+		return vision_frame
+	if width > resize_width or height > resize_height:
+		return cv2.resize(vision_frame, resolution, interpolation = cv2.INTER_AREA)
+	return cv2.resize(vision_frame, resolution, interpolation = cv2.INTER_CUBIC)
+
+
 def restrict_frame(vision_frame : VisionFrame, resolution : Resolution) -> VisionFrame:
 	height, width = vision_frame.shape[:2]
 	restrict_width, restrict_height = resolution
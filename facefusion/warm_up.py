@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from types import ModuleType
+from typing import Dict, List, Optional
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion import inference_manager, logger, wording
+from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.time_helper import calculate_end_time
+
+WARM_UP_POOL : Optional[ThreadPoolExecutor] = None
+WARM_UP_DTYPE_SET : Dict[str, numpy.dtype] =\
+{
+	'tensor(float)': numpy.dtype(numpy.float32),
+	'tensor(float16)': numpy.dtype(numpy.float16),
+	'tensor(double)': numpy.dtype(numpy.float64),
+	'tensor(int64)': numpy.dtype(numpy.int64),
+	'tensor(int32)': numpy.dtype(numpy.int32),
+	'tensor(bool)': numpy.dtype(numpy.bool_)
+}
+
+
+def start_warm_up(modules : List[ModuleType]) -> None:
+	global WARM_UP_POOL
+
+	clear_warm_up()
+
+	if modules:
+		WARM_UP_POOL = ThreadPoolExecutor(max_workers = len(modules))
+
+		for module in modules:
+			WARM_UP_POOL.submit(warm_up_module, module)
+
+
+def warm_up_module(module : ModuleType) -> None:
+	try:
+		module.get_inference_pool()
+	except Exception as exception:
+		logger.warn(wording.get('warming_up_module_failed').format(module_name = module.__name__, error = exception), __name__)
+		return
+
+	for inference_pool in inference_manager.get_inference_pools(module.__name__):
+		for model_name, inference_session in inference_pool.items():
+			start_time = time()
+
+			if warm_up_inference_session(inference_session):
+				logger.debug(wording.get('warming_up_model_succeeded').format(model_name = model_name, seconds = calculate_end_time(start_time)), __name__)
+			else:
+				logger.debug(wording.get('warming_up_model_skipped').format(model_name = model_name), __name__)
+
+
+def warm_up_inference_session(inference_session : InferenceSession) -> bool:
+	session_inputs = {}
+
+	for session_input in inference_session.get_inputs():
+		if session_input.type not in WARM_UP_DTYPE_SET:
+			return False
+		input_shape = [ input_dimension if isinstance(input_dimension, int) and input_dimension > 0 else 1 for input_dimension in session_input.shape ]
+		session_inputs[session_input.name] = numpy.zeros(input_shape, dtype = WARM_UP_DTYPE_SET.get(session_input.type))
+
+	try:
+		with conditional_thread_semaphore():
+			InferenceSession.run(inference_session, None, session_inputs)
+		return True
+	except Exception:
+		return False
+
+
+def clear_warm_up() -> None:
+	global WARM_UP_POOL
+
+	if WARM_UP_POOL:
+		WARM_UP_POOL.shutdown(wait = True, cancel_futures = True)
+		WARM_UP_POOL = None
@@ -10,6 +10,25 @@ WORDING : Dict[str, Any] =\
 	'extracting_frames': 'Extracting frames with a resolution of {resolution} and {fps} frames per second',
 	'extracting_frames_succeeded': 'Extracting frames succeeded',
 	'extracting_frames_failed': 'Extracting frames failed',
+	'reusing_frames': 'Reused {reuse_total} of {frame_total} frames ({reuse_rate}%)',
+	'store_totals': 'Store {store_name} served {hit_total} hits and {miss_total} misses',
+	'segmenting_video': 'Processing the video in {segment_total} segments split at keyframes',
+	'segmenting_video_succeeded': 'Processing video segments succeeded',
+	'segmenting_video_failed': 'Processing video segments failed',
+	'coordinator_listening': 'Distributing video segments to workers on {coordinator_address}',
+	'worker_joined': 'Worker joined the coordinator',
+	'worker_lost': 'Worker lost, reassigning segment {segment_index}',
+	'worker_task_abandoned': 'Abandoned segment {segment_index} after losing {attempt_total} workers',
+	'worker_task_failed': 'Worker failed to process segment {segment_index}: {exception}',
+	'worker_waiting': 'Waiting for the coordinator on {coordinator_address}',
+	'worker_connected': 'Connected to the coordinator',
+	'worker_authentication_failed': 'Authentication with the coordinator failed',
+	'worker_task_rejected': 'Rejected a worker task with unknown arguments',
+	'coordinator_secret_missing': 'Coordinator requires a secret to authenticate the workers',
+	'resuming_frames': 'Resuming with {frame_total} frames already processed',
+	'piping_frames': 'Piping frames with a resolution of {resolution} and {fps} frames per second',
+	'piping_frames_succeeded': 'Piping frames succeeded',
+	'piping_frames_failed': 'Piping frames failed',
 	'analysing': 'Analysing',
 	'extracting': 'Extracting',
 	'streaming': 'Streaming',
@@ -84,6 +103,16 @@ WORDING : Dict[str, Any] =\
 	'deleting_corrupt_source': 'Deleting corrupt source for {source_file_name}',
 	'loading_model_succeeded': 'Loading model {model_name} succeeded in {seconds} seconds',
 	'loading_model_failed': 'Loading model {model_name} failed',
+	'warming_up_model_succeeded': 'Warming up model {model_name} succeeded in {seconds} seconds',
+	'warming_up_model_skipped': 'Warming up model {model_name} skipped',
+	'warming_up_module_failed': 'Warming up module {module_name} failed: {error}',
+	'quantizing_model_succeeded': 'Quantizing model {model_name} succeeded with a {drift_metric} of {drift_value}',
+	'quantizing_model_skipped': 'Quantizing model {model_name} skipped due to missing calibration inputs',
+	'quantizing_model_failed': 'Quantizing model {model_name} failed',
+	'unloading_model_succeeded': 'Unloading model {inference_context} to stay within the inference memory limit',
+	'inference_batch_load': 'Inference batch {inference_context} handled {request_total} requests in {batch_total} batches with {wait_time} milliseconds average wait',
+	'inference_concurrency_limit': 'Inference session {model_name} adapted its concurrency limit to {limit_total} at {throughput} runs per second and {latency} milliseconds latency',
+	'inference_replica_load': 'Inference replica {inference_context} handled {request_total} requests at {utilization}% utilization',
 	'time_ago_now': 'just now',
 	'time_ago_minutes': '{minutes} minutes ago',
 	'time_ago_hours': '{hours} hours and {minutes} minutes ago',
@@ -114,6 +143,7 @@ WORDING : Dict[str, Any] =\
 		'face_detector_size': 'specify the frame size provided to the face detector',
 		'face_detector_angles': 'specify the angles to rotate the frame before detecting faces',
 		'face_detector_score': 'filter the detected faces based on the confidence score',
+		'face_tracker_interval': 'track the detected faces for up to the amount of frames before detecting again (0 disables)',
 		# face landmarker
 		'face_landmarker_model': 'choose the model responsible for detecting the face landmarks',
 		'face_landmarker_score': 'filter the detected face landmarks based on the confidence score',
@@ -141,6 +171,9 @@ WORDING : Dict[str, Any] =\
 		'trim_frame_start': 'specify the starting frame of the target video',
 		'trim_frame_end': 'specify the ending frame of the target video',
 		'temp_frame_format': 'specify the temporary resources format',
+		'temp_frame_mode': 'extract the frames to disk or pipe them through memory',
+		'video_segment_count': 'split the target video at keyframes into segments that are processed in parallel',
+		'frame_reuse_threshold': 'reuse the output of a recently processed frame when a frame differs less than the threshold (0 disables)',
 		'keep_temp': 'keep the temporary resources after processing',
 		# output creation
 		'output_image_quality': 'specify the image quality which translates to the image compression',
@@ -202,22 +235,51 @@ WORDING : Dict[str, Any] =\
 		'benchmark_mode': 'choose the benchmark mode',
 		'benchmark_resolutions': 'choose the resolutions for the benchmarks (choices: {choices}, ...)',
 		'benchmark_cycle_count': 'specify the amount of cycles per benchmark',
+		'benchmark_worker_modes': 'choose the execution worker modes to compare in the benchmarks',
+		# quantize
+		'quantize_modules': 'choose the modules whose models get quantized (choices: {choices}, ...)',
+		'quantize_mode': 'choose the quantization mode, static calibrates on frames of the target video',
+		'quantize_frame_total': 'specify the amount of target video frames used for calibration',
 		# execution
 		'execution_device_ids': 'specify the devices used for processing',
 		'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 		'execution_thread_count': 'specify the amount of parallel threads while processing',
+		'execution_replica_count': 'specify the amount of inference session replicas per device',
+		'execution_batch_size': 'specify the maximum amount of concurrent requests that get batched into one inference',
+		'execution_batch_timeout': 'specify the maximum time in milliseconds a request waits for its batch to fill',
+		'execution_worker_mode': 'run the processors in threads or in separate worker processes',
+		# session
+		'session_intra_op_thread_count': 'specify the amount of threads each inference session uses within an operator (0 lets the runtime decide)',
+		'session_inter_op_thread_count': 'specify the amount of threads each inference session uses across operators (0 lets the runtime decide)',
+		'session_execution_mode': 'run the operators of an inference session sequentially or in parallel',
+		'session_graph_optimization': 'specify the graph optimization level of the inference sessions',
+		'session_memory_options': 'enable the memory options of the inference sessions (choices: {choices})',
+		'session_model_cache': 'cache the optimized models to skip the graph optimization on startup',
+		'session_model_precision': 'choose the model precision, int8 uses the models created by the quantize command',
+		'session_concurrency_mode': 'keep the concurrency limit of each inference session static or adapt it to the observed latency and throughput',
+		'session_concurrency_limit': 'specify the maximum amount of concurrent runs per inference session (0 disables the limit in static mode and follows the execution thread count in adaptive mode)',
+		# coordinator
+		'coordinator_address': 'specify the host:port or unix socket path where the coordinator distributes video segments to workers',
+		'coordinator_secret': 'specify the shared secret used to authenticate the workers (required with a coordinator address)',
 		# memory
-		'video_memory_strategy': 'balance fast processing and low VRAM usage',
+		'inference_memory_limit': 'limit the estimated memory in megabytes of models kept loaded, least recently used models get unloaded first and 0 unloads every model at the end of a run',
 		'system_memory_limit': 'limit the available RAM that can be used while processing',
+		'face_store_entry_limit': 'limit the amount of frames whose detected faces are kept in the face store',
+		'face_store_memory_limit': 'limit the RAM in megabytes that can be used by the face store',
+		'image_store_memory_limit': 'limit the RAM in megabytes that can be used by the decoded images of the image store',
 		# misc
 		'log_level': 'adjust the message severity displayed in the terminal',
 		'halt_on_error': 'halt the program once an error occurred',
+		'inference_profile': 'profile the inference latency per model and report it after processing',
+		'inference_profile_path': 'specify the path to write the inference profile as json',
 		# run
 		'run': 'run the program',
 		'headless_run': 'run the program in headless mode',
 		'batch_run': 'run the program in batch mode',
 		'force_download': 'force automate downloads and exit',
 		'benchmark': 'benchmark the program',
+		'quantize': 'quantize the models to int8 and measure their drift',
+		'worker': 'process video segments for a coordinator',
 		# jobs
 		'job_id': 'specify the job id',
 		'job_status': 'specify the job status',
@@ -253,6 +315,7 @@ WORDING : Dict[str, Any] =\
 		'benchmark_mode_dropdown': 'BENCHMARK MODE',
 		'benchmark_cycle_count_slider': 'BENCHMARK CYCLE COUNT',
 		'benchmark_resolutions_checkbox_group': 'BENCHMARK RESOLUTIONS',
+		'benchmark_worker_modes_checkbox_group': 'BENCHMARK WORKER MODES',
 		'clear_button': 'CLEAR',
 		'common_options_checkbox_group': 'OPTIONS',
 		'download_providers_checkbox_group': 'DOWNLOAD PROVIDERS',
@@ -260,6 +323,7 @@ WORDING : Dict[str, Any] =\
 		'deep_swapper_morph_slider': 'DEEP SWAPPER MORPH',
 		'execution_providers_checkbox_group': 'EXECUTION PROVIDERS',
 		'execution_thread_count_slider': 'EXECUTION THREAD COUNT',
+		'execution_worker_mode_dropdown': 'EXECUTION WORKER MODE',
 		'expression_restorer_factor_slider': 'EXPRESSION RESTORER FACTOR',
 		'expression_restorer_model_dropdown': 'EXPRESSION RESTORER MODEL',
 		'expression_restorer_areas_checkbox_group': 'EXPRESSION RESTORER AREAS',
@@ -267,6 +331,7 @@ WORDING : Dict[str, Any] =\
 		'face_detector_angles_checkbox_group': 'FACE DETECTOR ANGLES',
 		'face_detector_model_dropdown': 'FACE DETECTOR MODEL',
 		'face_detector_score_slider': 'FACE DETECTOR SCORE',
+		'face_tracker_interval_slider': 'FACE TRACKER INTERVAL',
 		'face_detector_size_dropdown': 'FACE DETECTOR SIZE',
 		'face_editor_eyebrow_direction_slider': 'FACE EDITOR EYEBROW DIRECTION',
 		'face_editor_eye_gaze_horizontal_slider': 'FACE EDITOR EYE GAZE HORIZONTAL',
@@ -347,10 +412,12 @@ WORDING : Dict[str, Any] =\
 		'system_memory_limit_slider': 'SYSTEM MEMORY LIMIT',
 		'target_file': 'TARGET',
 		'temp_frame_format_dropdown': 'TEMP FRAME FORMAT',
+		'temp_frame_mode_dropdown': 'TEMP FRAME MODE',
+		'video_segment_count_slider': 'VIDEO SEGMENT COUNT',
 		'terminal_textbox': 'TERMINAL',
 		'trim_frame_slider': 'TRIM FRAME',
 		'ui_workflow': 'UI WORKFLOW',
-		'video_memory_strategy_dropdown': 'VIDEO MEMORY STRATEGY',
+		'inference_memory_limit_slider': 'INFERENCE MEMORY LIMIT',
 		'webcam_fps_slider': 'WEBCAM FPS',
 		'webcam_image': 'WEBCAM',
 		'webcam_device_id_dropdown': 'WEBCAM DEVICE ID',
@@ -1,5 +1,8 @@
 import os
 import tempfile
+from typing import Any, List, Literal
+
+import onnx
 
 from facefusion.filesystem import create_directory, is_directory, is_file, remove_directory
 from facefusion.types import JobStatus
@@ -42,3 +45,14 @@ def prepare_test_output_directory() -> bool:
 	remove_directory(test_outputs_directory)
 	create_directory(test_outputs_directory)
 	return is_directory(test_outputs_directory)
+
+
+def create_test_model(model_path : str, model_name : Literal['identity', 'double'], input_shape : List[Any], input_type : int = onnx.TensorProto.FLOAT) -> str:
+	model_nodes =\
+	{
+		'identity': onnx.helper.make_node('Identity', [ 'input' ], [ 'output' ]),
+		'double': onnx.helper.make_node('Add', [ 'input', 'input' ], [ 'output' ])
+	}
+	model_graph = onnx.helper.make_graph([ model_nodes.get(model_name) ], model_name, [ onnx.helper.make_tensor_value_info('input', input_type, input_shape) ], [ onnx.helper.make_tensor_value_info('output', input_type, input_shape) ])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 8, opset_imports = [ onnx.helper.make_opsetid('', 13) ]), model_path)
+	return model_path
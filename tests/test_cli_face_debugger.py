@@ -37,3 +37,10 @@ def test_debug_face_to_video() -> None:
 
 	assert subprocess.run(commands).returncode == 0
 	assert is_test_output_file('test-debug-face-to-video.mp4') is True
+
+
+def test_debug_face_to_video_with_pipe() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_debugger', '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-debug-face-to-video-with-pipe.mp4'), '--trim-frame-end', '1', '--temp-frame-mode', 'pipe' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-debug-face-to-video-with-pipe.mp4') is True
@@ -0,0 +1,161 @@
+import os
+import tempfile
+import threading
+from multiprocessing.connection import Client
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from tqdm import tqdm
+
+from facefusion import process_manager, state_manager
+from facefusion.coordinator import WORKER_TASK_ATTEMPT_LIMIT, pre_check, process_worker_task, resolve_coordinator_address, run_coordinator
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory
+from facefusion.types import WorkerTask
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('target_path', 'coordinator.mp4')
+	state_manager.init_item('coordinator_address', os.path.join(tempfile.mkdtemp(), 'coordinator.sock'))
+	state_manager.init_item('coordinator_secret', 'secret')
+	state_manager.init_item('keep_temp', False)
+	state_manager.init_item('log_level', 'error')
+
+
+def test_resolve_coordinator_address() -> None:
+	assert resolve_coordinator_address('127.0.0.1:8977') == ('127.0.0.1', 8977)
+	assert resolve_coordinator_address('localhost:8977') == ('localhost', 8977)
+	assert resolve_coordinator_address('/tmp/coordinator.sock') == '/tmp/coordinator.sock'
+
+
+def test_pre_check() -> None:
+	assert pre_check() is True
+
+	state_manager.set_item('coordinator_secret', None)
+
+	assert pre_check() is False
+
+	state_manager.set_item('coordinator_secret', 'secret')
+
+
+def test_process_worker_task_rejects_unknown_args() -> None:
+	worker_task : WorkerTask =\
+	{
+		'step_args':
+		{
+			'unknown_key': 'value'
+		},
+		'segment_index': 0,
+		'video_segment':
+		{
+			'keyframe_number': 0,
+			'frame_start': 0,
+			'frame_end': 10
+		},
+		'frame_offset': 0,
+		'temp_video_fps': 25.0,
+		'temp_video_resolution': (426, 240),
+		'output_video_resolution': (426, 240)
+	}
+
+	assert process_worker_task(worker_task) is None
+	assert state_manager.get_item('unknown_key') is None #type:ignore[arg-type]
+
+
+def test_process_worker_task_survives_failure() -> None:
+	worker_task : WorkerTask =\
+	{
+		'step_args': {},
+		'segment_index': 0,
+		'video_segment':
+		{
+			'keyframe_number': 0,
+			'frame_start': 0,
+			'frame_end': 10
+		},
+		'frame_offset': 0,
+		'temp_video_fps': 25.0,
+		'temp_video_resolution': (426, 240),
+		'output_video_resolution': (426, 240)
+	}
+	state_manager.init_item('processors', [])
+
+	with patch('facefusion.coordinator.create_frame_context', side_effect = RuntimeError):
+		assert process_worker_task(worker_task) is None
+
+	assert process_manager.is_pending() is True
+
+
+def create_test_worker_tasks(segment_total : int) -> List[WorkerTask]:
+	return\
+	[
+		{
+			'step_args': {},
+			'segment_index': segment_index,
+			'video_segment':
+			{
+				'keyframe_number': segment_index * 10,
+				'frame_start': segment_index * 10,
+				'frame_end': segment_index * 10 + 10
+			},
+			'frame_offset': segment_index * 10,
+			'temp_video_fps': 25.0,
+			'temp_video_resolution': (426, 240),
+			'output_video_resolution': (426, 240)
+		} for segment_index in range(segment_total)
+	]
+
+
+def run_test_worker(exit_early : bool) -> None:
+	while True:
+		try:
+			connection = Client(state_manager.get_item('coordinator_address'), authkey = b'secret')
+			break
+		except OSError:
+			continue
+
+	with connection:
+		while worker_task := connection.recv():
+			if exit_early:
+				return
+			connection.send(str(worker_task.get('segment_index')).encode())
+
+
+def test_run_coordinator() -> None:
+	worker_tasks = create_test_worker_tasks(4)
+	worker_threads = [ threading.Thread(target = run_test_worker, args = (exit_early,)) for exit_early in [ True, False ] ]
+	create_temp_directory(state_manager.get_item('target_path'))
+	process_manager.start()
+
+	for worker_thread in worker_threads:
+		worker_thread.start()
+
+	with tqdm(disable = True) as progress:
+		assert run_coordinator(worker_tasks, progress) == [ True, True, True, True ]
+
+	for worker_thread in worker_threads:
+		worker_thread.join()
+
+	process_manager.end()
+	clear_temp_directory(state_manager.get_item('target_path'))
+
+
+def test_run_coordinator_abandons_tasks() -> None:
+	worker_tasks = create_test_worker_tasks(1)
+	worker_threads = [ threading.Thread(target = run_test_worker, args = (True,)) for _ in range(WORKER_TASK_ATTEMPT_LIMIT) ]
+	create_temp_directory(state_manager.get_item('target_path'))
+	process_manager.start()
+
+	for worker_thread in worker_threads:
+		worker_thread.start()
+
+	with tqdm(disable = True) as progress:
+		assert run_coordinator(worker_tasks, progress) == [ False ]
+
+	for worker_thread in worker_threads:
+		worker_thread.join()
+
+	process_manager.end()
+	clear_temp_directory(state_manager.get_item('target_path'))
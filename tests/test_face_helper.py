@@ -0,0 +1,17 @@
+import numpy
+
+from facefusion.face_helper import paste_back
+
+
+def test_paste_back() -> None:
+	temp_vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+	crop_vision_frame = numpy.full((16, 16, 3), 200, dtype = numpy.uint8)
+	crop_mask = numpy.zeros((16, 16), dtype = numpy.float32)
+	crop_mask[4:12, 4:12] = 1
+	affine_matrix = numpy.array([ [ 1.0, 0.0, -20.0 ], [ 0.0, 1.0, -10.0 ] ])
+	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+
+	assert paste_vision_frame[14:22, 24:32].min() == 200
+	assert paste_vision_frame.sum() == 200 * 8 * 8 * 3
+	assert temp_vision_frame.max() == 0
+	assert numpy.array_equal(paste_back(temp_vision_frame, crop_vision_frame, numpy.zeros_like(crop_mask), affine_matrix), temp_vision_frame)
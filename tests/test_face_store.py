@@ -0,0 +1,84 @@
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_store import calculate_faces_size, clear_static_faces, create_vision_key, get_face_store, get_face_store_totals, get_static_faces, set_static_faces
+from facefusion.types import Face
+
+
+def create_test_face() -> Face:
+	return Face(
+		bounding_box = numpy.zeros(4, dtype = numpy.float32),
+		score_set =
+		{
+			'detector': 0.9,
+			'landmarker': 0.9
+		},
+		landmark_set =
+		{
+			'5': numpy.zeros((5, 2), dtype = numpy.float32),
+			'5/68': numpy.zeros((5, 2), dtype = numpy.float32),
+			'68': numpy.zeros((68, 2), dtype = numpy.float32),
+			'68/5': numpy.zeros((68, 2), dtype = numpy.float32)
+		},
+		angle = 0,
+		embedding = numpy.zeros(512, dtype = numpy.float32),
+		embedding_norm = numpy.zeros(512, dtype = numpy.float32),
+		gender = 'female',
+		age = range(20, 30),
+		race = 'white'
+	)
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('face_store_entry_limit', 2)
+	state_manager.init_item('face_store_memory_limit', 0)
+	clear_static_faces()
+
+
+def test_create_vision_key() -> None:
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+
+	assert create_vision_key(vision_frame) == create_vision_key(vision_frame.copy())
+	assert create_vision_key(vision_frame) != create_vision_key(numpy.ones((64, 64, 3), dtype = numpy.uint8))
+	assert create_vision_key(vision_frame) != create_vision_key(numpy.zeros((32, 128, 3), dtype = numpy.uint8))
+
+
+def test_calculate_faces_size() -> None:
+	assert calculate_faces_size([]) == 0
+	assert calculate_faces_size([ create_test_face() ]) == 5280
+
+
+def test_get_and_set_static_faces() -> None:
+	vision_frames = [ numpy.full((64, 64, 3), index, dtype = numpy.uint8) for index in range(3) ]
+	faces = [ create_test_face() ]
+
+	for vision_frame in vision_frames:
+		set_static_faces(vision_frame, faces)
+
+	assert len(get_face_store().get('static_faces')) == 2
+	assert get_static_faces(vision_frames[0]) is None
+	assert get_static_faces(vision_frames[1]) == faces
+	assert get_static_faces(vision_frames[2]) == faces
+	assert get_face_store_totals() == (2, 1)
+
+	clear_static_faces()
+
+	assert get_face_store().get('static_faces_size') == 0
+	assert get_face_store_totals() == (0, 0)
+
+
+def test_evict_static_faces() -> None:
+	state_manager.init_item('face_store_entry_limit', 0)
+	state_manager.init_item('face_store_memory_limit', 1)
+	vision_frames = [ numpy.full((64, 64, 3), index, dtype = numpy.uint8) for index in range(200) ]
+	faces = [ create_test_face() ]
+
+	for vision_frame in vision_frames:
+		set_static_faces(vision_frame, faces)
+
+	assert len(get_face_store().get('static_faces')) == 198
+	assert get_face_store().get('static_faces_size') <= 1024 ** 2
+	assert get_static_faces(vision_frames[0]) is None
+	assert get_static_faces(vision_frames[-1]) == faces
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import numpy
+
+from facefusion import face_tracker, state_manager
+from facefusion.face_tracker import propagate_faces, track_faces
+from facefusion.types import Face
+
+
+def create_test_face() -> Face:
+	face_landmark_5 = numpy.array([ [ 180, 100 ], [ 240, 100 ], [ 210, 130 ], [ 185, 160 ], [ 235, 160 ] ], numpy.float32)
+
+	return Face(
+		bounding_box = numpy.array([ 150, 60, 270, 200 ], numpy.float32),
+		score_set = {},
+		landmark_set =
+		{
+			'5': face_landmark_5,
+			'5/68': face_landmark_5,
+			'68': numpy.tile(face_landmark_5, (14, 1))[:68],
+			'68/5': numpy.tile(face_landmark_5, (14, 1))[:68]
+		},
+		angle = 0,
+		embedding = numpy.zeros(512),
+		embedding_norm = numpy.zeros(512),
+		gender = 'female',
+		age = range(20, 30),
+		race = 'white'
+	)
+
+
+def test_propagate_faces() -> None:
+	track_vision_frame = numpy.random.default_rng(0).integers(0, 255, (240, 426, 3), numpy.uint8)
+	track_vision_frame = numpy.repeat(numpy.repeat(track_vision_frame[::4, ::4], 4, axis = 0), 4, axis = 1)[:240, :426]
+	vision_frame = numpy.roll(track_vision_frame, (2, 3), axis = (0, 1))
+	track_face = create_test_face()
+	tracked_faces = propagate_faces(track_vision_frame, vision_frame, [ track_face ])
+
+	assert tracked_faces
+	assert numpy.allclose(tracked_faces[0].landmark_set.get('5/68'), track_face.landmark_set.get('5/68') + [ 3, 2 ], atol = 0.5)
+	assert numpy.allclose(tracked_faces[0].bounding_box, track_face.bounding_box + [ 3, 2, 3, 2 ], atol = 0.5)
+	assert tracked_faces[0].embedding is track_face.embedding
+	assert propagate_faces(track_vision_frame, numpy.zeros_like(track_vision_frame), [ track_face ]) is None
+
+
+def test_track_faces() -> None:
+	state_manager.init_item('face_tracker_interval', 4)
+	vision_frame = numpy.random.default_rng(0).integers(0, 255, (240, 426, 3), numpy.uint8)
+
+	with patch('facefusion.face_tracker.get_many_faces', return_value = [ create_test_face() ]):
+		track_faces(vision_frame)
+
+		assert len(face_tracker.FACE_TRACKS) == 0
+
+		face_tracker.start_face_tracks()
+		track_faces(vision_frame)
+
+		assert len(face_tracker.FACE_TRACKS) == 1
+
+		face_tracker.clear_face_tracks()
+
+		assert face_tracker.FACE_TRACKER_ACTIVE is False
+		assert len(face_tracker.FACE_TRACKS) == 0
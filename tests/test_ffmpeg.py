@@ -2,15 +2,18 @@ import os
 import subprocess
 import tempfile
 
+import cv2
+import numpy
 import pytest
 
 import facefusion.ffmpeg
 from facefusion import process_manager, state_manager
 from facefusion.download import conditional_download
-from facefusion.ffmpeg import concat_video, extract_frames, merge_video, read_audio_buffer, replace_audio, restore_audio
+from facefusion.ffmpeg import close_frame_pipe, concat_video, detect_video_keyframes, extract_frames, extract_segment_frames, merge_video, open_frame_reader, open_frame_writer, read_audio_buffer, read_video_frames, replace_audio, restore_audio, write_video_frame
 from facefusion.filesystem import copy_file
-from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, resolve_temp_frame_paths
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, create_temp_segment_directory, get_temp_file_path, resolve_temp_frame_paths, resolve_temp_segment_frame_paths
 from facefusion.types import EncoderSet
+from facefusion.vision import count_video_frame_total, detect_video_resolution, read_image, read_video_frame
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -27,6 +30,7 @@ def before_all() -> None:
 	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vf', 'fps=25', get_test_example_file('target-240p-25fps.mp4') ])
 	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vf', 'fps=30', get_test_example_file('target-240p-30fps.mp4') ])
 	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vf', 'fps=60', get_test_example_file('target-240p-60fps.mp4') ])
+	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('source.mp3'), '-itsoffset', '1', '-i', get_test_example_file('target-240p-25fps.mp4'), '-map', '0:a', '-map', '1:v', '-g', '25', get_test_example_file('target-240p-offset.mkv') ])
 
 	for output_video_format in [ 'avi', 'm4v', 'mkv', 'mov', 'mp4', 'webm', 'wmv' ]:
 		subprocess.run([ 'ffmpeg', '-i', get_test_example_file('source.mp3'), '-i', get_test_example_file('target-240p.mp4'), '-ar', '16000', get_test_example_file('target-240p-16khz.' + output_video_format) ])
@@ -90,6 +94,34 @@ def test_extract_frames() -> None:
 		clear_temp_directory(target_path)
 
 
+def test_detect_video_keyframes() -> None:
+	assert detect_video_keyframes(get_test_example_file('target-240p-25fps.mp4'))[0] == 0
+	assert detect_video_keyframes(get_test_example_file('target-240p-offset.mkv'))[:3] == [ 0, 25, 50 ]
+	assert detect_video_keyframes('invalid') == []
+
+
+def test_extract_segment_frames() -> None:
+	target_path = get_test_example_file('target-240p-25fps.mp4')
+	create_temp_segment_directory(target_path, 0)
+
+	assert extract_segment_frames(target_path, 0, { 'keyframe_number': 0, 'frame_start': 0, 'frame_end': 100 }, (452, 240), 30.0) is True
+	assert len(resolve_temp_segment_frame_paths(target_path, 0)) == 120
+
+	clear_temp_directory(target_path)
+
+	target_path = get_test_example_file('target-240p-offset.mkv')
+	create_temp_segment_directory(target_path, 0)
+
+	assert extract_segment_frames(target_path, 0, { 'keyframe_number': 25, 'frame_start': 30, 'frame_end': 40 }, detect_video_resolution(target_path), 25.0) is True
+	temp_frame_paths = resolve_temp_segment_frame_paths(target_path, 0)
+	temp_vision_frame = read_image(temp_frame_paths[0])
+
+	assert len(temp_frame_paths) == 10
+	assert numpy.argmin([ cv2.absdiff(temp_vision_frame, read_video_frame(target_path, frame_number)).mean() for frame_number in [ 30, 31, 32 ] ]) == 1
+
+	clear_temp_directory(target_path)
+
+
 def test_merge_video() -> None:
 	target_paths =\
 	[
@@ -116,6 +148,42 @@ def test_merge_video() -> None:
 	state_manager.init_item('output_video_encoder', 'libx264')
 
 
+def test_read_video_frames() -> None:
+	test_set =\
+	[
+		(get_test_example_file('target-240p-25fps.mp4'), 0, 270, 324),
+		(get_test_example_file('target-240p-25fps.mp4'), 224, 270, 55),
+		(get_test_example_file('target-240p-30fps.mp4'), 0, 324, 324),
+		(get_test_example_file('target-240p-30fps.mp4'), 124, 224, 100),
+		(get_test_example_file('target-240p-60fps.mp4'), 0, 648, 324),
+		(get_test_example_file('target-240p-60fps.mp4'), 0, 100, 50)
+	]
+
+	for target_path, trim_frame_start, trim_frame_end, frame_total in test_set:
+		frame_reader = open_frame_reader(target_path, (452, 240), 30.0, trim_frame_start, trim_frame_end)
+		vision_frames = list(read_video_frames(frame_reader, (452, 240)))
+
+		assert len(vision_frames) == frame_total
+		assert vision_frames[0].shape == (240, 452, 3)
+		assert close_frame_pipe(frame_reader) is True
+
+
+def test_write_video_frame() -> None:
+	target_path = get_test_example_file('target-240p-25fps.mp4')
+	create_temp_directory(target_path)
+	frame_reader = open_frame_reader(target_path, (452, 240), 25.0, 0, 10)
+	frame_writer = open_frame_writer(target_path, 25.0, (452, 240), (452, 240), 25.0)
+
+	for vision_frame in read_video_frames(frame_reader, (452, 240)):
+		assert write_video_frame(frame_writer, vision_frame) is True
+
+	assert close_frame_pipe(frame_reader) is True
+	assert close_frame_pipe(frame_writer) is True
+	assert count_video_frame_total(get_temp_file_path(target_path)) == 10
+
+	clear_temp_directory(target_path)
+
+
 def test_concat_video() -> None:
 	output_path = get_test_output_file('test-concat-video.mp4')
 	temp_output_paths =\
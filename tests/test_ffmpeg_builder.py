@@ -1,7 +1,7 @@
 from shutil import which
 
 from facefusion import ffmpeg_builder
-from facefusion.ffmpeg_builder import chain, run, select_frame_range, set_audio_quality, set_audio_sample_size, set_stream_mode, set_video_quality
+from facefusion.ffmpeg_builder import chain, run, seek_keyframe, select_frame_range, select_segment_range, set_audio_quality, set_audio_sample_size, set_stream_mode, set_video_quality
 
 
 def test_run() -> None:
@@ -24,6 +24,16 @@ def test_select_frame_range() -> None:
 	assert select_frame_range(None, None, 30) == [ '-vf', 'fps=30' ]
 
 
+def test_seek_keyframe() -> None:
+	assert seek_keyframe(0, 25, 0.0) == [ '-ss', '0.0' ]
+	assert seek_keyframe(50, 25, 0.0) == [ '-ss', '1.98' ]
+	assert seek_keyframe(50, 25, 10.0) == [ '-ss', '11.98' ]
+
+
+def test_select_segment_range() -> None:
+	assert select_segment_range(0, 100, 30) == [ '-vf', 'trim=start_frame=0:end_frame=100,setpts=PTS-STARTPTS,fps=30' ]
+
+
 def test_set_audio_sample_size() -> None:
 	assert set_audio_sample_size(16) == [ '-f', 's16le' ]
 	assert set_audio_sample_size(32) == [ '-f', 's32le' ]
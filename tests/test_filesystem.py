@@ -3,7 +3,7 @@ import os.path
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.filesystem import create_directory, filter_audio_paths, filter_image_paths, get_file_extension, get_file_format, get_file_size, has_audio, has_image, has_video, in_directory, is_audio, is_directory, is_file, is_image, is_video, remove_directory, resolve_file_paths, same_file_extension
+from facefusion.filesystem import create_directory, create_file_stamp, filter_audio_paths, filter_image_paths, get_file_extension, get_file_format, get_file_size, has_audio, has_image, has_video, in_directory, is_audio, is_directory, is_file, is_image, is_video, remove_directory, resolve_file_paths, same_file_extension
 from .helper import get_test_example_file, get_test_examples_directory, get_test_outputs_directory
 
 
@@ -22,6 +22,11 @@ def test_get_file_size() -> None:
 	assert get_file_size('invalid') == 0
 
 
+def test_create_file_stamp() -> None:
+	assert create_file_stamp(get_test_example_file('source.jpg')) == (os.stat(get_test_example_file('source.jpg')).st_mtime_ns, 549458)
+	assert create_file_stamp('invalid') is None
+
+
 def test_get_file_extension() -> None:
 	assert get_file_extension('source.jpg') == '.jpg'
 	assert get_file_extension('source.mp3') == '.mp3'
@@ -0,0 +1,22 @@
+import numpy
+
+from facefusion.frame_store import clear_frame_store, create_frame_fingerprint, find_reuse_frame, get_reuse_totals, set_reuse_frame
+
+
+def test_find_reuse_frame() -> None:
+	target_vision_frame = numpy.full((240, 426, 3), 100, numpy.uint8)
+	output_vision_frame = numpy.full((240, 426, 3), 155, numpy.uint8)
+	frame_fingerprint = create_frame_fingerprint(target_vision_frame)
+
+	assert find_reuse_frame(frame_fingerprint, target_vision_frame, 0.5) is None
+
+	set_reuse_frame(frame_fingerprint, target_vision_frame, output_vision_frame)
+
+	assert find_reuse_frame(create_frame_fingerprint(target_vision_frame + 1), target_vision_frame, 0.5) is None
+	assert find_reuse_frame(create_frame_fingerprint(target_vision_frame), target_vision_frame, 0.5) is output_vision_frame
+	assert find_reuse_frame(frame_fingerprint, target_vision_frame[:120], 0.5) is None
+	assert get_reuse_totals() == (1, 4)
+
+	clear_frame_store()
+
+	assert get_reuse_totals() == (0, 0)
@@ -0,0 +1,44 @@
+import os
+import tempfile
+
+import numpy
+import pytest
+
+from facefusion import image_pool
+from facefusion.vision import write_image
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	for index in range(3):
+		write_image(os.path.join(tempfile.gettempdir(), 'image-pool-' + str(index) + '.png'), numpy.full((8, 8, 3), index, dtype = numpy.uint8))
+
+
+def test_read_pool_image() -> None:
+	image_paths = [ os.path.join(tempfile.gettempdir(), 'image-pool-' + str(index) + '.png') for index in range(3) ]
+	image_pool.create_image_pool(2)
+	image_pool.prefetch_images(image_paths[:2] + [ 'invalid.png' ])
+
+	assert len(image_pool.IMAGE_READS) == 2
+
+	for index, image_path in enumerate(image_paths):
+		assert numpy.all(image_pool.read_pool_image(image_path) == index)
+
+	assert image_pool.IMAGE_READS == {}
+	assert image_pool.read_pool_image('invalid.png') is None
+
+	image_pool.clear_image_pool()
+
+	assert image_pool.IMAGE_POOL is None
+
+
+def test_remove_pool_image() -> None:
+	image_path = os.path.join(tempfile.gettempdir(), 'image-pool-0.png')
+	image_pool.create_image_pool(1)
+	image_pool.prefetch_images([ image_path ])
+	image_pool.remove_pool_image(image_path)
+	image_pool.remove_pool_image('invalid.png')
+
+	assert image_pool.IMAGE_READS == {}
+
+	image_pool.clear_image_pool()
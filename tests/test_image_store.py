@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+import cv2
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.image_store import clear_static_images, get_image_store, get_image_store_totals, get_static_image
+from facefusion.vision import read_static_image
+
+
+def create_test_image(image_name : str, image_value : int) -> str:
+	image_path = os.path.join(tempfile.gettempdir(), image_name)
+	cv2.imwrite(image_path, numpy.full((512, 512, 3), image_value, dtype = numpy.uint8))
+	return image_path
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('image_store_memory_limit', 0)
+	clear_static_images()
+
+
+def test_read_static_image() -> None:
+	image_path = create_test_image('image-static.png', 0)
+
+	assert get_static_image(image_path) is None
+	assert read_static_image(image_path) is read_static_image(image_path)
+	assert get_image_store_totals() == (1, 2)
+	assert read_static_image('invalid') is None
+	assert len(get_image_store().get('static_images')) == 1
+
+
+def test_read_static_image_with_changed_file() -> None:
+	image_path = create_test_image('image-changed.png', 0)
+	read_static_image(image_path)
+	os.utime(image_path, ns = (0, 0))
+
+	assert read_static_image(image_path)[0][0][0] == 0
+	assert get_image_store_totals() == (0, 2)
+
+	create_test_image('image-changed.png', 255)
+
+	assert read_static_image(image_path)[0][0][0] == 255
+	assert len(get_image_store().get('static_images')) == 1
+
+
+def test_evict_static_images() -> None:
+	state_manager.init_item('image_store_memory_limit', 2)
+	image_paths = [ create_test_image('image-evict-' + str(index) + '.png', index) for index in range(3) ]
+
+	for image_path in image_paths:
+		read_static_image(image_path)
+
+	assert list(get_image_store().get('static_images').keys()) == image_paths[1:]
+	assert get_image_store().get('static_images_size') == 2 * 512 * 512 * 3
@@ -0,0 +1,51 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+import numpy
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.inference_batcher import INFERENCE_BATCH_STATISTIC_SET, batch_inference_session, create_batch_key, has_inference_batch
+from .helper import create_test_model
+
+
+def create_test_session(input_shape : List[Any]) -> InferenceSession:
+	model_path = os.path.join(tempfile.gettempdir(), 'double.onnx')
+	create_test_model(model_path, 'double', input_shape)
+	return InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('execution_batch_size', 4)
+	state_manager.init_item('execution_batch_timeout', 50)
+	INFERENCE_BATCH_STATISTIC_SET.clear()
+
+
+def test_has_inference_batch() -> None:
+	assert has_inference_batch(create_test_session([ 'batch', 2 ])) is True
+	assert has_inference_batch(create_test_session([ 1, 2 ])) is False
+
+
+def test_create_batch_key() -> None:
+	assert create_batch_key(None, { 'input': numpy.zeros((1, 2), dtype = numpy.float32) }) == create_batch_key(None, { 'input': numpy.ones((3, 2), dtype = numpy.float32) })
+	assert create_batch_key(None, { 'input': numpy.zeros((1, 2), dtype = numpy.float32) }) != create_batch_key(None, { 'input': numpy.zeros((1, 3), dtype = numpy.float32) })
+	assert create_batch_key(None, { 'input': numpy.zeros((1, 2)), 'other': numpy.zeros((2, 2)) }) is None
+	assert create_batch_key(None, { 'input': numpy.float32(1) }) is None
+
+
+def test_batch_inference_session() -> None:
+	inference_session = batch_inference_session('tests.test_inference_batcher', create_test_session([ 'batch', 2 ]))
+	input_frames = [ numpy.full((1, 2), index, dtype = numpy.float32) for index in range(8) ]
+
+	with ThreadPoolExecutor(max_workers = 8) as executor:
+		outputs = list(executor.map(lambda input_frame : inference_session.run(None, { 'input': input_frame })[0], input_frames))
+
+	for input_frame, output in zip(input_frames, outputs):
+		assert numpy.array_equal(output, input_frame * 2)
+
+	assert INFERENCE_BATCH_STATISTIC_SET.get('tests.test_inference_batcher').get('request_total') == 8
+	assert INFERENCE_BATCH_STATISTIC_SET.get('tests.test_inference_batcher').get('batch_total') < 8
@@ -0,0 +1,61 @@
+import os
+import tempfile
+
+import numpy
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.inference_binder import create_binding_key, get_inference_binding, resolve_session_memory_options, run_inference_binding
+from .helper import create_test_model
+
+
+@pytest.fixture(scope = 'module')
+def inference_session() -> InferenceSession:
+	model_path = os.path.join(tempfile.gettempdir(), 'double.onnx')
+	create_test_model(model_path, 'double', [ 'batch', 2 ])
+	return InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('session_memory_options', [ 'io_binding' ])
+	state_manager.init_item('execution_batch_size', 1)
+
+
+def test_resolve_session_memory_options() -> None:
+	assert resolve_session_memory_options() == [ 'io_binding' ]
+
+	state_manager.set_item('session_memory_options', [])
+
+	assert resolve_session_memory_options() == []
+
+	state_manager.set_item('session_memory_options', None)
+
+	assert resolve_session_memory_options() == [ 'memory_pattern', 'cpu_arena', 'io_binding' ]
+
+
+def test_create_binding_key() -> None:
+	assert create_binding_key({ 'input': numpy.zeros((1, 2), dtype = numpy.float32) }) == create_binding_key({ 'input': numpy.ones((1, 2), dtype = numpy.float32) })
+	assert create_binding_key({ 'input': numpy.zeros((1, 2), dtype = numpy.float32) }) != create_binding_key({ 'input': numpy.zeros((2, 2), dtype = numpy.float32) })
+
+
+def test_run_inference_binding(inference_session : InferenceSession) -> None:
+	first_outputs = run_inference_binding(inference_session, { 'input': numpy.full((1, 2), 1, dtype = numpy.float32) })
+	second_outputs = run_inference_binding(inference_session, { 'input': numpy.full((1, 2), 2, dtype = numpy.float32) })
+	third_outputs = run_inference_binding(inference_session, { 'input': numpy.full((1, 2), 3, dtype = numpy.float32).T.copy().T })
+
+	assert numpy.array_equal(first_outputs[0], numpy.full((1, 2), 6))
+	assert numpy.array_equal(third_outputs[0], numpy.full((1, 2), 6))
+	assert first_outputs[0] is second_outputs[0]
+	assert second_outputs[0] is third_outputs[0]
+	assert len(get_inference_binding(inference_session).get('output_buffer_set')) == 1
+
+
+def test_run_inference_binding_without_io_binding(inference_session : InferenceSession) -> None:
+	state_manager.init_item('session_memory_options', [])
+	first_outputs = run_inference_binding(inference_session, { 'input': numpy.full((1, 2), 1, dtype = numpy.float32) })
+	second_outputs = run_inference_binding(inference_session, { 'input': numpy.full((1, 2), 1, dtype = numpy.float32) })
+
+	assert numpy.array_equal(first_outputs[0], second_outputs[0])
+	assert first_outputs[0] is not second_outputs[0]
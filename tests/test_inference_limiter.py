@@ -0,0 +1,80 @@
+import threading
+from time import sleep
+from typing import List
+from unittest.mock import patch
+
+from onnxruntime import InferenceSession
+
+from facefusion.inference_limiter import INFERENCE_LIMIT_RECOVERY, create_inference_limit, limit_inference_session, recover_inference_limit, resolve_inference_limit, run_limit_inference_session
+
+
+def test_run_limit_inference_session() -> None:
+	inference_limit = create_inference_limit('static', 2)
+	active_totals : List[int] = []
+
+	def inference_session_run() -> None:
+		active_totals.append(inference_limit.get('active_total'))
+		sleep(0.01)
+
+	threads = [ threading.Thread(target = run_limit_inference_session, args = ('test', inference_limit, inference_session_run)) for _ in range(8) ]
+
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+	assert len(active_totals) == 8
+	assert max(active_totals) == 2
+	assert inference_limit.get('active_total') == 0
+
+
+def test_create_inference_limit() -> None:
+	assert create_inference_limit('static', 4).get('limit_total') == 4
+	assert create_inference_limit('adaptive', 4).get('limit_total') == 1
+	assert create_inference_limit('adaptive', 4).get('limit_max') == 4
+
+
+def test_resolve_inference_limit() -> None:
+	inference_limit = create_inference_limit('adaptive', 4)
+	inference_limit['latency'] = 0.01
+
+	assert resolve_inference_limit(inference_limit, 100, 0.01) == 1
+
+	inference_limit['window_wait_total'] = 4
+
+	assert resolve_inference_limit(inference_limit, 100, 0.01) == 2
+
+	inference_limit['limit_total'] = 2
+	inference_limit['throughput'] = 100
+
+	assert resolve_inference_limit(inference_limit, 150, 0.012) == 3
+	assert resolve_inference_limit(inference_limit, 80, 0.012) == 1
+	assert resolve_inference_limit(inference_limit, 100, 0.03) == 1
+
+	inference_limit['limit_total'] = 4
+
+	assert resolve_inference_limit(inference_limit, 300, 0.012) == 4
+
+
+def test_recover_inference_limit() -> None:
+	inference_limit = create_inference_limit('adaptive', 4)
+	inference_limit['limit_total'] = 3
+	recover_inference_limit(inference_limit, 2)
+
+	assert inference_limit.get('limit_ceiling') == 2
+
+	inference_limit['limit_total'] = 2
+
+	for _ in range(INFERENCE_LIMIT_RECOVERY):
+		recover_inference_limit(inference_limit, 2)
+
+	assert inference_limit.get('limit_ceiling') == 3
+	assert inference_limit.get('limit_max') == 4
+
+
+def test_limit_inference_session() -> None:
+	inference_session = InferenceSession.__new__(InferenceSession)
+	inference_session_run = inference_session.run
+
+	with patch('facefusion.state_manager.get_item', side_effect = { 'session_concurrency_mode': 'static', 'session_concurrency_limit': 0 }.get):
+		assert limit_inference_session('test', inference_session).run == inference_session_run
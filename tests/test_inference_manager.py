@@ -1,16 +1,24 @@
+import os
+import tempfile
 from unittest.mock import patch
 
+import numpy
 import pytest
-from onnxruntime import InferenceSession
+from onnxruntime import ExecutionMode, GraphOptimizationLevel, InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.inference_manager import INFERENCE_POOL_SET, get_inference_pool
+from facefusion.filesystem import resolve_relative_path
+from facefusion.inference_manager import INFERENCE_LOAD_SET, INFERENCE_POOL_SET, INFERENCE_RESIDENCY_SET, create_session_options, get_cache_model_path, get_inference_context_lock, get_inference_pool, get_inference_residency_size, release_inference_pools
+from facefusion.types import DownloadSet
+from .helper import create_test_model
 
 
 @pytest.fixture(scope = 'module', autouse = True)
 def before_all() -> None:
 	state_manager.init_item('execution_device_ids', [ '0' ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_replica_count', 1)
+	state_manager.init_item('inference_memory_limit', 0)
 	state_manager.init_item('download_providers', [ 'github' ])
 	content_analyser.pre_check()
 
@@ -30,3 +38,122 @@ def test_get_inference_pool() -> None:
 		assert isinstance(INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1'), InferenceSession)
 
 	assert INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1') == INFERENCE_POOL_SET.get('ui').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1')
+
+
+def test_get_inference_pool_replicas() -> None:
+	model_path = os.path.join(tempfile.gettempdir(), 'identity.onnx')
+	model_source_set : DownloadSet =\
+	{
+		'identity':
+		{
+			'url': 'https://example.com/identity.onnx',
+			'path': model_path
+		}
+	}
+	create_test_model(model_path, 'identity', [ 1 ])
+	state_manager.set_item('execution_replica_count', 2)
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'):
+		for _ in range(4):
+			get_inference_pool('tests.test_inference_manager', [ 'identity' ], model_source_set).get('identity').run(None, { 'input': numpy.ones(1, dtype = numpy.float32) })
+
+	assert INFERENCE_LOAD_SET.get('tests.test_inference_manager.identity.0.cpu').get('request_total') == 2
+	assert INFERENCE_LOAD_SET.get('tests.test_inference_manager.identity.0.cpu#1').get('request_total') == 2
+	assert INFERENCE_LOAD_SET.get('tests.test_inference_manager.identity.0.cpu#1').get('active_total') == 0
+
+	state_manager.set_item('execution_replica_count', 1)
+
+
+def test_get_inference_pool_residency() -> None:
+	model_path = os.path.join(tempfile.gettempdir(), 'identity.onnx')
+	model_source_set : DownloadSet =\
+	{
+		'identity':
+		{
+			'url': 'https://example.com/identity.onnx',
+			'path': model_path
+		}
+	}
+	create_test_model(model_path, 'identity', [ 1 ])
+	state_manager.set_item('inference_memory_limit', 1024)
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'), patch('facefusion.inference_manager.calculate_inference_size', return_value = 384 * 1024 ** 2):
+		get_inference_pool('tests.test_inference_manager', [ 'first' ], model_source_set)
+		get_inference_pool('tests.test_inference_manager', [ 'second' ], model_source_set)
+		get_inference_pool('tests.test_inference_manager', [ 'first' ], model_source_set)
+		get_inference_pool('tests.test_inference_manager', [ 'third' ], model_source_set)
+
+	assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.first.0.cpu')
+	assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.second.0.cpu') is None
+	assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.third.0.cpu')
+	assert list(INFERENCE_RESIDENCY_SET.keys())[-2:] == [ 'tests.test_inference_manager.first.0.cpu', 'tests.test_inference_manager.third.0.cpu' ]
+	assert get_inference_residency_size() <= 1024 ** 3
+
+	state_manager.set_item('inference_memory_limit', 0)
+
+
+def test_get_inference_pool_residency_locked() -> None:
+	model_path = os.path.join(tempfile.gettempdir(), 'identity.onnx')
+	model_source_set : DownloadSet =\
+	{
+		'identity':
+		{
+			'url': 'https://example.com/identity.onnx',
+			'path': model_path
+		}
+	}
+	state_manager.set_item('inference_memory_limit', 512)
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'), patch('facefusion.inference_manager.calculate_inference_size', return_value = 384 * 1024 ** 2):
+		get_inference_pool('tests.test_inference_manager', [ 'fourth' ], model_source_set)
+
+		with get_inference_context_lock('tests.test_inference_manager.fourth.0.cpu'):
+			assert get_inference_pool('tests.test_inference_manager', [ 'fifth' ], model_source_set).get('identity')
+			assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.fourth.0.cpu')
+
+		assert get_inference_pool('tests.test_inference_manager', [ 'sixth' ], model_source_set).get('identity')
+		assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.fourth.0.cpu') is None
+
+	state_manager.set_item('inference_memory_limit', 0)
+
+
+def test_release_inference_pools() -> None:
+	model_path = os.path.join(tempfile.gettempdir(), 'identity.onnx')
+	model_source_set : DownloadSet =\
+	{
+		'identity':
+		{
+			'url': 'https://example.com/identity.onnx',
+			'path': model_path
+		}
+	}
+	state_manager.set_item('inference_memory_limit', 512)
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'), patch('facefusion.inference_manager.calculate_inference_size', return_value = 384 * 1024 ** 2):
+		get_inference_pool('tests.test_inference_manager', [ 'seventh' ], model_source_set)
+		release_inference_pools()
+
+		assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.seventh.0.cpu')
+
+		state_manager.set_item('inference_memory_limit', 0)
+		release_inference_pools()
+
+	assert INFERENCE_POOL_SET.get('cli').get('tests.test_inference_manager.seventh.0.cpu') is None
+	assert get_inference_residency_size() == 0
+
+
+def test_create_session_options() -> None:
+	state_manager.init_item('session_intra_op_thread_count', 2)
+	state_manager.init_item('session_inter_op_thread_count', 0)
+	state_manager.init_item('session_execution_mode', 'parallel')
+	state_manager.init_item('session_graph_optimization', 'basic')
+	state_manager.init_item('session_memory_options', [ 'cpu_arena' ])
+	session_options = create_session_options('identity')
+
+	assert session_options.intra_op_num_threads == 2
+	assert session_options.inter_op_num_threads == 0
+	assert session_options.execution_mode == ExecutionMode.ORT_PARALLEL
+	assert session_options.graph_optimization_level == GraphOptimizationLevel.ORT_ENABLE_BASIC
+	assert session_options.enable_mem_pattern is False
+	assert session_options.enable_cpu_mem_arena is True
+	assert get_cache_model_path('identity', [ 'cuda', 'cpu' ], session_options) == os.path.join(resolve_relative_path('../.caches'), 'identity.cuda.cpu.basic.onnx')
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import threading
+
+import numpy
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.inference_profiler import INFERENCE_PROFILE_SET, pop_inference_wait, profile_inference_session, profile_semaphore, report_inference_profiles
+from facefusion.json import read_json
+from .helper import create_test_model
+
+
+@pytest.fixture(scope = 'module')
+def inference_session() -> InferenceSession:
+	model_path = os.path.join(tempfile.gettempdir(), 'double.onnx')
+	create_test_model(model_path, 'double', [ 1, 2 ])
+	return profile_inference_session('double', InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ]))
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('inference_profile_path', os.path.join(tempfile.gettempdir(), 'inference_profile.json'))
+	INFERENCE_PROFILE_SET.clear()
+	pop_inference_wait()
+
+
+def test_profile_semaphore() -> None:
+	with profile_semaphore(threading.Semaphore()):
+		pass
+
+	assert pop_inference_wait() > 0
+	assert pop_inference_wait() == 0
+
+
+def test_profile_inference_session(inference_session : InferenceSession) -> None:
+	for _ in range(4):
+		with profile_semaphore(threading.Semaphore()):
+			inference_session.run(None, { 'input': numpy.ones((1, 2), dtype = numpy.float32) })
+
+	assert len(INFERENCE_PROFILE_SET.get('double').get('run_times')) == 4
+	assert all(wait_time > 0 for wait_time in INFERENCE_PROFILE_SET.get('double').get('wait_times'))
+
+
+def test_report_inference_profiles(inference_session : InferenceSession) -> None:
+	inference_session.run(None, { 'input': numpy.ones((1, 2), dtype = numpy.float32) })
+	report_inference_profiles()
+	inference_profile = read_json(state_manager.get_item('inference_profile_path'))
+
+	assert inference_profile.get('double').get('call_total') == 1
+	assert inference_profile.get('double').get('run_p50') <= inference_profile.get('double').get('run_p99')
+	assert INFERENCE_PROFILE_SET == {}
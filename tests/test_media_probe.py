@@ -0,0 +1,52 @@
+import os
+import tempfile
+
+import cv2
+import numpy
+import pytest
+
+from facefusion.image_store import clear_static_images, get_image_store_totals
+from facefusion.media_probe import clear_media_probes, get_media_probe, get_media_probe_totals
+from facefusion.vision import count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, read_static_image
+
+
+@pytest.fixture(scope = 'module')
+def video_path() -> str:
+	video_path = os.path.join(tempfile.gettempdir(), 'media-probe.avi')
+	video_writer = cv2.VideoWriter(video_path, cv2.VideoWriter.fourcc(*'MJPG'), 25, (64, 48))
+
+	for _ in range(50):
+		video_writer.write(numpy.zeros((48, 64, 3), dtype = numpy.uint8))
+	video_writer.release()
+	return video_path
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	clear_media_probes()
+	clear_static_images()
+
+
+def test_probe_video(video_path : str) -> None:
+	assert detect_video_resolution(video_path) == (64, 48)
+	assert detect_video_fps(video_path) == 25
+	assert count_video_frame_total(video_path) == 50
+	assert detect_video_duration(video_path) == 2
+	assert get_media_probe_totals() == (4, 1)
+
+
+def test_probe_image() -> None:
+	image_path = os.path.join(tempfile.gettempdir(), 'media-probe.png')
+	cv2.imwrite(image_path, numpy.zeros((32, 96, 3), dtype = numpy.uint8))
+
+	assert detect_image_resolution(image_path) == (96, 32)
+	assert detect_image_resolution(image_path) == (96, 32)
+	assert get_media_probe_totals() == (1, 1)
+	assert read_static_image(image_path).shape == (32, 96, 3)
+	assert get_image_store_totals() == (1, 1)
+
+	cv2.imwrite(image_path, numpy.zeros((16, 48, 3), dtype = numpy.uint8))
+
+	assert get_media_probe(image_path) is None
+	assert detect_image_resolution(image_path) == (48, 16)
+	assert detect_image_resolution('invalid.png') is None
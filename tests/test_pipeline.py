@@ -0,0 +1,33 @@
+import pytest
+
+from facefusion import process_manager
+from facefusion.pipeline import run_stages
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	process_manager.start()
+
+
+def test_run_stages() -> None:
+	stage_items = run_stages(range(100), [ lambda stage_item : stage_item * 2, lambda stage_item : stage_item + 1 ], [ 2, 4 ], 4)
+
+	assert sorted(stage_items) == [ stage_item * 2 + 1 for stage_item in range(100) ]
+	assert list(run_stages(range(100), [], [], 4)) == list(range(100))
+
+
+def test_run_stages_with_stop() -> None:
+	stage_items = []
+
+	for stage_item in run_stages(range(100), [ lambda stage_item : stage_item ], [ 1 ], 4):
+		stage_items.append(stage_item)
+		process_manager.stop()
+
+	assert len(stage_items) < 100
+
+	process_manager.end()
+
+
+def test_run_stages_with_error() -> None:
+	with pytest.raises(ZeroDivisionError):
+		list(run_stages(range(100), [ lambda stage_item : 1 / (stage_item - 50) ], [ 2 ], 4))
@@ -0,0 +1,30 @@
+from typing import Iterator
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.process_pool import clear_process_pool, create_process_pool, process_vision_frame
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> Iterator[None]:
+	state_manager.init_item('processors', [])
+	state_manager.init_item('log_level', 'error')
+	create_process_pool(
+	{
+		'reference_vision_frame': numpy.zeros((240, 426, 3), numpy.uint8),
+		'source_vision_frames': [],
+		'source_face': None,
+		'source_audio_path': None,
+		'temp_video_fps': 25.0
+	}, 2)
+	yield
+	clear_process_pool()
+
+
+def test_process_vision_frame() -> None:
+	target_vision_frame = numpy.random.randint(0, 255, (240, 426, 3), numpy.uint8)
+
+	assert numpy.array_equal(process_vision_frame(target_vision_frame, 0), target_vision_frame)
+	assert process_vision_frame(target_vision_frame[:120], 1).shape == (120, 426, 3)
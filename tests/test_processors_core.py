@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+from facefusion.processors.core import get_processors_modules, has_face_processors, select_source_face
+
+
+def test_has_face_processors() -> None:
+	assert has_face_processors(get_processors_modules([ 'face_swapper' ])) is True
+	assert has_face_processors(get_processors_modules([ 'frame_enhancer', 'face_debugger' ])) is True
+	assert has_face_processors(get_processors_modules([ 'frame_colorizer', 'frame_enhancer' ])) is False
+
+
+def test_get_frame_inputs() -> None:
+	processors = [ 'age_modifier', 'deep_swapper', 'expression_restorer', 'face_debugger', 'face_editor', 'face_enhancer', 'face_swapper', 'frame_colorizer', 'frame_enhancer', 'lip_syncer' ]
+
+	for processor_module in get_processors_modules(processors):
+		processor_inputs = processor_module.process_frame.__annotations__.get('inputs').__annotations__.keys() - { 'target_vision_frame', 'temp_vision_frame' }
+
+		assert set(processor_module.get_frame_inputs()) == processor_inputs
+
+
+def test_select_source_face() -> None:
+	with patch('facefusion.processors.core.extract_source_face', return_value = 'face') as extract_source_face:
+		assert select_source_face(get_processors_modules([ 'frame_colorizer', 'face_enhancer' ]), []) is None
+		assert extract_source_face.call_count == 0
+		assert select_source_face(get_processors_modules([ 'face_swapper' ]), []) == 'face'
@@ -0,0 +1,73 @@
+import os
+import tempfile
+from typing import List
+
+import numpy
+import onnx
+import pytest
+
+from facefusion import state_manager
+from facefusion.model_helper import resolve_quantize_model_path
+from facefusion.quantizer import calculate_cosine_distance, calculate_model_drift, calculate_psnr, collect_quantize_processors, quantize_model
+from facefusion.types import InferenceFeed
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('execution_device_ids', [ '0' ])
+	state_manager.init_item('session_intra_op_thread_count', 0)
+	state_manager.init_item('session_inter_op_thread_count', 0)
+	state_manager.init_item('session_execution_mode', 'sequential')
+	state_manager.init_item('session_graph_optimization', 'all')
+	state_manager.init_item('session_memory_options', [])
+	state_manager.init_item('session_model_precision', 'fp32')
+
+
+@pytest.fixture(scope = 'module')
+def model_path() -> str:
+	model_path = os.path.join(tempfile.gettempdir(), 'linear.onnx')
+	model_weight = onnx.numpy_helper.from_array(numpy.random.default_rng(0).standard_normal((64, 64)).astype(numpy.float32), 'weight')
+	model_graph = onnx.helper.make_graph([ onnx.helper.make_node('MatMul', [ 'input', 'weight' ], [ 'output' ]) ], 'linear', [ onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 1, 64 ]) ], [ onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ 1, 64 ]) ], [ model_weight ])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 8, opset_imports = [ onnx.helper.make_opsetid('', 13) ]), model_path)
+	return model_path
+
+
+@pytest.fixture(scope = 'module')
+def inference_feeds() -> List[InferenceFeed]:
+	return [ { 'input': numpy.random.default_rng(index).standard_normal((1, 64)).astype(numpy.float32) } for index in range(8) ]
+
+
+def test_resolve_quantize_model_path() -> None:
+	assert resolve_quantize_model_path('.assets/models/arcface_w600k_r50.onnx') == '.assets/models/arcface_w600k_r50_int8.onnx'
+
+
+def test_collect_quantize_processors() -> None:
+	state_manager.init_item('processors', [ 'face_swapper' ])
+
+	assert collect_quantize_processors([ 'face_recognizer', 'face_enhancer', 'face_swapper' ]) == [ 'face_swapper', 'face_enhancer' ]
+
+
+@pytest.mark.parametrize('quantize_mode', [ 'dynamic', 'static' ])
+def test_quantize_model(model_path : str, inference_feeds : List[InferenceFeed], quantize_mode : str) -> None:
+	state_manager.init_item('quantize_mode', quantize_mode)
+	quantize_model_path = quantize_model(model_path, inference_feeds)
+	drift_metric, drift_value = calculate_model_drift(model_path, quantize_model_path, inference_feeds)
+
+	assert quantize_model_path == resolve_quantize_model_path(model_path)
+	assert os.path.getsize(quantize_model_path) < os.path.getsize(model_path)
+	assert drift_metric == 'cosine distance'
+	assert 0 <= drift_value < 0.01
+
+
+def test_calculate_psnr() -> None:
+	output = numpy.linspace(0, 1, 48, dtype = numpy.float32).reshape(1, 3, 4, 4)
+
+	assert calculate_psnr(output, output) == 100.0
+	assert 30 < calculate_psnr(output, output + 0.01) < 50
+
+
+def test_calculate_cosine_distance() -> None:
+	output = numpy.ones(4, dtype = numpy.float32)
+
+	assert calculate_cosine_distance(output, output) == pytest.approx(0)
+	assert calculate_cosine_distance(output, -output) == pytest.approx(2)
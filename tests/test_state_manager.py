@@ -22,14 +22,14 @@ def before_each() -> None:
 
 
 def test_init_item() -> None:
-	init_item('video_memory_strategy', 'tolerant')
+	init_item('inference_memory_limit', 1024)
 
-	assert get_state('cli').get('video_memory_strategy') == 'tolerant'
-	assert get_state('ui').get('video_memory_strategy') == 'tolerant'
+	assert get_state('cli').get('inference_memory_limit') == 1024
+	assert get_state('ui').get('inference_memory_limit') == 1024
 
 
 def test_get_item_and_set_item() -> None:
-	set_item('video_memory_strategy', 'tolerant')
+	set_item('inference_memory_limit', 1024)
 
-	assert get_item('video_memory_strategy') == 'tolerant'
-	assert get_state('ui').get('video_memory_strategy') is None
+	assert get_item('inference_memory_limit') == 1024
+	assert get_state('ui').get('inference_memory_limit') is None
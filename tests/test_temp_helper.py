@@ -1,11 +1,12 @@
 import os.path
 import tempfile
+from time import time
 
 import pytest
 
 from facefusion import state_manager
 from facefusion.download import conditional_download
-from facefusion.temp_helper import get_temp_directory_path, get_temp_file_path, get_temp_frames_pattern
+from facefusion.temp_helper import TEMP_JOURNAL_LIFETIME, append_temp_journal, clear_stale_temp_directories, clear_temp_directory, create_temp_directory, create_temp_journal, get_temp_directory_path, get_temp_file_path, get_temp_frame_staging_path, get_temp_frames_pattern, get_temp_journal_path, get_temp_segment_file_path, get_temp_segment_frames_pattern, read_temp_journal
 from .helper import get_test_example_file, get_test_examples_directory
 
 
@@ -32,3 +33,47 @@ def test_get_temp_directory_path() -> None:
 def test_get_temp_frames_pattern() -> None:
 	temp_directory = tempfile.gettempdir()
 	assert get_temp_frames_pattern(get_test_example_file('target-240p.mp4'), '%04d') == os.path.join(temp_directory, 'facefusion', 'target-240p', '%04d.png')
+
+
+def test_get_temp_frame_staging_path() -> None:
+	temp_directory = tempfile.gettempdir()
+	assert get_temp_frame_staging_path(os.path.join(temp_directory, 'facefusion', 'target-240p', '00000001.png')) == os.path.join(temp_directory, 'facefusion', 'target-240p', '.00000001.png')
+
+
+def test_get_temp_segment_file_path() -> None:
+	temp_directory = tempfile.gettempdir()
+	assert get_temp_segment_file_path(get_test_example_file('target-240p.mp4'), 1) == os.path.join(temp_directory, 'facefusion', 'target-240p', 'segment-0001.mp4')
+
+
+def test_get_temp_segment_frames_pattern() -> None:
+	temp_directory = tempfile.gettempdir()
+	assert get_temp_segment_frames_pattern(get_test_example_file('target-240p.mp4'), 1, '%04d') == os.path.join(temp_directory, 'facefusion', 'target-240p', 'segment-0001', '%04d.png')
+
+
+def test_temp_journal() -> None:
+	target_path = get_test_example_file('target-240p.mp4')
+	create_temp_directory(target_path)
+
+	assert read_temp_journal(target_path, 'signature') is None
+	assert append_temp_journal(target_path, 0) is False
+	assert create_temp_journal(target_path, 'signature') is True
+	assert append_temp_journal(target_path, 0) is True
+	assert append_temp_journal(target_path, 2) is True
+	assert read_temp_journal(target_path, 'signature') == { 0, 2 }
+	assert read_temp_journal(target_path, 'invalid') is None
+
+	clear_temp_directory(target_path)
+
+
+def test_clear_stale_temp_directories() -> None:
+	target_path = get_test_example_file('target-240p.mp4')
+	create_temp_directory(target_path)
+	create_temp_journal(target_path, 'signature')
+	clear_stale_temp_directories()
+
+	assert os.path.isdir(get_temp_directory_path(target_path))
+
+	os.utime(get_temp_journal_path(target_path), (time() - TEMP_JOURNAL_LIFETIME - 1, time() - TEMP_JOURNAL_LIFETIME - 1))
+	clear_stale_temp_directories()
+
+	assert not os.path.isdir(get_temp_directory_path(target_path))
@@ -0,0 +1,45 @@
+import numpy
+
+from facefusion.tensor_helper import letterbox_frame, normalize_tensor_frame, prepare_tensor_frame, transpose_tensor_frame
+
+
+def test_letterbox_frame() -> None:
+	vision_frame = numpy.full((24, 32, 3), 255, dtype = numpy.uint8)
+	letterbox_vision_frame = letterbox_frame(vision_frame, (64, 48))
+
+	assert letterbox_vision_frame.shape == (48, 64, 3)
+	assert letterbox_vision_frame.dtype == numpy.uint8
+	assert letterbox_vision_frame[:24, :32].min() == 255
+	assert letterbox_vision_frame[24:].max() == 0
+	assert letterbox_vision_frame[:, 32:].max() == 0
+
+
+def test_transpose_tensor_frame() -> None:
+	vision_frame = numpy.arange(24, dtype = numpy.uint8).reshape(2, 4, 3)
+	tensor_frame = transpose_tensor_frame(vision_frame)
+
+	assert tensor_frame.shape == (1, 3, 2, 4)
+	assert tensor_frame.dtype == numpy.float32
+	assert tensor_frame.flags.c_contiguous
+	assert numpy.array_equal(tensor_frame[0, 2], vision_frame[:, :, 2])
+
+
+def test_prepare_tensor_frame() -> None:
+	vision_frame = numpy.random.default_rng(0).integers(0, 256, (16, 8, 3), dtype = numpy.uint8)
+	tensor_frame = prepare_tensor_frame(vision_frame, [ 0.5, 0.4, 0.3 ], [ 0.2, 0.3, 0.4 ])
+	expect_tensor_frame = (vision_frame[:, :, ::-1] / 255.0 - [ 0.5, 0.4, 0.3 ]) / [ 0.2, 0.3, 0.4 ]
+
+	assert tensor_frame.shape == (1, 3, 16, 8)
+	assert tensor_frame.dtype == numpy.float32
+	assert numpy.allclose(tensor_frame[0], expect_tensor_frame.transpose(2, 0, 1), atol = 1e-5)
+
+
+def test_normalize_tensor_frame() -> None:
+	vision_frame = numpy.random.default_rng(0).integers(0, 256, (16, 8, 3), dtype = numpy.uint8)
+	tensor_frame = prepare_tensor_frame(vision_frame, [ 0.5, 0.5, 0.5 ], [ 0.5, 0.5, 0.5 ])
+	normalize_vision_frame = normalize_tensor_frame(tensor_frame[0], [ 0.5, 0.5, 0.5 ], [ 0.5, 0.5, 0.5 ])
+
+	assert normalize_vision_frame.dtype == numpy.uint8
+	assert normalize_vision_frame.flags.c_contiguous
+	assert numpy.abs(normalize_vision_frame.astype(int) - vision_frame).max() <= 1
+	assert normalize_tensor_frame(numpy.full((3, 2, 2), 2, dtype = numpy.float32), [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ]).min() == 255
@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+import cv2
+import numpy
+import pytest
+
+from facefusion import video_manager
+from facefusion.vision import read_video_frame
+
+
+@pytest.fixture(scope = 'module')
+def video_path() -> str:
+	video_path = os.path.join(tempfile.gettempdir(), 'video-manager.avi')
+	video_writer = cv2.VideoWriter(video_path, cv2.VideoWriter.fourcc(*'MJPG'), 25, (64, 48))
+
+	for frame_index in range(40):
+		video_writer.write(numpy.full((48, 64, 3), frame_index * 5, dtype = numpy.uint8))
+	video_writer.release()
+	return video_path
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	video_manager.clear_video_pool()
+
+
+def test_read_video_reader_frame(video_path : str) -> None:
+	for frame_index in [ 0, 1, 2, 20, 5, 39 ]:
+		vision_frame = video_manager.read_video_reader_frame(video_path, frame_index)
+
+		assert abs(int(vision_frame.mean()) - frame_index * 5) <= 2
+
+	assert video_manager.read_video_reader_frame(video_path, 40) is None
+	assert video_manager.get_video_reader(video_path).get('frame_index') == -1
+	assert video_manager.read_video_reader_frame(video_path, 10).mean() == pytest.approx(50, abs = 2)
+
+
+def test_read_video_reader_frame_sequential(video_path : str) -> None:
+	video_manager.read_video_reader_frame(video_path, 0)
+	video_reader = video_manager.get_video_reader(video_path)
+
+	assert video_reader.get('frame_index') == 1
+
+	video_manager.read_video_reader_frame(video_path, 30)
+
+	assert video_reader.get('frame_index') == 31
+
+
+def test_get_video_frame(video_path : str) -> None:
+	vision_frame = video_manager.read_video_reader_frame(video_path, 3)
+	vision_frame.fill(0)
+
+	assert numpy.array_equal(video_manager.get_video_frame(video_path, 3), video_manager.read_video_reader_frame(video_path, 3))
+	assert video_manager.get_video_frame(video_path, 3).mean() > 0
+
+	for frame_index in range(video_manager.VIDEO_FRAME_LIMIT):
+		video_manager.read_video_reader_frame(video_path, 10 + frame_index)
+
+	assert video_manager.get_video_frame(video_path, 3) is None
+
+
+def test_read_video_frame(video_path : str) -> None:
+	assert read_video_frame(video_path, 11).mean() == pytest.approx(50, abs = 2)
+	assert read_video_frame(video_path, 0).mean() == pytest.approx(0, abs = 2)
+	assert read_video_frame('invalid') is None
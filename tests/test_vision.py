@@ -1,9 +1,11 @@
 import subprocess
 
+import cv2
+import numpy
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, unpack_resolution, write_image
+from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, create_image_params, detect_frame_resolution, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, has_image_codec, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, resize_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, split_video_segments, unpack_resolution, write_image
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -44,6 +46,20 @@ def test_write_image() -> None:
 
 	assert write_image(get_test_output_file('target-240p.jpg'), vision_frame) is True
 	assert write_image(get_test_output_file('目标-240p.webp'), vision_frame) is True
+	assert write_image(get_test_output_file('target-240p-quality.jpg'), vision_frame, 50) is True
+
+
+def test_create_image_params() -> None:
+	assert create_image_params('target.jpg', 50) == [ cv2.IMWRITE_JPEG_QUALITY, 50 ]
+	assert create_image_params('target.webp', 0) == [ cv2.IMWRITE_WEBP_QUALITY, 1 ]
+	assert create_image_params('target.png', 50) == []
+	assert create_image_params('target.jpg', None) == []
+
+
+def test_has_image_codec() -> None:
+	assert has_image_codec(get_test_example_file('target-240p.jpg'), get_test_output_file('target-240p.png')) is True
+	assert has_image_codec(get_test_example_file('target-240p.mp4'), get_test_output_file('target-240p.png')) is False
+	assert has_image_codec('invalid', get_test_output_file('target-240p.png')) is False
 
 
 def test_detect_image_resolution() -> None:
@@ -117,6 +133,13 @@ def test_restrict_trim_frame() -> None:
 	assert restrict_trim_frame(get_test_example_file('target-240p.mp4'), None, None) == (0, 270)
 
 
+def test_split_video_segments() -> None:
+	assert split_video_segments([ 0, 100, 200 ], 0, 270, 1) == [ { 'keyframe_number': 0, 'frame_start': 0, 'frame_end': 270 } ]
+	assert split_video_segments([ 0, 100, 200 ], 0, 270, 3) == [ { 'keyframe_number': 0, 'frame_start': 0, 'frame_end': 100 }, { 'keyframe_number': 100, 'frame_start': 100, 'frame_end': 200 }, { 'keyframe_number': 200, 'frame_start': 200, 'frame_end': 270 } ]
+	assert split_video_segments([ 0, 100, 200 ], 150, 270, 4) == [ { 'keyframe_number': 100, 'frame_start': 150, 'frame_end': 200 }, { 'keyframe_number': 200, 'frame_start': 200, 'frame_end': 270 } ]
+	assert split_video_segments([], 0, 270, 4) == [ { 'keyframe_number': 0, 'frame_start': 0, 'frame_end': 270 } ]
+
+
 def test_detect_video_resolution() -> None:
 	assert detect_video_resolution(get_test_example_file('target-240p.mp4')) == (426, 226)
 	assert detect_video_resolution(get_test_example_file('target-240p-90deg.mp4')) == (226, 426)
@@ -153,6 +176,18 @@ def test_unpack_resolution() -> None:
 	assert unpack_resolution('2x2') == (2, 2)
 
 
+def test_detect_frame_resolution() -> None:
+	assert detect_frame_resolution(numpy.zeros((226, 426, 3), dtype = numpy.uint8)) == (426, 226)
+
+
+def test_resize_frame() -> None:
+	vision_frame = numpy.zeros((226, 426, 3), dtype = numpy.uint8)
+
+	assert resize_frame(vision_frame, (426, 226)) is vision_frame
+	assert resize_frame(vision_frame, (212, 112)).shape == (112, 212, 3)
+	assert resize_frame(vision_frame, (852, 452)).shape == (452, 852, 3)
+
+
 def test_calc_histogram_difference() -> None:
 	source_vision_frame = read_image(get_test_example_file('target-240p.jpg'))
 	target_vision_frame = read_image(get_test_example_file('target-240p-0sat.jpg'))
@@ -0,0 +1,64 @@
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import onnx
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion import inference_manager, warm_up
+from facefusion.types import InferencePool
+from .helper import create_test_model
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	create_test_model(os.path.join(tempfile.gettempdir(), 'warm-up.onnx'), 'identity', [ 'batch', 3 ])
+	create_test_model(os.path.join(tempfile.gettempdir(), 'warm-up-string.onnx'), 'identity', [ 1 ], onnx.TensorProto.STRING)
+
+
+def test_warm_up_inference_session() -> None:
+	assert warm_up.warm_up_inference_session(InferenceSession(os.path.join(tempfile.gettempdir(), 'warm-up.onnx'), providers = [ 'CPUExecutionProvider' ])) is True
+	assert warm_up.warm_up_inference_session(InferenceSession(os.path.join(tempfile.gettempdir(), 'warm-up-string.onnx'), providers = [ 'CPUExecutionProvider' ])) is False
+
+	inference_session = inference_manager.track_inference_session('warm-up', InferenceSession(os.path.join(tempfile.gettempdir(), 'warm-up.onnx'), providers = [ 'CPUExecutionProvider' ]))
+
+	assert warm_up.warm_up_inference_session(inference_session) is True
+	assert inference_manager.get_inference_load('warm-up').get('request_total') == 0
+
+
+def test_warm_up_module() -> None:
+	inference_session = InferenceSession(os.path.join(tempfile.gettempdir(), 'warm-up.onnx'), providers = [ 'CPUExecutionProvider' ])
+	inference_manager.INFERENCE_POOL_SET['cli']['warm-up.identity.0.cpu'] = { 'identity': inference_session }
+	inference_manager.INFERENCE_POOL_SET['cli']['warm-up.identity.0.cpu#1'] = { 'identity': inference_session }
+	module = SimpleNamespace(__name__ = 'warm-up', get_inference_pool = lambda: inference_session)
+
+	with patch('facefusion.warm_up.warm_up_inference_session', return_value = True) as warm_up_inference_session:
+		warm_up.warm_up_module(module) #type:ignore[arg-type]
+
+	assert warm_up_inference_session.call_count == 2
+
+	inference_manager.INFERENCE_POOL_SET['cli'].clear()
+
+
+def test_start_warm_up() -> None:
+	module_names = []
+
+	def get_inference_pool() -> InferencePool:
+		module_names.append('module')
+		return {}
+
+	def get_failed_inference_pool() -> InferencePool:
+		raise RuntimeError
+
+	module = SimpleNamespace(__name__ = 'module', get_inference_pool = get_inference_pool)
+	failed_module = SimpleNamespace(__name__ = 'failed_module', get_inference_pool = get_failed_inference_pool)
+
+	with patch('facefusion.warm_up.logger.warn') as logger_warn:
+		warm_up.start_warm_up([ module, failed_module, module ]) #type:ignore[list-item]
+		warm_up.clear_warm_up()
+
+	assert module_names == [ 'module', 'module' ]
+	assert logger_warn.call_count == 1
+	assert warm_up.WARM_UP_POOL is None